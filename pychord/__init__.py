@@ -1,21 +1,79 @@
+import os
+
+from pychord import catalog, interval, keyindex, mode, ratio, tuning
+from pychord.batch import *
+from pychord.cache import *
+from pychord.catalog import Catalog, CatalogEntry, interval_vector, normal_form, prime_form
+from pychord.chord import *
 from pychord.const import *
-from pychord.interval import *
-from pychord.mode import *
+from pychord.interval import Interval, mask_intervals
+from pychord.keyindex import KeyIndex
+from pychord.lazy import lazy_constants
+from pychord.midi import *
+from pychord.mode import Mode
 from pychord.note import *
-from pychord.ratio import *
+from pychord.parse import *
+from pychord.pitchclass import *
+from pychord.ratio import Cents, Ratio
+from pychord.scale import Scale
 from pychord.tone import *
+from pychord.tuning import Tuning
+
+# Constant intervals, modes and tables are only created when first used
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        name: (lambda module, name: lambda: getattr(module, name))(module, name)
+        for module in (catalog, interval, keyindex, mode, ratio, tuning)
+        for name in module.__all__
+        if name.isupper()
+    },
+)
 
 __all__ = [
     # Classes
     "Tone",
     "Ratio",
+    "Cents",
     "Interval",
     "Note",
     "Mode",
     "Scale",
+    "Chord",
+    "InternCache",
+    "ParseResult",
+    "KeyIndex",
+    "Tuning",
+    "MidiFile",
+    "NoteEvent",
+    "Analysis",
+    "Catalog",
+    "CatalogEntry",
+    # Functions
+    "parse_notes",
+    "parse_intervals",
+    "parse_chord",
+    "recognize_chord",
+    "pitch_class_mask",
+    "rotate_mask",
+    "mask_pitch_classes",
+    "mask_intervals",
+    "normal_form",
+    "prime_form",
+    "interval_vector",
+    "read_midi",
+    "write_midi",
+    "notes_to_midi",
+    "midi_to_notes",
+    "analyze",
+    "analyze_batch",
+    "analyze_corpus",
+    "merge_analyses",
     # Constants
     "OCTAVE_RATIO",
     "SEMITONE_RATIO",
+    "OCTAVE_CENTS",
+    "SEMITONE_CENTS",
     "C0_FREQUENCY",
     "SEMITONE",
     "MINOR_SECOND",
@@ -40,4 +98,12 @@ __all__ = [
     "MIXOLYDIAN",
     "AEOLIAN",
     "LOCRIAN",
+    "KEY_INDEX",
+    "EQUAL_TEMPERAMENT",
+    "CATALOG",
 ]
+
+if os.environ.get(PROFILE_ENVIRONMENT_VARIABLE):
+    from pychord.profiling import enable_from_environment
+
+    enable_from_environment()
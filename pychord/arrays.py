@@ -0,0 +1,315 @@
+"""
+Array backed containers for working on large sequences of notes and intervals at once, requires numpy
+"""
+
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from pychord.const import *
+from pychord.interval import Interval
+from pychord.note import Note
+from pychord.parse import parse_intervals
+from pychord.scale import Scale
+from pychord.tuning import Tuning
+
+ARRAY_DEFAULT_DTYPE = np.int32
+"Default integer type used to store semitones"
+
+_PITCH_CLASS_FREQUENCIES = np.array(NOTE_PITCH_CLASS_FREQUENCIES, dtype=np.float64)
+
+_PITCH_CLASS_RATIOS = np.array(INTERVAL_PITCH_CLASS_RATIOS, dtype=np.float64)
+
+_PITCH_CLASS_QUALITIES = np.array([INTERVAL_VALUE_TO_COMPONENTS[i][0] for i in range(SEMITONES_PER_OCTAVE)])
+
+_PITCH_CLASS_QUANTITIES = np.array([INTERVAL_VALUE_TO_COMPONENTS[i][1] for i in range(SEMITONES_PER_OCTAVE)])
+
+
+def _semitone_array(values, attribute: str, value_type: type, dtype) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        if not np.issubdtype(values.dtype, np.integer):
+            raise TypeError()
+        return values.astype(dtype)
+
+    if isinstance(values, Iterable):
+        return np.array(
+            [getattr(value, attribute) if isinstance(value, value_type) else value for value in values], dtype=dtype
+        )
+
+    raise TypeError()
+
+
+class IntervalArray:
+    """
+    A sequence of `Interval`s stored as an integer array of semitones
+    """
+
+    semitones: np.ndarray
+    "Integer number of 12TET semitones of each `Interval`"
+
+    def __init__(self, intervals: Union[Iterable[Union[Interval, int]], np.ndarray], dtype=ARRAY_DEFAULT_DTYPE):
+        """
+        `intervals` can be an iterable of `Interval`s or integer semitones, or an integer numpy array
+        """
+
+        self.semitones = _semitone_array(intervals, "semitones", Interval, dtype)
+
+    def __repr__(self) -> str:
+        return f"[IntervalArray {self.semitones}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self.semitones)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return (Interval(semitones) for semitones in self.semitones.tolist())
+
+    def __getitem__(self, index) -> Union[Interval, "IntervalArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Interval(int(self.semitones[index]))
+        return IntervalArray(self.semitones[index], dtype=self.semitones.dtype)
+
+    def __eq__(self, other: "IntervalArray"):
+        return isinstance(other, IntervalArray) and np.array_equal(self.semitones, other.semitones)
+
+    def __ne__(self, other: "IntervalArray"):
+        return not self.__eq__(other)
+
+    def __neg__(self) -> "IntervalArray":
+        return IntervalArray(-self.semitones, dtype=self.semitones.dtype)
+
+    def __add__(self, other: Union["IntervalArray", Interval, int]) -> "IntervalArray":
+        offset = self._offset(other)
+        if offset is None:
+            return NotImplemented
+        return IntervalArray(self.semitones + offset, dtype=self.semitones.dtype)
+
+    def __radd__(self, other: Union[Interval, int]) -> "IntervalArray":
+        return self.__add__(other)
+
+    def __sub__(self, other: Union["IntervalArray", Interval, int]) -> "IntervalArray":
+        offset = self._offset(other)
+        if offset is None:
+            return NotImplemented
+        return IntervalArray(self.semitones - offset, dtype=self.semitones.dtype)
+
+    def __rsub__(self, other: Union[Interval, int]) -> "IntervalArray":
+        offset = self._offset(other)
+        if offset is None:
+            return NotImplemented
+        return IntervalArray(offset - self.semitones, dtype=self.semitones.dtype)
+
+    def __mul__(self, other: int) -> "IntervalArray":
+        if not isinstance(other, int):
+            return NotImplemented
+        return IntervalArray(self.semitones * other, dtype=self.semitones.dtype)
+
+    def __rmul__(self, other: int) -> "IntervalArray":
+        return self.__mul__(other)
+
+    @staticmethod
+    def _offset(other) -> Optional[Union[int, np.ndarray]]:
+        if isinstance(other, IntervalArray):
+            return other.semitones
+        elif isinstance(other, Interval):
+            return other.semitones
+        elif isinstance(other, int):
+            return other
+        return None
+
+    @classmethod
+    def from_names(cls, names: Iterable[str], dtype=ARRAY_DEFAULT_DTYPE) -> "IntervalArray":
+        """
+        Build an `IntervalArray` from interval names like "m3" or "P15", raising `ValueError` on the first invalid name
+        """
+
+        result = parse_intervals(names)
+
+        if result.errors:
+            raise ValueError(result.errors[min(result.errors)])
+
+        return cls(np.frombuffer(result.values, dtype=np.dtype(result.values.typecode)), dtype=dtype)
+
+    def compliment(self) -> "IntervalArray":
+        """
+        Compliment of each `Interval`, when added to the original interval will equal an octave
+        """
+
+        return IntervalArray(SEMITONES_PER_OCTAVE - self.semitones, dtype=self.semitones.dtype)
+
+    def decompound(self) -> "IntervalArray":
+        """
+        Returns the same intervals without any octave offset
+        """
+
+        return IntervalArray(self.semitones % SEMITONES_PER_OCTAVE, dtype=self.semitones.dtype)
+
+    def qualities(self) -> np.ndarray:
+        """
+        Return the quality of each `Interval` as a string array, see `Interval.quality`
+        """
+
+        return _PITCH_CLASS_QUALITIES[np.abs(self.semitones) % SEMITONES_PER_OCTAVE]
+
+    def quantities(self) -> np.ndarray:
+        """
+        Return the quantity of each `Interval`, compound intervals add 7 per octave like `Interval.quantity`
+        """
+
+        abs_semitones = np.abs(self.semitones)
+        return _PITCH_CLASS_QUANTITIES[abs_semitones % SEMITONES_PER_OCTAVE] + 7 * (
+            abs_semitones // SEMITONES_PER_OCTAVE
+        )
+
+    def names(self) -> np.ndarray:
+        """
+        Return the name of each `Interval` like P5 or m10 or -M3 as a string array
+        """
+
+        signs = np.where(self.semitones < 0, "-", "")
+        return np.char.add(np.char.add(signs, self.qualities()), self.quantities().astype(str))
+
+    def ratios(self) -> np.ndarray:
+        """
+        Return the 12TET frequency ratio of each `Interval`, matching `Interval.ratio`
+        """
+
+        abs_semitones = np.abs(self.semitones)
+        ratios = np.ldexp(
+            _PITCH_CLASS_RATIOS[abs_semitones % SEMITONES_PER_OCTAVE], abs_semitones // SEMITONES_PER_OCTAVE
+        )
+        return np.where(self.semitones < 0, 1.0 / ratios, ratios)
+
+    def to_intervals(self) -> list[Interval]:
+        """
+        Return the `Interval`s as a list
+        """
+
+        return list(self)
+
+
+class NoteArray:
+    """
+    A sequence of `Note`s stored as an integer array of semitones from C0, with the same 12TET A4 = 440Hz tuning as `Note`
+    """
+
+    semitones: np.ndarray
+    "The absolute semitone of each note starting at C0=0"
+
+    def __init__(self, notes: Union[Iterable[Union[Note, int]], Scale, np.ndarray], dtype=ARRAY_DEFAULT_DTYPE):
+        """
+        `notes` can be an iterable of `Note`s or integer semitones from C0, a `Scale`, or an integer numpy array
+        """
+
+        if isinstance(notes, Scale):
+            notes = notes.notes
+
+        self.semitones = _semitone_array(notes, "semitone", Note, dtype)
+
+    def __repr__(self) -> str:
+        return f"[NoteArray {self.semitones}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self.semitones)
+
+    def __iter__(self) -> Iterator[Note]:
+        return (Note(semitone) for semitone in self.semitones.tolist())
+
+    def __getitem__(self, index) -> Union[Note, "NoteArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Note(int(self.semitones[index]))
+        return NoteArray(self.semitones[index], dtype=self.semitones.dtype)
+
+    def __eq__(self, other: "NoteArray"):
+        return isinstance(other, NoteArray) and np.array_equal(self.semitones, other.semitones)
+
+    def __ne__(self, other: "NoteArray"):
+        return not self.__eq__(other)
+
+    def __add__(self, other: Union[Interval, int, IntervalArray]) -> "NoteArray":
+        if not isinstance(other, (Interval, int, IntervalArray)):
+            return NotImplemented
+        return self.transposed(other)
+
+    def __sub__(self, other: Union[Interval, int, IntervalArray, "NoteArray"]) -> Union["NoteArray", IntervalArray]:
+        if isinstance(other, NoteArray):
+            return IntervalArray(self.semitones - other.semitones, dtype=self.semitones.dtype)
+        elif isinstance(other, Interval):
+            return self.transposed(-other.semitones)
+        elif isinstance(other, int):
+            return self.transposed(-other)
+        elif isinstance(other, IntervalArray):
+            return NoteArray(self.semitones - other.semitones, dtype=self.semitones.dtype)
+        else:
+            return NotImplemented
+
+    def frequencies(self, tuning: Optional[Tuning] = None) -> np.ndarray:
+        """
+        Return the frequency of each note in hertz, in 12TET at A4 = 440Hz like `Note` or looked up in a `Tuning`
+        """
+
+        if tuning is None:
+            return np.ldexp(_PITCH_CLASS_FREQUENCIES[self.pitch_classes()], self.octaves())
+
+        indices = self.semitones - TUNING_LOWEST_SEMITONE
+
+        if len(indices) and (indices.min() < 0 or indices.max() > TUNING_HIGHEST_SEMITONE - TUNING_LOWEST_SEMITONE):
+            raise IndexError("Notes outside of the tuning table!")
+
+        return np.frombuffer(tuning.table, dtype=np.float64)[indices]
+
+    def melodic_intervals(self) -> IntervalArray:
+        """
+        Return the `Interval`s between each note and the next one
+        """
+
+        return IntervalArray(np.diff(self.semitones), dtype=self.semitones.dtype)
+
+    def octaves(self) -> np.ndarray:
+        """
+        Return the octave of each note, octaves start at C and end at B
+        """
+
+        return self.semitones // SEMITONES_PER_OCTAVE
+
+    def pitch_classes(self) -> np.ndarray:
+        """
+        Return the semitone of each note within its octave, 0 for C up to 11 for B
+        """
+
+        return self.semitones % SEMITONES_PER_OCTAVE
+
+    def transposed(self, interval: Union[Interval, int, IntervalArray]) -> "NoteArray":
+        """
+        Transpose every note by an `Interval` or integer number of semitones, or each note by its own `IntervalArray` entry
+        """
+
+        if isinstance(interval, Interval):
+            offset = interval.semitones
+        elif isinstance(interval, int):
+            offset = interval
+        elif isinstance(interval, IntervalArray):
+            offset = interval.semitones
+        else:
+            raise TypeError()
+
+        return NoteArray(self.semitones + offset, dtype=self.semitones.dtype)
+
+    def to_notes(self) -> list[Note]:
+        """
+        Return the notes as a list of `Note`s
+        """
+
+        return list(self)
+
+    def to_scale(self) -> Scale:
+        """
+        Return the notes as a `Scale`
+        """
+
+        return Scale(self.to_notes())
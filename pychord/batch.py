@@ -0,0 +1,182 @@
+"""
+Batch analysis of large corpora of note sequences spread over a process pool.
+Sequences travel between processes as integer arrays of semitones, results come back in input order
+"""
+
+import os
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from pychord.const import *
+from pychord import keyindex
+from pychord.keyindex import KeyIndex
+from pychord.mode import Mode
+from pychord.note import Note
+from pychord.pitchclass import mask_pitch_classes, pitch_class_mask
+
+BATCH_DEFAULT_CHUNK_SIZE: int = 64
+"Default number of sequences sent to a worker process at once"
+
+
+class Analysis(NamedTuple):
+    """
+    Summary of one note sequence, or of a whole corpus once merged with `merge_analyses`
+    """
+
+    notes: int
+    "Number of notes"
+
+    lowest: Optional[int]
+    "Semitone from C0 of the lowest note, None without notes"
+
+    highest: Optional[int]
+    "Semitone from C0 of the highest note, None without notes"
+
+    intervals: dict[int, int]
+    "Histogram of the melodic intervals between consecutive notes in semitones, in ascending order"
+
+    pitch_classes: tuple[int, ...]
+    "Number of notes of each of the 12 pitch classes with C = 0"
+
+    mask: int
+    "12-bit pitch class set of all the notes"
+
+    def range(self) -> Optional[tuple[Note, Note]]:
+        """
+        Return the lowest and highest `Note`, None without notes
+        """
+
+        if self.lowest is None:
+            return None
+
+        return Note(self.lowest), Note(self.highest)
+
+    def keys(self, index: Optional[KeyIndex] = None) -> tuple[tuple[Note, Mode], ...]:
+        """
+        Return the candidate keys whose scales contain every pitch class of the notes in `index`, `KEY_INDEX` by default,
+        see `KeyIndex.keys_containing`
+        """
+
+        return (keyindex.KEY_INDEX if index is None else index).keys_containing(mask_pitch_classes(self.mask))
+
+
+def analyze(notes: Iterable[Union[Note, int]]) -> Analysis:
+    """
+    Analyze a single sequence of `Note`s or semitones from C0 in this process
+    """
+
+    return _analyze_semitones(_semitone_array(notes))
+
+
+def analyze_batch(
+    sequences: Iterable[Iterable[Union[Note, int]]],
+    workers: Optional[int] = None,
+    chunksize: int = BATCH_DEFAULT_CHUNK_SIZE,
+) -> Iterator[Analysis]:
+    """
+    Lazily analyze many note sequences on `workers` processes, all CPUs by default, yielding results in input order.
+    Sequences are sent `chunksize` at a time and only a few chunks per worker are in flight,
+    so the corpus is never held in memory as a whole. With 0 workers everything runs in this process
+    """
+
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunk size {chunksize}!")
+
+    payloads = (_semitone_array(notes) for notes in sequences)
+    chunks = iter(lambda: list(islice(payloads, chunksize)), [])
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk)
+        return
+
+    # Imported here as it pulls in multiprocessing, which would slow down importing pychord
+    from concurrent.futures import ProcessPoolExecutor
+
+    in_flight = 2 * (workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(executor.submit(_analyze_chunk, chunk))
+
+            # Bound the work in flight, results are consumed in submission order
+            if len(pending) >= in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def merge_analyses(analyses: Iterable[Analysis]) -> Analysis:
+    """
+    Merge the analyses of many sequences into one for the whole corpus, melodic intervals are not counted
+    across sequence boundaries
+    """
+
+    notes = 0
+    lowest = None
+    highest = None
+    intervals = {}
+    pitch_classes = [0] * SEMITONES_PER_OCTAVE
+    mask = 0
+
+    for analysis in analyses:
+        notes += analysis.notes
+
+        if analysis.lowest is not None:
+            lowest = analysis.lowest if lowest is None else min(lowest, analysis.lowest)
+            highest = analysis.highest if highest is None else max(highest, analysis.highest)
+
+        for interval, count in analysis.intervals.items():
+            intervals[interval] = intervals.get(interval, 0) + count
+
+        for pitch_class, count in enumerate(analysis.pitch_classes):
+            pitch_classes[pitch_class] += count
+
+        mask |= analysis.mask
+
+    return Analysis(notes, lowest, highest, dict(sorted(intervals.items())), tuple(pitch_classes), mask)
+
+
+def analyze_corpus(
+    sequences: Iterable[Iterable[Union[Note, int]]],
+    workers: Optional[int] = None,
+    chunksize: int = BATCH_DEFAULT_CHUNK_SIZE,
+) -> Analysis:
+    """
+    Analyze many note sequences on a process pool and merge the results, see `analyze_batch`
+    """
+
+    return merge_analyses(analyze_batch(sequences, workers, chunksize))
+
+
+def _semitone_array(notes: Iterable[Union[Note, int]]) -> array:
+    return array("i", (note.semitone if isinstance(note, Note) else note for note in notes))
+
+
+def _analyze_chunk(chunk: list[array]) -> list[Analysis]:
+    return [_analyze_semitones(semitones) for semitones in chunk]
+
+
+def _analyze_semitones(semitones: array) -> Analysis:
+    intervals = {}
+    pitch_classes = [0] * SEMITONES_PER_OCTAVE
+
+    for semitone in semitones:
+        pitch_classes[semitone % SEMITONES_PER_OCTAVE] += 1
+
+    for previous, current in zip(semitones, semitones[1:]):
+        intervals[current - previous] = intervals.get(current - previous, 0) + 1
+
+    return Analysis(
+        len(semitones),
+        min(semitones) if semitones else None,
+        max(semitones) if semitones else None,
+        dict(sorted(intervals.items())),
+        tuple(pitch_classes),
+        pitch_class_mask(semitones),
+    )
@@ -0,0 +1,280 @@
+"""
+Benchmark suite for the hot paths of the value classes.
+
+Run `python -m pychord.benchmarks` to print timings, `--json results.json` to save them
+and `--baseline results.json` to compare a later run against them, the process exits with
+status 1 when a benchmark got slower than the baseline by more than `--tolerance`
+"""
+
+import argparse
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from typing import Callable, Optional
+
+from pychord.const import *
+from pychord.interval import *
+from pychord.midi import *
+from pychord.mode import *
+from pychord.note import *
+from pychord.parse import *
+from pychord.scale import *
+from pychord.tone import *
+from pychord.tuning import *
+
+BENCHMARK_REPEAT: int = 5
+"Number of timing runs per benchmark, the fastest one is reported"
+
+BENCHMARK_TOLERANCE: float = 0.25
+"Default relative slowdown against the baseline that counts as a regression"
+
+BENCHMARKS: dict[str, tuple[Callable[[], Callable[[], object]], int, int]] = {}
+"Registered benchmarks by name: a setup function returning the timed callable, the calls per run and the items per call"
+
+
+def benchmark(name: str, number: int, items: int = 1):
+    """
+    Register a benchmark setup function under `name`, the callable it returns is timed `number` times per run
+    and processes `items` items per call
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = (setup, number, items)
+        return setup
+
+    return register
+
+
+def legacy_note_frequency(semitone: int) -> float:
+    """
+    Note frequency computed the way `Note` did before the closed form, through `Tone` and `Interval` arithmetic
+    """
+
+    return (
+        Tone(C0_FREQUENCY) + Interval(semitone % SEMITONES_PER_OCTAVE) + (OCTAVE * (semitone // SEMITONES_PER_OCTAVE))
+    ).frequency
+
+
+NOTE_RANGE = range(0, 96)
+
+INTERVAL_RANGE = range(-24, 36)
+
+
+@benchmark("note.frequency_legacy", 20, len(NOTE_RANGE))
+def _():
+    return lambda: [legacy_note_frequency(n) for n in NOTE_RANGE]
+
+
+@benchmark("note.init_int", 200, len(NOTE_RANGE))
+def _():
+    return lambda: [Note(n) for n in NOTE_RANGE]
+
+
+@benchmark("note.init_str", 200, len(NOTE_RANGE))
+def _():
+    names = [Note(n).name() for n in NOTE_RANGE]
+    return lambda: [Note(name) for name in names]
+
+
+@benchmark("note.transposed", 200, len(NOTE_RANGE))
+def _():
+    notes = [Note(n) for n in NOTE_RANGE]
+    fifth = Interval("P5")
+    return lambda: [note.transposed(fifth) for note in notes]
+
+
+@benchmark("note.sort", 5, 10000)
+def _():
+    rng = random.Random(0)
+    notes = [Note(rng.randrange(0, 96)) for _ in range(10000)]
+    return lambda: sorted(notes)
+
+
+@benchmark("note.dedup", 5, 10000)
+def _():
+    rng = random.Random(0)
+    notes = [Note(rng.randrange(0, 96)) for _ in range(10000)]
+    return lambda: set(notes)
+
+
+@benchmark("tuning.frequencies", 200, len(NOTE_RANGE))
+def _():
+    notes = [Note(n) for n in NOTE_RANGE]
+    tuning = Tuning.just()
+    return lambda: tuning.frequencies(notes)
+
+
+@benchmark("midi.read", 5, 10000)
+def _():
+    rng = random.Random(0)
+    f = io.BytesIO()
+    write_midi(f, [NoteEvent(i * 120, rng.randrange(60, 480), Note(rng.randrange(24, 84))) for i in range(10000)])
+    data = f.getvalue()
+    return lambda: sum(1 for _ in read_midi(data))
+
+
+@benchmark("interval.init_int", 200, len(INTERVAL_RANGE))
+def _():
+    return lambda: [Interval(n) for n in INTERVAL_RANGE]
+
+
+@benchmark("interval.init_str", 200, 36)
+def _():
+    names = [Interval(n).name() for n in range(0, 36)]
+    return lambda: [Interval(name) for name in names]
+
+
+@benchmark("parse.notes", 10, len(NOTE_RANGE) * 100)
+def _():
+    names = [Note(n).name() for n in NOTE_RANGE] * 100
+    return lambda: parse_notes(names)
+
+
+@benchmark("parse.intervals", 10, 3600)
+def _():
+    names = [Interval(n).name() for n in range(0, 36)] * 100
+    return lambda: parse_intervals(names)
+
+
+@benchmark("scale.shifted", 200, 16)
+def _():
+    scale = IONIAN.to_scale(Note("C"))
+    return lambda: [scale.shifted(steps) for steps in range(-8, 8)]
+
+
+@benchmark("scale.getitem", 200, 28)
+def _():
+    scale = IONIAN.to_scale(Note("C"))
+    return lambda: [scale[i] for i in range(-14, 14)]
+
+
+@benchmark("scale.range", 20, 1000)
+def _():
+    scale = IONIAN.to_scale(Note("C"))
+    return lambda: sum(1 for _ in scale.range(-500, 500, semitones=True))
+
+
+@benchmark("mode.shifted", 200, 7)
+def _():
+    return lambda: [IONIAN << steps for steps in range(7)]
+
+
+@benchmark("mode.to_scale", 200, 12)
+def _():
+    tonics = [Note(n) for n in range(48, 60)]
+    return lambda: [AEOLIAN.to_scale(tonic) for tonic in tonics]
+
+
+@benchmark("startup.python", 5)
+def _():
+    return lambda: subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+@benchmark("startup.pychord", 5)
+def _():
+    # Interpreter startup plus importing pychord, the difference to startup.python is the import time
+    return lambda: subprocess.run([sys.executable, "-c", "import pychord"], check=True)
+
+
+def run(names: Optional[list[str]] = None, repeat: int = BENCHMARK_REPEAT) -> dict:
+    """
+    Run the named benchmarks, or all of them, and return their best time per call and per item in seconds
+    """
+
+    results = {}
+
+    for name, (setup, number, items) in BENCHMARKS.items():
+        if names is not None and name not in names:
+            continue
+
+        best = min(timeit.repeat(setup(), number=number, repeat=repeat)) / number
+        results[name] = {"seconds": best, "items": items, "seconds_per_item": best / items}
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "memory": {"Note": sys.getsizeof(Note(60)), "Interval": sys.getsizeof(Interval(7))},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = BENCHMARK_TOLERANCE) -> dict[str, float]:
+    """
+    Return the ratio of current to baseline time of each benchmark that got slower by more than `tolerance`
+    """
+
+    regressions = {}
+
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+
+        ratio = result["seconds_per_item"] / baseline["results"][name]["seconds_per_item"]
+
+        if ratio > 1 + tolerance:
+            regressions[name] = ratio
+
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pychord.benchmarks", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all of them by default")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON to PATH, - for stdout")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against results previously written with --json")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="timing runs per benchmark")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    current = run(args.names or None, args.repeat)
+    baseline = None
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    # Keep stdout clean for the JSON when writing it there
+    report = sys.stderr if args.json == "-" else sys.stdout
+
+    for name, result in current["results"].items():
+        line = f"{name:<24} {result['seconds'] * 1e6:12.3f} us {1 / result['seconds_per_item']:14.0f} items/s"
+
+        if baseline is not None and name in baseline["results"]:
+            line += f" {result['seconds_per_item'] / baseline['results'][name]['seconds_per_item']:8.2f}x baseline"
+
+        print(line, file=report)
+
+    if args.json == "-":
+        json.dump(current, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.tolerance)
+
+        for name, ratio in regressions.items():
+            print(f"REGRESSION {name}: {ratio:.2f}x slower than baseline", file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+INTERN_CACHE_DEFAULT_SIZE: int = 4096
+"Default maximum number of instances held by an `InternCache`"
+
+
+class CacheInfo(NamedTuple):
+    """
+    Snapshot of the statistics of an `InternCache`
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class InternCache:
+    """
+    A bounded least recently used cache of shared instances, disabled until `enable` is called
+    """
+
+    enabled: bool
+    "Whether lookups go through the cache at all"
+
+    maxsize: int
+    "Maximum number of instances kept before the least recently used one is evicted"
+
+    hits: int
+    "Number of constructions served from the cache"
+
+    misses: int
+    "Number of constructions that had to build a new instance"
+
+    def __init__(self, maxsize: int = INTERN_CACHE_DEFAULT_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size {maxsize}!")
+
+        self.enabled = False
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._instances = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"[InternCache {'enabled' if self.enabled else 'disabled'} {self.info()}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def enable(self, maxsize: Optional[int] = None):
+        """
+        Start interning instances, optionally changing the size limit
+        """
+
+        if maxsize is not None:
+            if maxsize < 1:
+                raise ValueError(f"Invalid cache size {maxsize}!")
+            self.maxsize = maxsize
+            self._evict()
+
+        self.enabled = True
+        _enabled_caches.add(self)
+        Interned.__call__ = _interned_call
+
+    def disable(self):
+        """
+        Stop interning instances and drop every cached instance
+        """
+
+        self.enabled = False
+        _enabled_caches.discard(self)
+
+        if not _enabled_caches and "__call__" in vars(Interned):
+            del Interned.__call__
+
+        self.clear()
+
+    def clear(self):
+        """
+        Drop every cached instance and reset the hit and miss counters
+        """
+
+        self._instances.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the hit and miss counters along with the size of the cache
+        """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._instances))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the instance cached under `key` and mark it as recently used, or `None` on a miss
+        """
+
+        instance = self._instances.get(key)
+
+        if instance is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._instances.move_to_end(key)
+        return instance
+
+    def put(self, key: Hashable, instance: Any):
+        """
+        Cache `instance` under `key`, evicting the least recently used instances above the size limit
+        """
+
+        self._instances[key] = instance
+        self._evict()
+
+    def _evict(self):
+        while len(self._instances) > self.maxsize:
+            self._instances.popitem(last=False)
+
+
+class Interned(type):
+    """
+    Metaclass that routes construction through the class `cache` so equal arguments share one instance once enabled.
+    The routing is only installed while an `InternCache` is enabled, otherwise construction is plain `type.__call__`
+    """
+
+
+# Enabled caches, `Interned` classes are constructed through `_interned_call` while there is any
+_enabled_caches = set()
+
+
+def _interned_call(cls, *args, **kwargs):
+    cache = cls.cache
+
+    if not cache.enabled or len(args) != 1 or kwargs:
+        return type.__call__(cls, *args, **kwargs)
+
+    # Key on the class and argument type too, subclasses may share the cache and True hashes like 1
+    value = args[0]
+    key = (cls, type(value), value)
+    instance = cache.get(key)
+
+    if instance is None:
+        instance = type.__call__(cls, value)
+        cache.put(key, instance)
+
+    return instance
@@ -0,0 +1,268 @@
+"""
+Catalog of the 2048 pitch class sets containing their root, with mode names, normal and prime forms, Forte numbers
+and interval vectors, so identifying a `Mode`, comparing set classes and looking up names are dictionary lookups
+"""
+
+from typing import Iterator, NamedTuple, Union
+
+from pychord.const import *
+from pychord.lazy import lazy_constants
+from pychord.mode import Mode
+from pychord.pitchclass import mask_pitch_classes, pitch_class_mask, rotate_mask
+
+__all__ = ["CatalogEntry", "Catalog", "normal_form", "prime_form", "interval_vector", "CATALOG"]
+
+
+class CatalogEntry(NamedTuple):
+    """
+    Everything the `Catalog` knows about a pitch class set containing pitch class 0
+    """
+
+    mask: int
+    "12-bit pitch class set, bit `i` is set when pitch class `i` above the root is in the set"
+
+    names: tuple[str, ...]
+    "Names of the `Mode`s with exactly these pitch classes, empty when it has none"
+
+    normal_form: tuple[int, ...]
+    "The pitch classes in their most compact rotation, see `normal_form`"
+
+    prime_form: tuple[int, ...]
+    "Normal form of the set class under transposition and inversion starting from 0, see `prime_form`"
+
+    forte: str
+    "Forte number of the set class like '7-35', Z marks classes sharing their interval vector with another class"
+
+    interval_vector: tuple[int, ...]
+    "Number of pairs of pitch classes at each interval class from 1 to 6"
+
+    def name(self) -> str:
+        """
+        Return the first name of the set, or its Forte number when it has none
+        """
+
+        return self.names[0] if self.names else self.forte
+
+    def mode(self) -> Mode:
+        """
+        Return the `Mode` with these pitch classes
+        """
+
+        return Mode.from_mask(self.mask)
+
+
+def normal_form(mask: int) -> tuple[int, ...]:
+    """
+    Return the pitch classes of a set in the rotation with the smallest span from first to last,
+    ties going to the rotation most packed to the left, then to the lowest first pitch class
+    """
+
+    pitch_classes = mask_pitch_classes(mask)
+
+    if not pitch_classes:
+        return ()
+
+    rotations = [pitch_classes[i:] + pitch_classes[:i] for i in range(len(pitch_classes))]
+
+    return min(rotations, key=lambda rotation: _packing(rotation))
+
+
+def prime_form(mask: int) -> tuple[int, ...]:
+    """
+    Return the most compact of the normal forms of a set and of its inversion, transposed to start from 0
+    """
+
+    if not mask:
+        return ()
+
+    inversion = pitch_class_mask(-pitch_class for pitch_class in mask_pitch_classes(mask))
+
+    return min(_packing(normal_form(mask)), _packing(normal_form(inversion)))[1]
+
+
+def interval_vector(mask: int) -> tuple[int, ...]:
+    """
+    Return the number of pairs of pitch classes of a set at each interval class from 1 to 6
+    """
+
+    pitch_classes = mask_pitch_classes(mask)
+    vector = [0] * (SEMITONES_PER_OCTAVE // 2)
+
+    for i, low in enumerate(pitch_classes):
+        for high in pitch_classes[i + 1 :]:
+            vector[min(high - low, SEMITONES_PER_OCTAVE - high + low) - 1] += 1
+
+    return tuple(vector)
+
+
+class Catalog:
+    """
+    Tables of every pitch class set containing pitch class 0, indexed by mask, name and Forte number.
+    `Mode`s are looked up by their mask, so intervals an octave apart or in another order identify the same entry.
+    The tables are built on first use
+    """
+
+    def __init__(self):
+        self._entries = None
+        self._names = None
+        self._fortes = None
+
+    def __repr__(self) -> str:
+        return f"[Catalog {1 << (SEMITONES_PER_OCTAVE - 1)} sets]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return 1 << (SEMITONES_PER_OCTAVE - 1)
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        if self._entries is None:
+            self._build()
+
+        return iter(self._entries[1::2])
+
+    def identify(self, mode: Union[Mode, int]) -> CatalogEntry:
+        """
+        Return the `CatalogEntry` of a `Mode` or of a 12-bit pitch class set containing pitch class 0
+        """
+
+        if self._entries is None:
+            self._build()
+
+        mask = mode.mask if isinstance(mode, Mode) else mode
+
+        if not isinstance(mask, int):
+            raise TypeError()
+
+        if not 0 <= mask <= PITCH_CLASS_MASK_ALL:
+            raise ValueError(f"Invalid pitch class set {mask}!")
+
+        if not mask & 1:
+            raise ValueError(f"Pitch class set {mask:#05x} does not contain its root!")
+
+        return self._entries[mask]
+
+    def lookup(self, name: str) -> Mode:
+        """
+        Return the `Mode` named `name` like "Dorian" or "phrygian dominant", aliases like "Major" included
+        """
+
+        if self._names is None:
+            self._build()
+
+        mask = self._names.get(" ".join(name.split()).lower())
+
+        if mask is None:
+            raise ValueError(f"Unknown mode name '{name}'!")
+
+        return Mode.from_mask(mask)
+
+    def set_class(self, forte: str) -> tuple[CatalogEntry, ...]:
+        """
+        Return the entries of every pitch class set of a Forte number like "7-35" or "6-Z44", the Z is optional
+        and case insensitive
+        """
+
+        if self._fortes is None:
+            self._build()
+
+        masks = self._fortes.get(forte.upper().replace("Z", ""))
+
+        if masks is None:
+            raise ValueError(f"Unknown Forte number '{forte}'!")
+
+        return tuple(self._entries[mask] for mask in masks)
+
+    def equivalent(self, a: Union[Mode, int], b: Union[Mode, int], inversion: bool = False) -> bool:
+        """
+        Return whether two `Mode`s or pitch class sets are transpositions of each other, or with `inversion`
+        transpositions or inversions of each other. Only the latter means they have the same Forte number
+        """
+
+        a = self.identify(a)
+        b = self.identify(b)
+
+        if inversion:
+            return a.prime_form == b.prime_form
+
+        return _transposition_class(a.mask) == _transposition_class(b.mask)
+
+    def _build(self):
+        entries = [None] * (1 << SEMITONES_PER_OCTAVE)
+        names = {}
+        fortes = {}
+
+        forte_numbers = {}
+        for cardinality, members in SET_CLASS_FORTE_ORDER.items():
+            for number, member in enumerate(members.split(), 1):
+                prime = prime_form(_parse_pitch_classes(member))
+                forte_numbers[prime] = f"{cardinality}-{number}"
+
+                # Complements of hexachords are hexachords numbered in their own right
+                if 2 * cardinality != SEMITONES_PER_OCTAVE:
+                    complement = prime_form(PITCH_CLASS_MASK_ALL & ~_parse_pitch_classes(member))
+                    forte_numbers[complement] = f"{SEMITONES_PER_OCTAVE - cardinality}-{number}"
+
+        for interval_class in range(1, SEMITONES_PER_OCTAVE // 2 + 1):
+            forte_numbers[prime_form(1 | 1 << interval_class)] = f"2-{interval_class}"
+            forte_numbers[prime_form(PITCH_CLASS_MASK_ALL & ~(1 | 1 << interval_class))] = f"10-{interval_class}"
+
+        for cardinality in (1, 11, 12):
+            forte_numbers[prime_form(PITCH_CLASS_MASK_ALL >> (SEMITONES_PER_OCTAVE - cardinality))] = f"{cardinality}-1"
+
+        mode_names = {}
+        for parent, modes in MODE_NAMES.items():
+            pitch_classes = mask_pitch_classes(_parse_pitch_classes(parent))
+            for degree, mode in enumerate(modes):
+                mask = rotate_mask(_parse_pitch_classes(parent), pitch_classes[degree])
+                mode_names.setdefault(mask, []).append(mode)
+                names[mode.lower()] = mask
+
+        for alias, name in MODE_NAME_ALIASES.items():
+            names[alias.lower()] = names[name.lower()]
+
+        # Classes sharing an interval vector with another class of the same size get a Z
+        vectors = {}
+        for prime in forte_numbers:
+            vector = interval_vector(pitch_class_mask(prime))
+            vectors[vector] = vectors.get(vector, 0) + 1
+
+        for mask in range(1, 1 << SEMITONES_PER_OCTAVE, 2):
+            prime = prime_form(mask)
+            vector = interval_vector(mask)
+            forte = forte_numbers[prime]
+            fortes.setdefault(forte, []).append(mask)
+
+            if vectors[vector] > 1:
+                cardinality, number = forte.split("-")
+                forte = f"{cardinality}-Z{number}"
+
+            entries[mask] = CatalogEntry(mask, tuple(mode_names.get(mask, ())), normal_form(mask), prime, forte, vector)
+
+        self._entries = entries
+        self._names = names
+        self._fortes = fortes
+
+
+def _packing(rotation: tuple[int, ...]) -> tuple[int, tuple[int, ...]]:
+    # Sort key of a rotation: its span, then its pitch classes transposed to start from 0 compared from the left
+    transposed = tuple((pitch_class - rotation[0]) % SEMITONES_PER_OCTAVE for pitch_class in rotation)
+    return transposed[-1], transposed
+
+
+def _transposition_class(mask: int) -> int:
+    return min(rotate_mask(mask, steps) for steps in range(SEMITONES_PER_OCTAVE))
+
+
+def _parse_pitch_classes(pitch_classes: str) -> int:
+    return pitch_class_mask(int(pitch_class, 12) for pitch_class in pitch_classes.replace("T", "A").replace("E", "B"))
+
+
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        # Default `Catalog`, the tables are built on first lookup
+        "CATALOG": Catalog,
+    },
+)
@@ -0,0 +1,192 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+from pychord.const import *
+from pychord.immutable import Immutable
+from pychord.interval import Interval
+from pychord.note import Note
+from pychord.pitchclass import pitch_class_mask, rotate_mask
+
+CHORD_SYMBOL_CACHE_SIZE: int = 1024
+"Number of parsed chord symbols kept by `parse_chord`"
+
+
+class Chord(Immutable):
+    """
+    A musical `Chord` built from a root `Note` and a quality, optionally over a different bass note
+    """
+
+    __slots__ = ("root", "quality", "bass", "notes", "mask")
+
+    root: Note
+    "The root `Note` of the chord"
+
+    quality: str
+    "The chord symbol suffix like 'm7' or 'maj9', '' for a major triad, see `CHORD_QUALITY_TO_SEMITONES`"
+
+    bass: Note
+    "The lowest `Note` of the chord, which is the root unless the chord is a slash chord like C/E"
+
+    notes: tuple[Note, ...]
+    "The `Note`s of the chord from the bass up"
+
+    mask: int
+    "12-bit pitch class set of the chord"
+
+    def __init__(self, root: Union[Note, str], quality: str = "", bass: Optional[Union[Note, str]] = None):
+        """
+        `root` and `bass` can be `Note`s or note names, `quality` is a chord symbol suffix like "m7" or one of its aliases
+        """
+
+        if isinstance(root, str):
+            root = Note(root)
+        if isinstance(bass, str):
+            bass = Note(bass)
+
+        if not isinstance(root, Note) or not isinstance(quality, str) or not isinstance(bass, (Note, type(None))):
+            raise TypeError()
+
+        quality = CHORD_QUALITY_ALIASES.get(quality, quality)
+
+        if quality not in CHORD_QUALITY_TO_SEMITONES:
+            raise ValueError(f"Invalid chord quality '{quality}'!")
+
+        tones = [root] + [root + Interval(name) for name in CHORD_QUALITY_TO_INTERVAL_NAMES[quality][1:]]
+
+        if bass is None or (bass.semitone - root.semitone) % SEMITONES_PER_OCTAVE == 0:
+            bass = root
+            notes = tones
+        else:
+            # Place the bass in the octave below the root and drop its pitch class from the upper voices
+            lowered = (root.semitone - bass.semitone) % SEMITONES_PER_OCTAVE
+            bass = bass.in_octave(bass.octave + (root.semitone - lowered - bass.semitone) // SEMITONES_PER_OCTAVE)
+            notes = [bass] + [tone for tone in tones if (tone.semitone - bass.semitone) % SEMITONES_PER_OCTAVE != 0]
+
+        object.__setattr__(self, "root", root)
+        object.__setattr__(self, "quality", quality)
+        object.__setattr__(self, "bass", bass)
+        object.__setattr__(self, "notes", tuple(notes))
+        object.__setattr__(self, "mask", pitch_class_mask(note.semitone for note in notes))
+
+    def __repr__(self) -> str:
+        return f"[Chord {self.name()}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __eq__(self, other: "Chord"):
+        return isinstance(other, Chord) and self.notes == other.notes and self.quality == other.quality
+
+    def __ne__(self, other: "Chord"):
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((tuple(note.semitone for note in self.notes), self.quality))
+
+    def __contains__(self, note: Note) -> bool:
+        if not isinstance(note, Note):
+            return False
+        return bool(self.mask >> (note.semitone % SEMITONES_PER_OCTAVE) & 1)
+
+    def intervals(self) -> list[Interval]:
+        """
+        Return the `Interval`s of the chord tones above the root
+        """
+
+        return [Interval(name) for name in CHORD_QUALITY_TO_INTERVAL_NAMES[self.quality]]
+
+    def name(self) -> str:
+        """
+        Return the chord symbol like Cmaj7 or Am/E
+        """
+
+        name = f"{self.root.letter}{ACCIDENTAL_VALUE_TO_NAME[self.root.accidental]}{self.quality}"
+
+        if self.bass is not self.root:
+            name += f"/{self.bass.letter}{ACCIDENTAL_VALUE_TO_NAME[self.bass.accidental]}"
+
+        return name
+
+
+@lru_cache(maxsize=CHORD_SYMBOL_CACHE_SIZE)
+def parse_chord(symbol: str) -> Chord:
+    """
+    Parse a chord symbol like "Cmaj7/G" "F#m" "Bbdim7" into a `Chord` with its root in octave `NOTE_DEFAULT_OCTAVE`.
+    Results are cached, `Chord`s are immutable so the same instance is returned for repeated symbols
+    """
+
+    if not isinstance(symbol, str):
+        raise TypeError()
+
+    body, _, bass = symbol.partition("/")
+
+    # Longest note name prefix, a root is at most a letter and a double accidental
+    for length in (3, 2, 1):
+        if body[:length] in NOTE_PREFIX_TO_COMPONENTS:
+            break
+    else:
+        raise ValueError(f"Invalid chord symbol '{symbol}'!")
+
+    root, quality = body[:length], body[length:]
+
+    if CHORD_QUALITY_ALIASES.get(quality, quality) not in CHORD_QUALITY_TO_SEMITONES or (
+        bass and bass not in NOTE_PREFIX_TO_COMPONENTS
+    ):
+        raise ValueError(f"Invalid chord symbol '{symbol}'!")
+
+    return Chord(root, quality, bass or None)
+
+
+def _pitch_class_name(pitch_class: int) -> str:
+    letter, accidental = NOTE_SEMITONE_TO_COMPONENTS[pitch_class]
+    return f"{letter}{ACCIDENTAL_VALUE_TO_NAME[accidental]}"
+
+
+@lru_cache(maxsize=None)
+def _chord_name_table() -> dict[tuple[int, int], tuple[tuple[int, str], ...]]:
+    # (pitch class set, bass pitch class) -> (root pitch class, quality) of the chords with that bass,
+    # root position chords first, named by `recognize_chord` with the spelling of its input
+    table = {}
+
+    for quality, semitones in CHORD_QUALITY_TO_SEMITONES.items():
+        quality_mask = pitch_class_mask(semitones)
+
+        for root in range(SEMITONES_PER_OCTAVE):
+            mask = rotate_mask(quality_mask, -root)
+
+            for bass in range(SEMITONES_PER_OCTAVE):
+                if mask >> bass & 1:
+                    table.setdefault((mask, bass), ([], []))[bass != root].append((root, quality))
+
+    return {key: tuple(root_position + inversions) for key, (root_position, inversions) in table.items()}
+
+
+def recognize_chord(notes: Iterable[Union[Note, int]]) -> tuple[str, ...]:
+    """
+    Return the names of the chords made of exactly the pitch classes of `notes` with their lowest note as the bass,
+    root position chords first, or an empty tuple when nothing matches.
+    Roots and basses are spelled like the first `Note` of their pitch class, or with sharps for semitones
+    """
+
+    notes = list(notes)
+    semitones = [note.semitone if isinstance(note, Note) else note for note in notes]
+
+    if not semitones:
+        return ()
+
+    bass = min(semitones) % SEMITONES_PER_OCTAVE
+    chords = _chord_name_table().get((pitch_class_mask(semitones), bass), ())
+
+    names = {}
+    for note in notes:
+        if isinstance(note, Note):
+            names.setdefault(
+                note.semitone % SEMITONES_PER_OCTAVE, f"{note.letter}{ACCIDENTAL_VALUE_TO_NAME[note.accidental]}"
+            )
+
+    def name(pitch_class: int) -> str:
+        return names.get(pitch_class) or _pitch_class_name(pitch_class)
+
+    return tuple(
+        f"{name(root)}{quality}" if root == bass else f"{name(root)}{quality}/{name(bass)}" for root, quality in chords
+    )
@@ -49,8 +49,24 @@ INTERVAL_NAME_TO_VALUE = {
     "M6": 9,
     "m7": 10,
     "M7": 11,
+    "A1": 1,
+    "d2": 0,
+    "A2": 3,
+    "d3": 2,
+    "A3": 5,
+    "d4": 4,
+    "A5": 8,
+    "d6": 7,
+    "A6": 10,
+    "d7": 9,
+    "A7": 12,
 }
 
+INTERVAL_DEGREE_TO_NAME = {
+    (int(name[1:]) - 1, semitones % 12): name for name, semitones in INTERVAL_NAME_TO_VALUE.items()
+}
+"(scale degree from 0, semitones modulo an octave) to the interval name spelling them, like (3, 6) to 'A4'"
+
 INTERVAL_VALUE_TO_COMPONENTS = {
     0: ("P", 1),
     1: ("m", 2),
@@ -66,13 +82,278 @@ INTERVAL_VALUE_TO_COMPONENTS = {
     11: ("M", 7),
 }
 
+NOTE_LETTERS = ("C", "D", "E", "F", "G", "A", "B")
+"Note letters in ascending order within an octave"
+
+NOTE_LETTER_STEPS = {
+    (letter, steps): (
+        NOTE_LETTERS[(NOTE_LETTERS.index(letter) + steps) % 7],
+        (NOTE_NAME_TO_SEMITONE[NOTE_LETTERS[(NOTE_LETTERS.index(letter) + steps) % 7]] - NOTE_NAME_TO_SEMITONE[letter])
+        % 12,
+    )
+    for letter in NOTE_LETTERS
+    for steps in range(7)
+}
+"(letter, scale steps up to 6) to the letter that many steps higher and the semitones between the natural notes"
+
+NOTE_PREFIX_TO_COMPONENTS = {
+    f"{letter}{accidental or ''}": (letter, value)
+    for letter in NOTE_NAME_TO_SEMITONE
+    for accidental, value in ACCIDENTAL_NAME_TO_VALUE.items()
+}
+"Note names without octave like 'Eb' or 'C##' to their letter and accidental value"
+
+CHORD_QUALITY_TO_SEMITONES = {
+    "": (0, 4, 7),
+    "m": (0, 3, 7),
+    "dim": (0, 3, 6),
+    "aug": (0, 4, 8),
+    "5": (0, 7),
+    "sus2": (0, 2, 7),
+    "sus4": (0, 5, 7),
+    "6": (0, 4, 7, 9),
+    "m6": (0, 3, 7, 9),
+    "7": (0, 4, 7, 10),
+    "maj7": (0, 4, 7, 11),
+    "m7": (0, 3, 7, 10),
+    "mM7": (0, 3, 7, 11),
+    "dim7": (0, 3, 6, 9),
+    "m7b5": (0, 3, 6, 10),
+    "aug7": (0, 4, 8, 10),
+    "7sus4": (0, 5, 7, 10),
+    "add9": (0, 4, 7, 14),
+    "9": (0, 4, 7, 10, 14),
+    "maj9": (0, 4, 7, 11, 14),
+    "m9": (0, 3, 7, 10, 14),
+}
+"Chord symbol suffixes to the semitones of the chord tones above the root, '' is a major triad"
+
+CHORD_QUALITY_ALIASES = {
+    "M": "",
+    "maj": "",
+    "min": "m",
+    "-": "m",
+    "+": "aug",
+    "o": "dim",
+    "sus": "sus4",
+    "M7": "maj7",
+    "min7": "m7",
+    "-7": "m7",
+    "mMaj7": "mM7",
+    "o7": "dim7",
+    "ø": "m7b5",
+    "ø7": "m7b5",
+    "+7": "aug7",
+    "M9": "maj9",
+    "min9": "m9",
+}
+"Alternative chord symbol suffixes to their name in `CHORD_QUALITY_TO_SEMITONES`"
+
+CHORD_QUALITY_TO_INTERVAL_NAMES = {
+    "": ("P1", "M3", "P5"),
+    "m": ("P1", "m3", "P5"),
+    "dim": ("P1", "m3", "d5"),
+    "aug": ("P1", "M3", "A5"),
+    "5": ("P1", "P5"),
+    "sus2": ("P1", "M2", "P5"),
+    "sus4": ("P1", "P4", "P5"),
+    "6": ("P1", "M3", "P5", "M6"),
+    "m6": ("P1", "m3", "P5", "M6"),
+    "7": ("P1", "M3", "P5", "m7"),
+    "maj7": ("P1", "M3", "P5", "M7"),
+    "m7": ("P1", "m3", "P5", "m7"),
+    "mM7": ("P1", "m3", "P5", "M7"),
+    "dim7": ("P1", "m3", "d5", "d7"),
+    "m7b5": ("P1", "m3", "d5", "m7"),
+    "aug7": ("P1", "M3", "A5", "m7"),
+    "7sus4": ("P1", "P4", "P5", "m7"),
+    "add9": ("P1", "M3", "P5", "M9"),
+    "9": ("P1", "M3", "P5", "m7", "M9"),
+    "maj9": ("P1", "M3", "P5", "M7", "M9"),
+    "m9": ("P1", "m3", "P5", "m7", "M9"),
+}
+"Chord symbol suffixes to the interval names spelling the chord tones, so 'dim7' ends on a diminished seventh"
+
 NOTE_DEFAULT_OCTAVE: int = 4
 
 SEMITONES_PER_OCTAVE: int = 12
 
+CENTS_PER_SEMITONE: int = 100
+
+CENTS_PER_OCTAVE: int = CENTS_PER_SEMITONE * SEMITONES_PER_OCTAVE
+
+CENTS_PRECISION: int = 9
+"Decimal places of cents that `Cents` equality, ordering and hashing take into account"
+
+PITCH_CLASS_MASK_ALL: int = (1 << SEMITONES_PER_OCTAVE) - 1
+"Pitch class set containing all 12 pitch classes"
+
 NOTE_NAME_RE: re.Pattern = re.compile(r"^([CDEFGAB])(#{1,2}|b{1,2})?([0-9]+)?$")
 
 INTERVAL_NAME_RE: re.Pattern = re.compile(r"^([mMdAP])([0-9]+)$")
 
 C0_FREQUENCY: int = 16.351597831287375  # A = 440
 "The frequency for C0 in A4=440Hz"
+
+INTERVAL_PITCH_CLASS_RATIOS: tuple[float, ...] = tuple(
+    (2 ** (1 / SEMITONES_PER_OCTAVE)) ** i for i in range(SEMITONES_PER_OCTAVE)
+)
+"The 12TET frequency ratios of the intervals within an octave, compound intervals add a power of two"
+
+NOTE_PITCH_CLASS_FREQUENCIES: tuple[float, ...] = tuple(C0_FREQUENCY * ratio for ratio in INTERVAL_PITCH_CLASS_RATIOS)
+"The frequencies of the 12 notes of octave 0, other octaves are found by scaling by a power of two"
+
+TUNING_DEFAULT_REFERENCE: float = 440.0
+"Default frequency of the reference note A4 of a `Tuning` in hertz"
+
+TUNING_REFERENCE_SEMITONE: int = 57
+"Semitone from C0 of the reference note A4 of a `Tuning`"
+
+TUNING_LOWEST_SEMITONE: int = -12
+"Lowest semitone covered by `Tuning` frequency tables, C-1 which is MIDI note 0"
+
+TUNING_HIGHEST_SEMITONE: int = 115
+"Highest semitone covered by `Tuning` frequency tables, G9 which is MIDI note 127"
+
+TUNING_JUST_RATIOS: tuple[tuple[int, int], ...] = (
+    (1, 1),
+    (16, 15),
+    (9, 8),
+    (6, 5),
+    (5, 4),
+    (4, 3),
+    (45, 32),
+    (3, 2),
+    (8, 5),
+    (5, 3),
+    (9, 5),
+    (15, 8),
+)
+"5-limit just intonation frequency ratios of the 12 pitch classes above the tonic"
+
+TUNING_PYTHAGOREAN_RATIOS: tuple[tuple[int, int], ...] = (
+    (1, 1),
+    (256, 243),
+    (9, 8),
+    (32, 27),
+    (81, 64),
+    (4, 3),
+    (729, 512),
+    (3, 2),
+    (128, 81),
+    (27, 16),
+    (16, 9),
+    (243, 128),
+)
+"Pythagorean frequency ratios of the 12 pitch classes above the tonic, stacked pure fifths with the wolf at the tritone"
+
+MIDI_NOTE_OFFSET: int = 12
+"MIDI note number of C0, a MIDI note number is the semitone from C0 plus this offset"
+
+MIDI_DEFAULT_TICKS_PER_BEAT: int = 480
+"Default time resolution of written MIDI files in ticks per quarter note"
+
+MIDI_DEFAULT_TEMPO: int = 500000
+"Default MIDI tempo in microseconds per quarter note, 120 beats per minute"
+
+MIDI_DEFAULT_VELOCITY: int = 64
+"Default velocity of written MIDI notes"
+
+KEY_PROFILE_MAJOR: tuple[float, ...] = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+"Krumhansl-Kessler probe tone ratings of the 12 pitch classes above the tonic of a major key"
+
+KEY_PROFILE_MINOR: tuple[float, ...] = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+"Krumhansl-Kessler probe tone ratings of the 12 pitch classes above the tonic of a minor key"
+
+KEY_DETECTOR_DEFAULT_WINDOW: int = 32
+"Default number of most recent notes `KeyDetector` estimates the key from"
+
+PROFILE_ENVIRONMENT_VARIABLE: str = "PYCHORD_PROFILE"
+"Environment variable that profiles the value classes for the whole run and prints a report at exit when set"
+
+SET_CLASS_FORTE_ORDER: dict[int, str] = {
+    3: "012 013 014 015 016 024 025 026 027 036 037 048",
+    4: (
+        "0123 0124 0134 0125 0126 0127 0145 0156 0167 0235 "
+        "0135 0236 0136 0237 0146 0157 0347 0147 0148 0158 "
+        "0246 0247 0257 0248 0268 0358 0258 0369 0137"
+    ),
+    5: (
+        "01234 01235 01245 01236 01237 01256 01267 02346 01246 01346 "
+        "02347 01356 01248 01257 01268 01347 01348 01457 01367 01378 "
+        "01458 01478 02357 01357 02358 02458 01358 02368 01368 01468 "
+        "01369 01469 02468 02469 02479 01247 03458 01258"
+    ),
+    6: (
+        "012345 012346 012356 012456 012367 012567 012678 023457 012357 013457 "
+        "012457 012467 013467 013458 012458 014568 012478 012578 013478 014589 "
+        "023468 012468 023568 013468 013568 013578 013469 013569 013689 013679 "
+        "013589 024579 023579 013579 02468T 012347 012348 012378 023458 012358 "
+        "012368 012369 012568 012569 023469 012469 012479 012579 013479 014679"
+    ),
+}
+"A member of each set class of 3 to 6 pitch classes in Forte number order, T is 10, larger classes follow complements"
+
+MODE_NAMES: dict[str, tuple[str, ...]] = {
+    "024579E": ("Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"),
+    "023579E": (
+        "Melodic Minor",
+        "Dorian b2",
+        "Lydian Augmented",
+        "Lydian Dominant",
+        "Mixolydian b6",
+        "Locrian #2",
+        "Altered",
+    ),
+    "023578E": (
+        "Harmonic Minor",
+        "Locrian #6",
+        "Ionian #5",
+        "Dorian #4",
+        "Phrygian Dominant",
+        "Lydian #2",
+        "Altered bb7",
+    ),
+    "024578E": (
+        "Harmonic Major",
+        "Dorian b5",
+        "Phrygian b4",
+        "Lydian b3",
+        "Mixolydian b2",
+        "Lydian Augmented #2",
+        "Locrian bb7",
+    ),
+    "014578E": (
+        "Double Harmonic Major",
+        "Lydian #2 #6",
+        "Ultraphrygian",
+        "Hungarian Minor",
+        "Oriental",
+        "Ionian #2 #5",
+        "Locrian bb3 bb7",
+    ),
+    "02479": (
+        "Major Pentatonic",
+        "Suspended Pentatonic",
+        "Blues Minor Pentatonic",
+        "Blues Major Pentatonic",
+        "Minor Pentatonic",
+    ),
+    "03567T": ("Blues",),
+    "02468T": ("Whole Tone",),
+    "03478E": ("Augmented", "Augmented Inverse"),
+    "0134679T": ("Half Whole Diminished", "Whole Half Diminished"),
+    "0123456789TE": ("Chromatic",),
+}
+"Pitch classes of parent scales, T is 10 and E is 11, to the names of their modes on each degree, rotations repeating a set are skipped"
+
+MODE_NAME_ALIASES: dict[str, str] = {
+    "Major": "Ionian",
+    "Natural Minor": "Aeolian",
+    "Minor": "Aeolian",
+    "Jazz Minor": "Melodic Minor",
+    "Super Locrian": "Altered",
+    "Acoustic": "Lydian Dominant",
+    "Octatonic": "Half Whole Diminished",
+}
+"Alternative mode names to their name in `MODE_NAMES`"
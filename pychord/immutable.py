@@ -0,0 +1,26 @@
+class Immutable:
+    """
+    Base of the pychord value types, instances use `__slots__` and cannot be changed once constructed
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __getstate__(self) -> tuple:
+        # Same layout as the default state of slotted objects, which pickle protocols 0 and 1 do not provide
+        return None, {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: tuple):
+        # pickle and copy restore slots through setattr unless the class restores them itself
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
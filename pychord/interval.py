@@ -1,15 +1,76 @@
-from fractions import Fraction
-from typing import Union
+from functools import lru_cache
+from math import ldexp
+from numbers import Rational
+from typing import TYPE_CHECKING, Union
 
+from pychord.cache import InternCache, Interned
 from pychord.const import *
-from pychord.ratio import Ratio, OCTAVE_RATIO, SEMITONE_RATIO
+from pychord.lazy import lazy_constants
+from pychord.pitchclass import mask_pitch_classes
+from pychord.ratio import Cents, Ratio
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+__all__ = [
+    "Interval",
+    "mask_intervals",
+    "MINOR_SECOND",
+    "SEMITONE",
+    "MAJOR_SECOND",
+    "WHOLETONE",
+    "MINOR_THIRD",
+    "MAJOR_THIRD",
+    "PERFECT_FOURTH",
+    "AUGMENTED_FOURTH",
+    "DIMINISHED_FIFTH",
+    "TRITONE",
+    "PERFECT_FIFTH",
+    "MINOR_SIXTH",
+    "MAJOR_SIXTH",
+    "MINOR_SEVENTH",
+    "MAJOR_SEVENTH",
+    "OCTAVE",
+]
+
+
+def _parse_interval_name(name: str) -> tuple[str, int, int]:
+    """
+    Split an interval name like "m10" into its quality, quantity and number of semitones with table lookups
+    """
+
+    quality = name[:1]
+    quantity = name[1:]
+
+    if not (quantity.isascii() and quantity.isdigit()):
+        raise ValueError(f"Invalid 12TET interval name: '{name}'!")
+
+    quantity = int(quantity)
+    octave = 0
+    offset_quantity = quantity
+
+    if offset_quantity > 7:
+        octave = (quantity - 1) // 7
+        offset_quantity = ((quantity - 1) % 7) + 1
 
+    semitones = INTERVAL_NAME_TO_VALUE.get(f"{quality}{offset_quantity}")
 
-class Interval(Ratio):
+    if semitones is None:
+        raise ValueError(f"Invalid 12TET interval name: '{name}'!")
+
+    return quality, quantity, octave * SEMITONES_PER_OCTAVE + semitones
+
+
+class Interval(Ratio, metaclass=Interned):
     """
     Describes a musical interval as a ratio quantized to a 12TET semitone
     """
 
+    __slots__ = ("semitones", "quality", "quantity")
+
+    cache: InternCache = InternCache()
+    "Opt-in cache of shared `Interval` instances keyed by constructor argument, see `InternCache.enable`"
+
     semitones: int
     "Integer number of 12TET semitones"
 
@@ -27,47 +88,67 @@ class Interval(Ratio):
         assert isinstance(interval, (int, str))
 
         if isinstance(interval, int):
-            self.semitones = interval
+            semitones = interval
 
-            abs_semitones = abs(self.semitones)
+            abs_semitones = abs(semitones)
 
-            self.quality = INTERVAL_VALUE_TO_COMPONENTS[abs_semitones % SEMITONES_PER_OCTAVE][0]
+            quality = INTERVAL_VALUE_TO_COMPONENTS[abs_semitones % SEMITONES_PER_OCTAVE][0]
 
-            self.quantity = INTERVAL_VALUE_TO_COMPONENTS[abs_semitones % SEMITONES_PER_OCTAVE][1] + (
+            quantity = INTERVAL_VALUE_TO_COMPONENTS[abs_semitones % SEMITONES_PER_OCTAVE][1] + (
                 7 * (abs_semitones // SEMITONES_PER_OCTAVE)
             )
 
         elif isinstance(interval, str):
-            m = INTERVAL_NAME_RE.match(interval)
+            quality, quantity, semitones = _parse_interval_name(interval)
 
-            assert m is not None, f"Invalid 12TET interval name: '{interval}'!"
+        object.__setattr__(self, "semitones", semitones)
+        object.__setattr__(self, "quality", quality)
+        object.__setattr__(self, "quantity", quantity)
 
-            self.quality = m.group(1)
-            self.quantity = int(m.group(2))
-            octave = 0
-            offset_quantity = self.quantity
+        # Table lookup and an exact power of two scaling, the same floats as composing SEMITONE_RATIO and OCTAVE_RATIO
+        octaves, pitch_class = divmod(abs(semitones), SEMITONES_PER_OCTAVE)
+        ratio = ldexp(INTERVAL_PITCH_CLASS_RATIOS[pitch_class], octaves)
+        super().__init__(ratio if semitones >= 0 else 1.0 / ratio)
 
-            if offset_quantity > 7:
-                octave = (self.quantity - 1) // 7
-                offset_quantity = ((self.quantity - 1) % 7) + 1
+    def __repr__(self) -> str:
+        return f"[Interval {self.name()} ({self.ratio:.4f})]"
 
-            offset_name = f"{self.quality}{offset_quantity}"
+    def __str__(self) -> str:
+        return self.__repr__()
 
-            if offset_name not in INTERVAL_NAME_TO_VALUE:
-                raise ValueError(f"Invalid 12TET interval name: '{interval}'!")
+    def __eq__(self, other: Ratio):
+        if isinstance(other, Interval):
+            return self.semitones == other.semitones
+        return super().__eq__(other)
 
-            self.semitones = octave * SEMITONES_PER_OCTAVE + INTERVAL_NAME_TO_VALUE[offset_name]
+    def __ne__(self, other: Ratio):
+        if isinstance(other, Interval):
+            return self.semitones != other.semitones
+        return super().__ne__(other)
 
-        interval = (SEMITONE_RATIO * (abs(self.semitones) % SEMITONES_PER_OCTAVE)) + (
-            OCTAVE_RATIO * (abs(self.semitones) // SEMITONES_PER_OCTAVE)
-        )
-        super().__init__((interval if self.semitones >= 0 else -interval).ratio)
+    def __hash__(self) -> int:
+        # Equal semitones give equal ratios, and a `Ratio` of the same ratio compares equal
+        return hash(self.ratio)
 
-    def __repr__(self) -> str:
-        return f"[Interval {self.name()} ({self.ratio:.4f})]"
+    def __ge__(self, other: Ratio) -> bool:
+        if isinstance(other, Interval):
+            return self.semitones >= other.semitones
+        return super().__ge__(other)
 
-    def __str__(self) -> str:
-        return self.__repr__()
+    def __gt__(self, other: Ratio) -> bool:
+        if isinstance(other, Interval):
+            return self.semitones > other.semitones
+        return super().__gt__(other)
+
+    def __le__(self, other: Ratio) -> bool:
+        if isinstance(other, Interval):
+            return self.semitones <= other.semitones
+        return super().__le__(other)
+
+    def __lt__(self, other: Ratio) -> bool:
+        if isinstance(other, Interval):
+            return self.semitones < other.semitones
+        return super().__lt__(other)
 
     def __add__(self, other: Union["Interval", Ratio]) -> Union["Interval", Ratio]:
         if not isinstance(other, (Interval, Ratio)):
@@ -87,8 +168,8 @@ class Interval(Ratio):
         elif isinstance(other, Ratio):
             return Ratio(self.ratio) - other
 
-    def __mul__(self, other: Union[int, float, Fraction]) -> Union["Interval", Ratio]:
-        if not isinstance(other, (int, float, Fraction)):
+    def __mul__(self, other: Union[int, float, "Fraction"]) -> Union["Interval", Ratio]:
+        if not isinstance(other, (int, float, Rational)):
             return NotImplemented
 
         if isinstance(other, int):
@@ -98,9 +179,23 @@ class Interval(Ratio):
 
     def __neg__(self) -> "Ratio":
         """
-        Inversion of `Interval` e.g. up an octave becomes down an octave
+        Inversion of `Interval` e.g. up an octave becomes down an octave, keeping its quality and quantity
         """
-        return Interval(-self.semitones)
+        return self._build(-self.semitones, self.quality, self.quantity)
+
+    @classmethod
+    def _build(cls, semitones: int, quality: str, quantity: int) -> "Interval":
+        # Allocate and fill a new `Interval` bypassing `__init__`, the profiler counts instances here too
+        interval = object.__new__(cls)
+        object.__setattr__(interval, "semitones", semitones)
+        object.__setattr__(interval, "quality", quality)
+        object.__setattr__(interval, "quantity", quantity)
+
+        octaves, pitch_class = divmod(abs(semitones), SEMITONES_PER_OCTAVE)
+        ratio = ldexp(INTERVAL_PITCH_CLASS_RATIOS[pitch_class], octaves)
+        Ratio.__init__(interval, ratio if semitones >= 0 else 1.0 / ratio)
+
+        return interval
 
     def compliment(self) -> "Interval":
         """
@@ -114,6 +209,13 @@ class Interval(Ratio):
         """
         return f"{'-' if self.semitones < 0 else ''}{self.quality}{self.quantity}"
 
+    def cents(self) -> Cents:
+        """
+        Return the `Interval` as exact `Cents`, 100 per semitone
+        """
+
+        return Cents(CENTS_PER_SEMITONE * self.semitones)
+
     def decompound(self) -> "Interval":
         """
         Returns the same `Interval` without any octave offset
@@ -121,28 +223,43 @@ class Interval(Ratio):
         return Interval(self.semitones % SEMITONES_PER_OCTAVE)
 
 
-MINOR_SECOND = SEMITONE = Interval(1)
-
-MAJOR_SECOND = WHOLETONE = Interval(2)
-
-MINOR_THIRD = Interval(3)
-
-MAJOR_THIRD = Interval(4)
-
-PERFECT_FOURTH = Interval(5)
-
-AUGMENTED_FOURTH = Interval("A4")
-
-DIMINISHED_FIFTH = TRITONE = Interval("d5")
-
-PERFECT_FIFTH = Interval(7)
-
-MINOR_SIXTH = Interval(8)
-
-MAJOR_SIXTH = Interval(9)
-
-MINOR_SEVENTH = Interval(10)
-
-MAJOR_SEVENTH = Interval(11)
+@lru_cache(maxsize=1 << SEMITONES_PER_OCTAVE)
+def mask_intervals(mask: int) -> tuple[Interval, ...]:
+    """
+    Return the `Interval`s of a pitch class set in ascending order. Seven note sets are spelled with one interval per
+    scale degree, so the fourth degree of Lydian is A4 rather than d5, other sets use the default interval names
+    """
 
-OCTAVE = Interval(12)
+    semitones = mask_pitch_classes(mask)
+
+    if len(semitones) == 7:
+        names = [INTERVAL_DEGREE_TO_NAME.get((degree, value)) for degree, value in enumerate(semitones)]
+
+        if None not in names:
+            return tuple(Interval(name) for name in names)
+
+    return tuple(Interval(value) for value in semitones)
+
+
+# Constants are created on first access, aliases are the same object
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        "MINOR_SECOND": lambda: Interval(1),
+        "SEMITONE": lambda: __getattr__("MINOR_SECOND"),
+        "MAJOR_SECOND": lambda: Interval(2),
+        "WHOLETONE": lambda: __getattr__("MAJOR_SECOND"),
+        "MINOR_THIRD": lambda: Interval(3),
+        "MAJOR_THIRD": lambda: Interval(4),
+        "PERFECT_FOURTH": lambda: Interval(5),
+        "AUGMENTED_FOURTH": lambda: Interval("A4"),
+        "DIMINISHED_FIFTH": lambda: Interval("d5"),
+        "TRITONE": lambda: __getattr__("DIMINISHED_FIFTH"),
+        "PERFECT_FIFTH": lambda: Interval(7),
+        "MINOR_SIXTH": lambda: Interval(8),
+        "MAJOR_SIXTH": lambda: Interval(9),
+        "MINOR_SEVENTH": lambda: Interval(10),
+        "MAJOR_SEVENTH": lambda: Interval(11),
+        "OCTAVE": lambda: Interval(12),
+    },
+)
@@ -0,0 +1,143 @@
+"""
+Sliding window key detection over note streams with Krumhansl-Kessler key profiles, requires numpy
+"""
+
+from collections import deque
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from pychord.const import *
+from pychord.midi import NoteEvent
+from pychord.mode import AEOLIAN, IONIAN, Mode
+from pychord.note import Note
+
+
+def mode_profile(mode: Mode) -> np.ndarray:
+    """
+    Return the key profile of a `Mode` over the 12 pitch classes above its tonic. Ionian and Aeolian use the
+    Krumhansl-Kessler major and minor profiles, other modes weight their scale tones 1 and their tonic 2
+    """
+
+    if mode.mask == IONIAN.mask:
+        return np.array(KEY_PROFILE_MAJOR)
+    if mode.mask == AEOLIAN.mask:
+        return np.array(KEY_PROFILE_MINOR)
+
+    profile = np.array([float(mode.mask >> i & 1) for i in range(SEMITONES_PER_OCTAVE)])
+    profile[0] = 2.0
+
+    return profile
+
+
+class KeyDetector:
+    """
+    Estimates the key of the last `window` notes of a stream. The pitch class histogram of the window is updated as
+    notes enter and leave it, and every key is scored at once as the correlation of its profile with the histogram,
+    a single matrix product, so each note costs the same whatever the window size
+    """
+
+    window: int
+    "Number of most recent notes the key is estimated from"
+
+    keys: list[tuple[Note, Mode]]
+    "Candidate keys, tonics in octave `NOTE_DEFAULT_OCTAVE` from C to B for each `Mode` in turn, in the order of `scores`"
+
+    histogram: np.ndarray
+    "Total weight of each pitch class in the window"
+
+    def __init__(self, window: int = KEY_DETECTOR_DEFAULT_WINDOW, modes: Iterable[Mode] = (IONIAN, AEOLIAN)):
+        if window < 1:
+            raise ValueError(f"Invalid window {window}!")
+
+        modes = list(modes)
+
+        self.window = window
+        self.keys = [
+            (Note(tonic + SEMITONES_PER_OCTAVE * NOTE_DEFAULT_OCTAVE), mode)
+            for mode in modes
+            for tonic in range(SEMITONES_PER_OCTAVE)
+        ]
+
+        # One row per key, the mode profile rotated up to the tonic and normalized to zero mean and unit length,
+        # then the dot product with the histogram is proportional to their correlation
+        profiles = np.array(
+            [np.roll(mode_profile(mode), tonic) for mode in modes for tonic in range(SEMITONES_PER_OCTAVE)]
+        ).reshape(-1, SEMITONES_PER_OCTAVE)
+        profiles -= profiles.mean(axis=1, keepdims=True)
+        self._profiles = profiles / np.linalg.norm(profiles, axis=1, keepdims=True)
+
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"[KeyDetector window {self.window} {len(self.keys)} keys]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def reset(self):
+        """
+        Empty the window
+        """
+
+        self.histogram = np.zeros(SEMITONES_PER_OCTAVE)
+        self._notes: deque[tuple[int, float]] = deque()
+
+    def push(self, note: Union[Note, int, NoteEvent], weight: Optional[float] = None):
+        """
+        Add a `Note`, semitone or `NoteEvent` to the window, dropping the oldest note once the window is full.
+        Notes weigh 1 and `NoteEvent`s their duration unless `weight` is given
+        """
+
+        if isinstance(note, NoteEvent):
+            weight = note.duration if weight is None else weight
+            note = note.note
+
+        pitch_class = (note.semitone if isinstance(note, Note) else note) % SEMITONES_PER_OCTAVE
+        weight = 1.0 if weight is None else weight
+
+        self._notes.append((pitch_class, weight))
+        self.histogram[pitch_class] += weight
+
+        if len(self._notes) > self.window:
+            pitch_class, weight = self._notes.popleft()
+            self.histogram[pitch_class] -= weight
+
+    def scores(self) -> np.ndarray:
+        """
+        Return the correlation of each key profile with the window histogram, in the order of `keys`
+        """
+
+        centered = self.histogram - self.histogram.mean()
+        norm = np.linalg.norm(centered)
+
+        if norm == 0:
+            return np.zeros(len(self.keys))
+
+        return self._profiles @ centered / norm
+
+    def best(self) -> Optional[tuple[Note, Mode]]:
+        """
+        Return the best scoring key of the window, None while it is empty
+        """
+
+        if not self._notes:
+            return None
+
+        return self.keys[int(np.argmax(self.scores()))]
+
+    def update(self, note: Union[Note, int, NoteEvent], weight: Optional[float] = None) -> tuple[Note, Mode]:
+        """
+        `push` a note and return the best key afterwards
+        """
+
+        self.push(note, weight)
+        return self.best()
+
+    def process(self, notes: Iterable[Union[Note, int, NoteEvent]]) -> Iterator[tuple[Note, Mode]]:
+        """
+        Lazily yield the best key after each note of a stream
+        """
+
+        for note in notes:
+            yield self.update(note)
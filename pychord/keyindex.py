@@ -0,0 +1,148 @@
+from typing import Iterable, Optional, Union
+
+from pychord.const import *
+from pychord import mode as _modes
+from pychord.lazy import lazy_constants
+from pychord.mode import Mode
+from pychord.note import Note
+from pychord.pitchclass import pitch_class_mask, rotate_mask
+from pychord.scale import Scale
+
+__all__ = ["KeyIndex", "KEY_INDEX"]
+
+
+class KeyIndex:
+    """
+    Reverse index from pitch class sets to the keys, pairs of a tonic `Note` and a `Mode`, whose scales contain them.
+    The lookup tables cover all 4096 pitch class sets and are built on first use
+    """
+
+    modes: list[Mode]
+    "Registered `Mode`s, in the order keys are reported"
+
+    def __init__(self, modes: Iterable[Mode] = ()):
+        self.modes = []
+        self._keys = None
+        self._containing = None
+        self._best = None
+
+        for mode in modes:
+            self.register(mode)
+
+    def __repr__(self) -> str:
+        return f"[KeyIndex {len(self.modes)} modes]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def register(self, mode: Mode):
+        """
+        Add a `Mode` to the index, the tables are rebuilt on the next lookup
+        """
+
+        if not isinstance(mode, Mode):
+            raise TypeError()
+
+        if mode in self.modes:
+            return
+
+        self.modes.append(mode)
+        self._keys = None
+        self._containing = None
+        self._best = None
+
+    def keys(self) -> list[tuple[Note, Mode]]:
+        """
+        Return every key of the index, tonics in octave `NOTE_DEFAULT_OCTAVE` from C to B for each `Mode` in turn
+        """
+
+        if self._keys is None:
+            self._keys = [
+                (Note(tonic + SEMITONES_PER_OCTAVE * NOTE_DEFAULT_OCTAVE), mode)
+                for mode in self.modes
+                for tonic in range(SEMITONES_PER_OCTAVE)
+            ]
+
+        return self._keys
+
+    def keys_containing(self, notes: Union[Iterable[Union[Note, int]], Scale]) -> tuple[tuple[Note, Mode], ...]:
+        """
+        Return every key whose scale contains all the pitch classes of `notes`
+        """
+
+        if self._containing is None:
+            self._build_containing()
+
+        return self._containing[self._mask(notes)]
+
+    def best_key(self, notes: Union[Iterable[Union[Note, int]], Scale]) -> Optional[tuple[Note, Mode]]:
+        """
+        Return the key whose scale contains the most pitch classes of `notes`.
+        Ties go to keys whose tonic is one of the notes, then to the earliest registered `Mode`, then to the lowest tonic
+        """
+
+        if self._best is None:
+            self._build_best()
+
+        return self._best[self._mask(notes)]
+
+    def _build_containing(self):
+        containing = [[] for _ in range(1 << SEMITONES_PER_OCTAVE)]
+
+        for key, mask in zip(self.keys(), self._key_masks()):
+            # Walk every subset of the key mask
+            subset = mask
+            while True:
+                containing[subset].append(key)
+                if subset == 0:
+                    break
+                subset = (subset - 1) & mask
+
+        self._containing = [tuple(keys) for keys in containing]
+
+    def _build_best(self):
+        keys = self.keys()
+        masks = self._key_masks()
+        tonics = [1 << (tonic.semitone % SEMITONES_PER_OCTAVE) for tonic, _ in keys]
+        best = [None] * (1 << SEMITONES_PER_OCTAVE)
+
+        for subset in range(1, 1 << SEMITONES_PER_OCTAVE):
+            best_score = None
+
+            for index in range(len(keys)):
+                score = ((subset & masks[index]).bit_count(), bool(subset & tonics[index]))
+
+                if best_score is None or score > best_score:
+                    best_score = score
+                    best[subset] = keys[index]
+
+        self._best = best
+
+    def _key_masks(self) -> list[int]:
+        return [rotate_mask(mode.mask, -tonic) for mode in self.modes for tonic in range(SEMITONES_PER_OCTAVE)]
+
+    @staticmethod
+    def _mask(notes: Union[Iterable[Union[Note, int]], Scale]) -> int:
+        if isinstance(notes, Scale):
+            return notes.mask
+
+        return pitch_class_mask(note.semitone if isinstance(note, Note) else note for note in notes)
+
+
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        # Default `KeyIndex` over the seven diatonic modes
+        "KEY_INDEX": lambda: KeyIndex(
+            [
+                _modes.IONIAN,
+                _modes.DORIAN,
+                _modes.PHRYGIAN,
+                _modes.LYDIAN,
+                _modes.MIXOLYDIAN,
+                _modes.AEOLIAN,
+                _modes.LOCRIAN,
+            ]
+        ),
+    },
+)
@@ -0,0 +1,26 @@
+from typing import Any, Callable
+
+
+def lazy_constants(namespace: dict[str, Any], factories: dict[str, Callable[[], Any]]):
+    """
+    Return a module `__getattr__` and `__dir__` that create the constants in `factories` on first access.
+    Created values are stored in the module namespace, so later lookups are plain global reads,
+    factories can get other lazy constants of the module by calling its `__getattr__`
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in namespace:
+            return namespace[name]
+
+        factory = factories.get(name)
+
+        if factory is None:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+
+        value = namespace[name] = factory()
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(factories))
+
+    return __getattr__, __dir__
@@ -0,0 +1,349 @@
+"""
+Standard MIDI File reading and writing with the standard library only.
+Files are memory mapped and parsed through `memoryview`s without copying, note events are produced lazily
+"""
+
+import mmap
+import os
+from array import array
+from heapq import heappop, heappush, merge
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Union
+
+from pychord.const import *
+from pychord.note import Note
+from pychord.scale import Scale
+
+
+class NoteEvent(NamedTuple):
+    """
+    A note played in a MIDI track, times are in ticks, see `MidiFile.ticks_per_beat`
+    """
+
+    onset: int
+    "Tick the note starts on"
+
+    duration: int
+    "Length of the note in ticks"
+
+    note: Note
+    "The `Note` played"
+
+    velocity: int = MIDI_DEFAULT_VELOCITY
+    "MIDI velocity from 1 to 127"
+
+    channel: int = 0
+    "MIDI channel from 0 to 15"
+
+    track: int = 0
+    "Index of the track the note comes from"
+
+
+def _read_variable(data: memoryview, position: int) -> tuple[int, int]:
+    # Variable length quantity, 7 bits per byte with the high bit set on all but the last byte
+    value = 0
+
+    while True:
+        byte = data[position]
+        position += 1
+        value = (value << 7) | (byte & 0x7F)
+
+        if byte < 0x80:
+            return value, position
+
+
+def _write_variable(buffer: bytearray, value: int):
+    if not 0 <= value <= 0x0FFFFFFF:
+        raise ValueError(f"Invalid MIDI variable length quantity {value}!")
+
+    chunk = bytearray([value & 0x7F])
+    value >>= 7
+
+    while value:
+        chunk.append(0x80 | (value & 0x7F))
+        value >>= 7
+
+    buffer += chunk[::-1]
+
+
+class MidiFile:
+    """
+    A Standard MIDI File opened for reading. Paths are memory mapped so that scanning large files needs constant memory,
+    `bytes` and other buffers are read in place
+    """
+
+    format: int
+    "SMF format, 0 for a single track, 1 for simultaneous tracks, 2 for independent tracks"
+
+    track_count: int
+    "Number of tracks declared in the header"
+
+    ticks_per_beat: int
+    "Time resolution in ticks per quarter note"
+
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray, memoryview]):
+        self._mmap = None
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            source = self._mmap
+
+        self._data = memoryview(source).cast("B")
+
+        if len(self._data) < 14 or self._data[:4] != b"MThd":
+            self.close()
+            raise ValueError("Not a Standard MIDI File!")
+
+        length = int.from_bytes(self._data[4:8], "big")
+        self.format = int.from_bytes(self._data[8:10], "big")
+        self.track_count = int.from_bytes(self._data[10:12], "big")
+        division = int.from_bytes(self._data[12:14], "big")
+
+        if division & 0x8000:
+            self.close()
+            raise ValueError("SMPTE time division is not supported!")
+
+        self.ticks_per_beat = division
+        self._tracks_start = 8 + length
+
+    def __repr__(self) -> str:
+        return f"[MidiFile format {self.format} {self.track_count} tracks {self.ticks_per_beat} ticks per beat]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __enter__(self) -> "MidiFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Release the file, generators still reading it keep the mapping alive until they are finished
+        """
+
+        self._data.release()
+
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+
+    def tracks(self) -> list[memoryview]:
+        """
+        Return the raw data of each track chunk as a `memoryview` into the file, unknown chunks are skipped
+        """
+
+        tracks = []
+        position = self._tracks_start
+
+        while position + 8 <= len(self._data):
+            length = int.from_bytes(self._data[position + 4 : position + 8], "big")
+
+            if self._data[position : position + 4] == b"MTrk":
+                tracks.append(self._data[position + 8 : position + 8 + length])
+
+            position += 8 + length
+
+        return tracks
+
+    def events(self, tracks: Optional[Iterable[int]] = None) -> Iterator[NoteEvent]:
+        """
+        Lazily yield the `NoteEvent`s of the given track indices, or of every track, merged in onset order.
+        Only the notes sounding at once are held in memory
+        """
+
+        data = self.tracks()
+
+        if tracks is None:
+            tracks = range(len(data))
+
+        return merge(*(self._track_events(data[track], track) for track in tracks), key=lambda event: event.onset)
+
+    def _track_events(self, data: memoryview, track: int) -> Iterator[NoteEvent]:
+        position = 0
+        tick = 0
+        status = 0
+        playing = {}
+        finished = []
+        order = 0
+
+        try:
+            while position < len(data):
+                delta, position = _read_variable(data, position)
+                tick += delta
+
+                if data[position] >= 0x80:
+                    if data[position] == 0xFF:
+                        kind = data[position + 1]
+                        length, position = _read_variable(data, position + 2)
+                        position += length
+                        if kind == 0x2F:
+                            break
+                        continue
+
+                    if data[position] in (0xF0, 0xF7):
+                        length, position = _read_variable(data, position + 1)
+                        position += length
+                        continue
+
+                    status = data[position]
+                    position += 1
+                elif not status:
+                    raise ValueError(f"Running status without a status byte in track {track}!")
+
+                kind = status & 0xF0
+                channel = status & 0x0F
+
+                if kind in (0xC0, 0xD0):
+                    position += 1
+                    continue
+
+                key = data[position]
+                velocity = data[position + 1]
+                position += 2
+
+                if kind == 0x90 and velocity:
+                    playing.setdefault((channel, key), []).append((tick, velocity))
+                    continue
+
+                if kind not in (0x80, 0x90) or (channel, key) not in playing:
+                    continue
+
+                # Repeated note ons of a key are ended first in first out
+                starts = playing[(channel, key)]
+                onset, velocity = starts.pop(0)
+                if not starts:
+                    del playing[(channel, key)]
+
+                event = NoteEvent(onset, tick - onset, Note(key - MIDI_NOTE_OFFSET), velocity, channel, track)
+                heappush(finished, (onset, order, event))
+                order += 1
+
+                # Hold back finished notes until every note starting before them has finished too
+                first_playing = min((starts[0][0] for starts in playing.values()), default=None)
+                while finished and (first_playing is None or finished[0][0] <= first_playing):
+                    yield heappop(finished)[2]
+        except IndexError:
+            raise ValueError(f"Truncated MIDI track {track}!") from None
+
+        # Notes still playing at the end of the track last until its end
+        for (channel, key), starts in playing.items():
+            for onset, velocity in starts:
+                event = NoteEvent(onset, tick - onset, Note(key - MIDI_NOTE_OFFSET), velocity, channel, track)
+                heappush(finished, (onset, order, event))
+                order += 1
+
+        while finished:
+            yield heappop(finished)[2]
+
+
+def read_midi(
+    source: Union[str, os.PathLike, bytes, bytearray, memoryview], tracks: Optional[Iterable[int]] = None
+) -> Iterator[NoteEvent]:
+    """
+    Lazily yield the `NoteEvent`s of a MIDI file in onset order, see `MidiFile.events`
+    """
+
+    with MidiFile(source) as midi:
+        yield from midi.events(tracks)
+
+
+def write_midi(
+    target: Union[str, os.PathLike, BinaryIO],
+    notes: Union[Iterable[Union[NoteEvent, Note]], Scale],
+    ticks_per_beat: int = MIDI_DEFAULT_TICKS_PER_BEAT,
+    tempo: int = MIDI_DEFAULT_TEMPO,
+    velocity: int = MIDI_DEFAULT_VELOCITY,
+):
+    """
+    Write a single track MIDI file to a path or binary file. `notes` can be `NoteEvent`s, or `Note`s and `Scale`s
+    which are played one after the other for a beat each at `velocity`
+    """
+
+    if not 1 <= ticks_per_beat <= 0x7FFF:
+        raise ValueError(f"Invalid MIDI ticks per beat {ticks_per_beat}!")
+    if not 1 <= tempo < 1 << 24:
+        raise ValueError(f"Invalid MIDI tempo {tempo}!")
+
+    if isinstance(notes, Scale):
+        notes = notes.notes
+
+    messages = []
+    tick = 0
+
+    for item in notes:
+        if isinstance(item, Note):
+            item = NoteEvent(tick, ticks_per_beat, item, velocity)
+            tick += ticks_per_beat
+        elif not isinstance(item, NoteEvent):
+            raise TypeError()
+
+        key = item.note.semitone + MIDI_NOTE_OFFSET
+
+        if not 0 <= key <= 127:
+            raise ValueError(f"{item.note} is outside of the MIDI note range!")
+        if item.onset < 0 or item.duration < 0:
+            raise ValueError(f"Invalid onset {item.onset} or duration {item.duration}!")
+        if not 0 <= item.channel <= 15:
+            raise ValueError(f"Invalid MIDI channel {item.channel}!")
+        # A note on with velocity 0 is a note off, the note would be dropped
+        if not 1 <= item.velocity <= 127:
+            raise ValueError(f"Invalid MIDI velocity {item.velocity}!")
+
+        # Note offs sort before note ons on the same tick so repeated notes do not cut each other off
+        messages.append((item.onset + item.duration, 0, bytes([0x80 | item.channel, key, 0])))
+        messages.append((item.onset, 1, bytes([0x90 | item.channel, key, item.velocity])))
+
+    messages.sort(key=lambda message: message[:2])
+
+    track = bytearray(b"\x00\xff\x51\x03")
+    track += tempo.to_bytes(3, "big")
+    tick = 0
+
+    for message_tick, _, message in messages:
+        _write_variable(track, message_tick - tick)
+        track += message
+        tick = message_tick
+
+    track += b"\x00\xff\x2f\x00"
+
+    data = bytearray(b"MThd\x00\x00\x00\x06\x00\x00\x00\x01")
+    data += ticks_per_beat.to_bytes(2, "big")
+    data += b"MTrk"
+    data += len(track).to_bytes(4, "big")
+    data += track
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            f.write(data)
+    else:
+        target.write(data)
+
+
+def notes_to_midi(notes: Iterable[Union[Note, int]]) -> array:
+    """
+    Convert `Note`s or semitones from C0 in bulk to MIDI note numbers in a byte `array`
+    """
+
+    numbers = array("B")
+
+    for note in notes:
+        number = (note.semitone if isinstance(note, Note) else note) + MIDI_NOTE_OFFSET
+
+        if not 0 <= number <= 127:
+            raise ValueError(f"{note} is outside of the MIDI note range!")
+
+        numbers.append(number)
+
+    return numbers
+
+
+def midi_to_notes(numbers: Iterable[int]) -> list[Note]:
+    """
+    Convert MIDI note numbers in bulk to `Note`s
+    """
+
+    return [Note(number - MIDI_NOTE_OFFSET) for number in numbers]
@@ -1,20 +1,37 @@
-from pychord.interval import Interval
+from typing import TYPE_CHECKING, Union
+
+from pychord.const import *
+from pychord.immutable import Immutable
+from pychord.interval import Interval, mask_intervals
+from pychord.lazy import lazy_constants
 from pychord.note import Note
+from pychord.pitchclass import pitch_class_mask, rotate_mask
 from pychord.scale import Scale
 
+if TYPE_CHECKING:
+    from pychord.catalog import CatalogEntry
+
+__all__ = ["Mode", "IONIAN", "DORIAN", "PHRYGIAN", "LYDIAN", "MIXOLYDIAN", "AEOLIAN", "LOCRIAN"]
 
-class Mode:
+
+class Mode(Immutable):
     """
     A musical `Mode` consisting of intervals making up an abstract tonicless `Scale`
     """
 
-    intervals: list[Interval]
-    "List of `Interval`'s from the tonic of the `Mode`"
+    __slots__ = ("intervals", "mask")
+
+    intervals: tuple[Interval, ...]
+    "Tuple of `Interval`'s from the tonic of the `Mode`"
 
-    def __init__(self, intervals: list[Interval]):
-        if not isinstance(intervals, list):
+    mask: int
+    "12-bit pitch class set of the `Mode`, bit `i` is set when an interval is `i` semitones modulo an octave"
+
+    def __init__(self, intervals: Union[list[Interval], tuple[Interval, ...]]):
+        if not isinstance(intervals, (list, tuple)):
             raise TypeError()
-        self.intervals = intervals
+        object.__setattr__(self, "intervals", tuple(intervals))
+        object.__setattr__(self, "mask", pitch_class_mask(interval.semitones for interval in self.intervals))
 
     def __repr__(self) -> str:
         return f"[Mode {' '.join([i.name() for i in self.intervals])}]"
@@ -23,8 +40,10 @@ class Mode:
         return self.__repr__()
 
     def __eq__(self, other: "Mode"):
+        # Equal intervals have equal masks, comparing them first rejects most other modes at once
         return (
             isinstance(other, Mode)
+            and self.mask == other.mask
             and len(self.intervals) == len(other.intervals)
             and all(x == y for x, y in zip(self.intervals, other.intervals))
         )
@@ -32,10 +51,31 @@ class Mode:
     def __ne__(self, other: "Mode"):
         return (
             not isinstance(other, Mode)
+            or self.mask != other.mask
             or len(self.intervals) != len(other.intervals)
             or any(x != y for x, y in zip(self.intervals, other.intervals))
         )
 
+    def __hash__(self) -> int:
+        return hash(tuple(interval.semitones for interval in self.intervals))
+
+    def __contains__(self, interval: Union[Interval, int]) -> bool:
+        if isinstance(interval, Interval):
+            interval = interval.semitones
+        elif not isinstance(interval, int):
+            return False
+        return bool(self.mask >> (interval % SEMITONES_PER_OCTAVE) & 1)
+
+    def __or__(self, other: "Mode") -> "Mode":
+        if not isinstance(other, Mode):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: "Mode") -> "Mode":
+        if not isinstance(other, Mode):
+            return NotImplemented
+        return self.intersection(other)
+
     def __lshift__(self, other: int) -> "Mode":
         if not isinstance(other, int):
             return NotImplemented
@@ -56,6 +96,9 @@ class Mode:
 
         steps = steps % len(self.intervals)
 
+        if self._is_simple():
+            return Mode.from_mask(rotate_mask(self.mask, self.intervals[steps].semitones))
+
         shifted_intervals = []
 
         for i in range(len(self.intervals)):
@@ -65,17 +108,99 @@ class Mode:
 
         return Mode(shifted_intervals)
 
+    def _is_simple(self) -> bool:
+        # Ascending intervals from P1 within one octave are fully described by the mask
+        semitones = [interval.semitones for interval in self.intervals]
+        return (
+            semitones[0] == 0
+            and semitones[-1] < SEMITONES_PER_OCTAVE
+            and all(x < y for x, y in zip(semitones, semitones[1:]))
+        )
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "Mode":
+        """
+        Build a `Mode` from a 12-bit pitch class set, with its intervals in ascending order and spelled by scale degree
+        when it has seven notes, see `mask_intervals`
+        """
+
+        return cls(list(mask_intervals(mask)))
+
+    @classmethod
+    def from_name(cls, name: str) -> "Mode":
+        """
+        Return the `Mode` named `name` like "Dorian" or "Melodic Minor", see `Catalog.lookup`
+        """
+
+        from pychord import catalog
+
+        return catalog.CATALOG.lookup(name)
+
+    def identify(self) -> "CatalogEntry":
+        """
+        Return the `CatalogEntry` of this `Mode` with its names, prime form and Forte number, see `Catalog.identify`
+        """
+
+        from pychord import catalog
+
+        return catalog.CATALOG.identify(self)
+
+    def union(self, other: "Mode") -> "Mode":
+        """
+        Return the `Mode` with the intervals of both modes
+        """
+
+        return Mode.from_mask(self.mask | other.mask)
+
+    def intersection(self, other: "Mode") -> "Mode":
+        """
+        Return the `Mode` with the intervals shared by both modes
+        """
+
+        return Mode.from_mask(self.mask & other.mask)
+
+    def issubset(self, other: "Mode") -> bool:
+        """
+        Return whether every interval of this `Mode` is in `other`, ignoring octaves
+        """
+
+        return self.mask & ~other.mask == 0
+
+    def issuperset(self, other: "Mode") -> bool:
+        """
+        Return whether every interval of `other` is in this `Mode`, ignoring octaves
+        """
+
+        return other.mask & ~self.mask == 0
+
     def to_scale(self, tonic: Note) -> "Scale":
+        """
+        Return the `Scale` of this `Mode` on `tonic`, spelled from the tonic by the quantity of each `Interval`
+        """
+
         return Scale([tonic + interval for interval in self.intervals])
 
 
-IONIAN = Mode(
-    [Interval("P1"), Interval("M2"), Interval("M3"), Interval("P4"), Interval("P5"), Interval("M6"), Interval("M7")]
+# The diatonic modes are created on first access, the others as rotations of IONIAN
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        "IONIAN": lambda: Mode(
+            [
+                Interval("P1"),
+                Interval("M2"),
+                Interval("M3"),
+                Interval("P4"),
+                Interval("P5"),
+                Interval("M6"),
+                Interval("M7"),
+            ]
+        ),
+        "DORIAN": lambda: __getattr__("IONIAN") << 1,
+        "PHRYGIAN": lambda: __getattr__("IONIAN") << 2,
+        "LYDIAN": lambda: __getattr__("IONIAN") << 3,
+        "MIXOLYDIAN": lambda: __getattr__("IONIAN") << 4,
+        "AEOLIAN": lambda: __getattr__("IONIAN") << 5,
+        "LOCRIAN": lambda: __getattr__("IONIAN") << 6,
+    },
 )
-
-DORIAN = IONIAN << 1
-PHRYGIAN = IONIAN << 2
-LYDIAN = IONIAN << 3
-MIXOLYDIAN = IONIAN << 4
-AEOLIAN = IONIAN << 5
-LOCRIAN = IONIAN << 6
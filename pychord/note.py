@@ -1,16 +1,39 @@
+from math import ldexp
 from typing import Union
 
+from pychord.cache import InternCache, Interned
 from pychord.const import *
-from pychord.interval import Interval, OCTAVE
-from pychord.ratio import Ratio
+from pychord.interval import Interval
+from pychord.ratio import Cents, Ratio
 from pychord.tone import Tone
 
 
-class Note(Tone):
+def _parse_note_name(name: str) -> tuple[str, int, int]:
+    """
+    Split a note name like "Ab4" into its letter, accidental value and octave with table lookups
+    """
+
+    prefix = name.rstrip("0123456789")
+    components = NOTE_PREFIX_TO_COMPONENTS.get(prefix)
+
+    if components is None:
+        raise ValueError(f"Invalid note name '{name}'!")
+
+    octave = name[len(prefix) :]
+
+    return components[0], components[1], int(octave) if octave else NOTE_DEFAULT_OCTAVE
+
+
+class Note(Tone, metaclass=Interned):
     """
     Describes a musical note as a Tone quantized to 12TET with A4 = 440Hz, where note 0 = C0
     """
 
+    __slots__ = ("letter", "octave", "accidental", "semitone")
+
+    cache: InternCache = InternCache()
+    "Opt-in cache of shared `Note` instances keyed by constructor argument, see `InternCache.enable`"
+
     letter: str
     "The alphabet letter of the note, A-G"
 
@@ -32,32 +55,29 @@ class Note(Tone):
             raise TypeError()
 
         if isinstance(note, int):
-            self.semitone = note
-            self.octave = self.semitone // SEMITONES_PER_OCTAVE
-            self.letter = NOTE_SEMITONE_TO_COMPONENTS[self.semitone % SEMITONES_PER_OCTAVE][0]
-            self.accidental = NOTE_SEMITONE_TO_COMPONENTS[self.semitone % SEMITONES_PER_OCTAVE][1]
+            semitone = note
+            octave = semitone // SEMITONES_PER_OCTAVE
+            letter = NOTE_SEMITONE_TO_COMPONENTS[semitone % SEMITONES_PER_OCTAVE][0]
+            accidental = NOTE_SEMITONE_TO_COMPONENTS[semitone % SEMITONES_PER_OCTAVE][1]
 
         elif isinstance(note, str):
-            name = note
-            m = NOTE_NAME_RE.match(name)
+            letter, accidental, octave = _parse_note_name(note)
 
-            if m is None:
-                raise ValueError(f"Invalid note name '{name}'!")
+            c_based_note_semitone = NOTE_NAME_TO_SEMITONE[letter]
 
-            self.letter = m.group(1)
-            self.accidental = ACCIDENTAL_NAME_TO_VALUE[m.group(2)]
-            self.octave = int(m.group(3) or NOTE_DEFAULT_OCTAVE)
+            semitone = c_based_note_semitone + accidental + SEMITONES_PER_OCTAVE * octave
 
-            c_based_note_semitone = NOTE_NAME_TO_SEMITONE[self.letter]
-
-            self.semitone = c_based_note_semitone + self.accidental + SEMITONES_PER_OCTAVE * self.octave
+        object.__setattr__(self, "letter", letter)
+        object.__setattr__(self, "octave", octave)
+        object.__setattr__(self, "accidental", accidental)
+        object.__setattr__(self, "semitone", semitone)
 
+        # Same value as Tone(C0_FREQUENCY) + Interval(pitch class) + OCTAVE * octave, without building them
         super().__init__(
-            (
-                Tone(C0_FREQUENCY)
-                + Interval(self.semitone % SEMITONES_PER_OCTAVE)
-                + (OCTAVE * (self.semitone // SEMITONES_PER_OCTAVE))
-            ).frequency
+            ldexp(
+                NOTE_PITCH_CLASS_FREQUENCIES[semitone % SEMITONES_PER_OCTAVE],
+                semitone // SEMITONES_PER_OCTAVE,
+            )
         )
 
     def __repr__(self) -> str:
@@ -66,13 +86,49 @@ class Note(Tone):
     def __str__(self) -> str:
         return self.__repr__()
 
-    def __add__(self, other: Union[Interval, Ratio]):
-        if not isinstance(other, (Ratio, Interval)):
+    def __eq__(self, other: Tone):
+        if isinstance(other, Note):
+            return self.semitone == other.semitone
+        return super().__eq__(other)
+
+    def __ne__(self, other: Tone):
+        if isinstance(other, Note):
+            return self.semitone != other.semitone
+        return super().__ne__(other)
+
+    def __hash__(self) -> int:
+        # Equal semitones give equal frequencies, and a `Tone` of the same frequency compares equal
+        return hash(self.frequency)
+
+    def __ge__(self, other: Tone) -> bool:
+        if isinstance(other, Note):
+            return self.semitone >= other.semitone
+        return super().__ge__(other)
+
+    def __gt__(self, other: Tone) -> bool:
+        if isinstance(other, Note):
+            return self.semitone > other.semitone
+        return super().__gt__(other)
+
+    def __le__(self, other: Tone) -> bool:
+        if isinstance(other, Note):
+            return self.semitone <= other.semitone
+        return super().__le__(other)
+
+    def __lt__(self, other: Tone) -> bool:
+        if isinstance(other, Note):
+            return self.semitone < other.semitone
+        return super().__lt__(other)
+
+    def __add__(self, other: Union[Interval, Ratio, Cents]):
+        if not isinstance(other, (Ratio, Interval, Cents)):
             return NotImplemented
         return self.transposed(other)
 
-    def __sub__(self, other: Union[Interval, Ratio, "Note"]):
-        if isinstance(other, Ratio):
+    def __sub__(self, other: Union[Interval, Ratio, Cents, "Note"]):
+        if isinstance(other, Interval):
+            return self._stepped(-other.semitones, other.quantity, other.semitones >= 0)
+        elif isinstance(other, (Ratio, Cents)):
             return self.transposed(-other)
         elif isinstance(other, Note):
             return Interval(self.semitone - other.semitone)
@@ -86,37 +142,102 @@ class Note(Tone):
 
         return f"{self.letter}{ACCIDENTAL_VALUE_TO_NAME[self.accidental]}{self.octave}"
 
-    def transposed(self, interval: Union[Ratio, Interval]) -> Union["Note", "Tone"]:
+    def in_octave(self, octave: int) -> "Note":
         """
-        Transpose a note by an `Interval` or `Ratio`. Passing in an `Interval` will return a `Note` while passing in a `Ratio` will return a `Tone`
+        Return the same spelled `Note` in octave `octave`
         """
 
-        if not isinstance(interval, (Ratio, Interval)):
+        if not isinstance(octave, int):
             raise TypeError()
 
-        if isinstance(interval, Interval):
-            return Note(self.semitone + interval.semitones)
-        else:
+        offset = octave - self.octave
+
+        return self._spelled(self.letter, self.accidental, octave, self.semitone + SEMITONES_PER_OCTAVE * offset)
+
+    def transposed(self, interval: Union[Ratio, Interval, Cents]) -> Union["Note", "Tone"]:
+        """
+        Transpose a note by an `Interval`, `Ratio` or `Cents`. Passing in an `Interval` will return a `Note` while passing in a `Ratio` or `Cents` will return a `Tone`.
+        The `Note` is spelled `Interval.quantity` letters away, F + P4 is Bb and F + A3 is A#, falling back to the default
+        spelling when that would need more than a double accidental
+        """
+
+        if not isinstance(interval, (Ratio, Interval, Cents)):
+            raise TypeError()
+
+        if not isinstance(interval, Interval):
             return Tone(self.frequency) + interval
 
+        return self._stepped(interval.semitones, interval.quantity, interval.semitones < 0)
+
+    def _stepped(self, semitones: int, quantity: int, down: bool) -> "Note":
+        # Spell `semitones` away `quantity` letters up or down, the direction is explicit as d2 spans 0 semitones
+        semitone = self.semitone + semitones
+        octaves, steps = divmod(1 - quantity if down else quantity - 1, 7)
+        letter, natural = NOTE_LETTER_STEPS[self.letter, steps]
+        accidental = self.accidental + semitones - natural - SEMITONES_PER_OCTAVE * octaves
+
+        if accidental not in ACCIDENTAL_VALUE_TO_NAME:
+            return Note(semitone)
+
+        octave = (semitone - NOTE_NAME_TO_SEMITONE[letter] - accidental) // SEMITONES_PER_OCTAVE
+
+        return self._spelled(letter, accidental, octave, semitone)
+
     def following(self, note: "Note") -> "Note":
         """
-        Return the higher octave of this `Note` following `note`
+        Return the higher octave of this `Note` following `note`, with the same spelling
         """
 
         i = (self - note).decompound()
 
         i = Interval("P8") if i.semitones == 0 else i
 
-        return note + i
+        return self.in_octave(self.octave + (note.semitone + i.semitones - self.semitone) // SEMITONES_PER_OCTAVE)
 
     def preceding(self, note: "Note") -> "Note":
         """
-        Return the lower octave of this `Note` preceding `note`
+        Return the lower octave of this `Note` preceding `note`, with the same spelling
         """
 
         i = -(note - self).decompound()
 
         i = -Interval("P8") if i.semitones == 0 else i
 
-        return note + i
+        return self.in_octave(self.octave + (note.semitone + i.semitones - self.semitone) // SEMITONES_PER_OCTAVE)
+
+    @classmethod
+    def _spelled(cls, letter: str, accidental: int, octave: int, semitone: int) -> "Note":
+        # Build a `Note` from consistent components without parsing or a second lookup of the spelling
+        cache = cls.cache
+
+        if not cache.enabled:
+            return cls._build(letter, accidental, octave, semitone)
+
+        # Share interned instances, default spellings with `Note(semitone)` and others by their components,
+        # names are not parsed back as they can not spell negative octaves
+        if NOTE_SEMITONE_TO_COMPONENTS[semitone % SEMITONES_PER_OCTAVE] == (letter, accidental):
+            return cls(semitone)
+
+        key = (cls, letter, accidental, semitone)
+        note = cache.get(key)
+
+        if note is None:
+            note = cls._build(letter, accidental, octave, semitone)
+            cache.put(key, note)
+
+        return note
+
+    @classmethod
+    def _build(cls, letter: str, accidental: int, octave: int, semitone: int) -> "Note":
+        # Allocate and fill a new `Note` bypassing `__init__`, the profiler counts instances here too
+        note = object.__new__(cls)
+        object.__setattr__(note, "letter", letter)
+        object.__setattr__(note, "octave", octave)
+        object.__setattr__(note, "accidental", accidental)
+        object.__setattr__(note, "semitone", semitone)
+        Tone.__init__(
+            note,
+            ldexp(NOTE_PITCH_CLASS_FREQUENCIES[semitone % SEMITONES_PER_OCTAVE], semitone // SEMITONES_PER_OCTAVE),
+        )
+
+        return note
@@ -0,0 +1,98 @@
+from array import array
+from typing import Iterable, Union
+
+from pychord.const import *
+from pychord.interval import Interval, _parse_interval_name
+from pychord.note import Note, _parse_note_name
+
+
+class ParseResult:
+    """
+    Outcome of parsing a batch of names, holding the valid values and an error for each invalid name
+    """
+
+    values: Union[array, list]
+    "Parsed values of the valid names in input order, an integer `array` of semitones or a list of objects"
+
+    indices: array
+    "Input position of each entry of `values`"
+
+    errors: dict[int, str]
+    "Error message for each invalid name keyed by its input position"
+
+    def __init__(self, values: Union[array, list], indices: array, errors: dict[int, str]):
+        self.values = values
+        self.indices = indices
+        self.errors = errors
+
+    def __repr__(self) -> str:
+        return f"[ParseResult {len(self.values)} values {len(self.errors)} errors]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def ok(self) -> bool:
+        """
+        Return whether every name was parsed
+        """
+
+        return not self.errors
+
+
+def parse_notes(names: Iterable[str], as_notes: bool = False) -> ParseResult:
+    """
+    Parse note names like "Ab4" in bulk into semitones from C0, or into `Note`s when `as_notes` is set.
+    Invalid names are reported in `ParseResult.errors` without stopping the batch
+    """
+
+    values = [] if as_notes else array("l")
+    indices = array("l")
+    errors = {}
+
+    for index, name in enumerate(names):
+        if not isinstance(name, str):
+            errors[index] = f"Expected a note name, got {type(name).__name__}!"
+            continue
+
+        try:
+            if as_notes:
+                values.append(Note(name))
+            else:
+                letter, accidental, octave = _parse_note_name(name)
+                values.append(NOTE_NAME_TO_SEMITONE[letter] + accidental + SEMITONES_PER_OCTAVE * octave)
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+
+        indices.append(index)
+
+    return ParseResult(values, indices, errors)
+
+
+def parse_intervals(names: Iterable[str], as_intervals: bool = False) -> ParseResult:
+    """
+    Parse interval names like "m3" or "P15" in bulk into semitones, or into `Interval`s when `as_intervals` is set.
+    Invalid names are reported in `ParseResult.errors` without stopping the batch
+    """
+
+    values = [] if as_intervals else array("l")
+    indices = array("l")
+    errors = {}
+
+    for index, name in enumerate(names):
+        if not isinstance(name, str):
+            errors[index] = f"Expected an interval name, got {type(name).__name__}!"
+            continue
+
+        try:
+            values.append(Interval(name) if as_intervals else _parse_interval_name(name)[2])
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+
+        indices.append(index)
+
+    return ParseResult(values, indices, errors)
@@ -0,0 +1,35 @@
+from functools import lru_cache
+from typing import Iterable
+
+from pychord.const import *
+
+
+def pitch_class_mask(semitones: Iterable[int]) -> int:
+    """
+    Return the 12-bit pitch class set of some semitones, bit `i` is set when a semitone is `i` modulo an octave
+    """
+
+    mask = 0
+
+    for semitone in semitones:
+        mask |= 1 << (semitone % SEMITONES_PER_OCTAVE)
+
+    return mask
+
+
+def rotate_mask(mask: int, steps: int) -> int:
+    """
+    Rotate a pitch class set down by `steps` semitones so that pitch class `steps` becomes pitch class 0
+    """
+
+    steps %= SEMITONES_PER_OCTAVE
+    return ((mask >> steps) | (mask << (SEMITONES_PER_OCTAVE - steps))) & PITCH_CLASS_MASK_ALL
+
+
+@lru_cache(maxsize=1 << SEMITONES_PER_OCTAVE)
+def mask_pitch_classes(mask: int) -> tuple[int, ...]:
+    """
+    Return the pitch classes of a pitch class set in ascending order
+    """
+
+    return tuple(i for i in range(SEMITONES_PER_OCTAVE) if mask >> i & 1)
@@ -0,0 +1,200 @@
+"""
+Opt-in instrumentation counting the calls, time and instances of the value classes.
+Use the `profiled` context manager, or set the environment variable `PYCHORD_PROFILE` to profile a whole run and
+print a report at exit. The classes are only patched while profiling, disabled there is no overhead at all
+"""
+
+import atexit
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+
+from pychord.interval import Interval
+from pychord.mode import Mode
+from pychord.note import Note
+from pychord.ratio import Cents, Ratio
+from pychord.scale import Scale
+from pychord.tone import Tone
+
+PROFILED_CLASSES: tuple[type, ...] = (Tone, Ratio, Cents, Interval, Note, Mode, Scale)
+"Classes instrumented by default"
+
+PROFILE_REPORT_LIMIT: int = 20
+"Default number of methods listed by `ProfileStats.report`"
+
+_UNPROFILED_METHODS = {
+    "__repr__",
+    "__str__",
+    "__setattr__",
+    "__delattr__",
+    "__getstate__",
+    "__setstate__",
+    "__init_subclass__",
+}
+
+# Private constructors building instances without `__init__`, instrumented to count them
+_BUILD_METHODS = {"_build"}
+
+
+class ProfileStats:
+    """
+    Calls and time of each instrumented method by qualified name, and instances constructed of each class.
+    Times are inclusive, a method's time contains the time of the methods it calls
+    """
+
+    calls: dict[str, int]
+    "Number of calls of each method"
+
+    seconds: dict[str, float]
+    "Total time spent in each method in seconds"
+
+    instances: dict[str, int]
+    "Number of instances constructed of each class, counted in the `__init__` or `_build` of the class itself"
+
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+        self.instances = {}
+
+    def __repr__(self) -> str:
+        return f"[ProfileStats {sum(self.calls.values())} calls {sum(self.instances.values())} instances]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def hot_paths(self, limit: int = PROFILE_REPORT_LIMIT) -> list[tuple[str, int, float]]:
+        """
+        Return the methods that took the most time as (qualified name, calls, seconds), slowest first
+        """
+
+        return sorted(
+            ((name, calls, self.seconds[name]) for name, calls in self.calls.items()),
+            key=lambda entry: (-entry[2], entry[0]),
+        )[:limit]
+
+    def report(self, limit: int = PROFILE_REPORT_LIMIT) -> str:
+        """
+        Return a table of the hot paths and the instance counts
+        """
+
+        lines = [f"{'calls':>10} {'total ms':>10} {'per call us':>12}  method"]
+
+        for name, calls, seconds in self.hot_paths(limit):
+            lines.append(f"{calls:>10} {seconds * 1e3:>10.3f} {seconds / calls * 1e6:>12.3f}  {name}")
+
+        lines.append("instances: " + ", ".join(f"{name} {count}" for name, count in sorted(self.instances.items())))
+
+        return "\n".join(lines)
+
+
+_active: Optional[tuple[ProfileStats, list[tuple[type, str, object]]]] = None
+
+
+def enable(classes: Iterable[type] = PROFILED_CLASSES) -> ProfileStats:
+    """
+    Start counting the calls of the public and operator methods of `classes` and return the `ProfileStats` being filled
+    """
+
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("pychord profiling is already enabled!")
+
+    stats = ProfileStats()
+    originals = []
+
+    for cls in classes:
+        for name, attribute in list(vars(cls).items()):
+            if name in _UNPROFILED_METHODS or (
+                name.startswith("_") and not name.startswith("__") and name not in _BUILD_METHODS
+            ):
+                continue
+
+            if isinstance(attribute, (classmethod, staticmethod)) and isfunction(attribute.__func__):
+                wrapped = type(attribute)(_instrument(attribute.__func__, cls, stats))
+            elif isfunction(attribute):
+                wrapped = _instrument(attribute, cls, stats)
+            else:
+                continue
+
+            originals.append((cls, name, attribute))
+            setattr(cls, name, wrapped)
+
+    _active = (stats, originals)
+    return stats
+
+
+def disable() -> Optional[ProfileStats]:
+    """
+    Restore the original methods and return the collected `ProfileStats`, None when profiling was not enabled
+    """
+
+    global _active
+
+    if _active is None:
+        return None
+
+    stats, originals = _active
+
+    for cls, name, attribute in reversed(originals):
+        setattr(cls, name, attribute)
+
+    _active = None
+    return stats
+
+
+@contextmanager
+def profiled(classes: Iterable[type] = PROFILED_CLASSES) -> Iterator[ProfileStats]:
+    """
+    Profile the value classes inside a `with` block, the `ProfileStats` are complete once it exits
+    """
+
+    stats = enable(classes)
+
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def enable_from_environment():
+    """
+    Profile the whole process and print the report to stderr at exit, used when `PYCHORD_PROFILE` is set
+    """
+
+    enable()
+    atexit.register(_report_at_exit)
+
+
+def _report_at_exit():
+    stats = disable()
+
+    if stats is not None:
+        print(stats.report(), file=sys.stderr)
+
+
+def _instrument(function, owner: type, stats: ProfileStats):
+    qualname = f"{owner.__name__}.{function.__name__}"
+    calls = stats.calls
+    seconds = stats.seconds
+    instances = stats.instances
+    is_init = function.__name__ == "__init__"
+    is_build = function.__name__ in _BUILD_METHODS
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds[qualname] = seconds.get(qualname, 0.0) + perf_counter() - start
+            calls[qualname] = calls.get(qualname, 0) + 1
+
+            if is_init and type(args[0]) is owner or is_build and args[0] is owner:
+                instances[owner.__name__] = instances.get(owner.__name__, 0) + 1
+
+    return wrapper
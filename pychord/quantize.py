@@ -0,0 +1,142 @@
+"""
+Quantization of frequencies to the nearest 12TET `Note` with the deviation in cents, requires numpy
+"""
+
+from math import log2
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from pychord.const import *
+from pychord.note import Note
+from pychord.tone import Tone
+
+UNVOICED: int = int(np.iinfo(np.int32).min)
+"Semitone reported for frames without a usable frequency, such as zero, negative or NaN pitch tracker output"
+
+QUANTIZER_DEFAULT_OCTAVE_HOLD: int = 3
+"Default number of consecutive frames an octave jump has to last before `Quantizer` follows it"
+
+
+def nearest_note(tone: Union[Tone, float]) -> tuple[Note, float]:
+    """
+    Return the `Note` nearest to a `Tone` or frequency in hertz, and how many cents the frequency is above it
+    """
+
+    frequency = tone.frequency if isinstance(tone, Tone) else tone
+
+    if not frequency > 0:
+        raise ValueError(f"Invalid frequency {frequency}!")
+
+    semitones = SEMITONES_PER_OCTAVE * log2(frequency / C0_FREQUENCY)
+    semitone = round(semitones)
+
+    return Note(semitone), (semitones - semitone) * CENTS_PER_SEMITONE
+
+
+def quantize(frequencies) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize an array of frequencies in hertz to the nearest `Note` semitones from C0 and their deviation in cents.
+    Frames without a positive finite frequency get the semitone `UNVOICED` and NaN cents
+    """
+
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    voiced = np.isfinite(frequencies) & (frequencies > 0)
+
+    semitones = SEMITONES_PER_OCTAVE * np.log2(np.where(voiced, frequencies, C0_FREQUENCY) / C0_FREQUENCY)
+    nearest = np.rint(semitones)
+
+    return (
+        np.where(voiced, nearest, UNVOICED).astype(np.int32),
+        np.where(voiced, (semitones - nearest) * CENTS_PER_SEMITONE, np.nan),
+    )
+
+
+class Quantizer:
+    """
+    Streaming frequency quantizer that keeps state between chunks and smooths out octave jumps.
+    A jump of a whole number of octaves is only followed once it lasts `octave_hold` frames,
+    until then the note stays in the previous octave, this hides the octave errors pitch trackers make
+    """
+
+    octave_hold: int
+    "Number of consecutive frames an octave jump has to last before it is followed, 1 disables smoothing"
+
+    def __init__(self, octave_hold: int = QUANTIZER_DEFAULT_OCTAVE_HOLD):
+        if octave_hold < 1:
+            raise ValueError(f"Invalid octave hold {octave_hold}!")
+
+        self.octave_hold = octave_hold
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"[Quantizer hold {self.octave_hold}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def reset(self):
+        """
+        Forget the state carried over from previous chunks
+        """
+
+        self._current: Optional[int] = None
+        self._pending: Optional[int] = None
+        self._pending_count = 0
+
+    def process(self, frequencies) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Quantize the next chunk of frequencies like `quantize`, smoothing octave jumps against the previous frames
+        """
+
+        semitones, cents = quantize(frequencies)
+
+        if self.octave_hold == 1:
+            voiced = semitones[semitones != UNVOICED]
+            if len(voiced):
+                self._current = int(voiced[-1])
+            return semitones, cents
+
+        smoothed = semitones.tolist()
+
+        for i, semitone in enumerate(smoothed):
+            if semitone == UNVOICED:
+                continue
+
+            if self._current is None:
+                self._current = semitone
+                continue
+
+            jump = semitone - self._current
+
+            if jump == 0 or jump % SEMITONES_PER_OCTAVE != 0:
+                self._current = semitone
+                self._pending = None
+                continue
+
+            if semitone == self._pending:
+                self._pending_count += 1
+            else:
+                self._pending = semitone
+                self._pending_count = 1
+
+            if self._pending_count >= self.octave_hold:
+                self._current = semitone
+                self._pending = None
+            else:
+                smoothed[i] = self._current
+
+        return np.array(smoothed, dtype=np.int32), cents
+
+
+def quantize_stream(
+    chunks: Iterable, octave_hold: int = QUANTIZER_DEFAULT_OCTAVE_HOLD
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Lazily quantize chunks of frequencies, yielding the semitones and cents of each chunk as soon as it arrives
+    """
+
+    quantizer = Quantizer(octave_hold)
+
+    for chunk in chunks:
+        yield quantizer.process(chunk)
@@ -1,19 +1,29 @@
-from fractions import Fraction
-from typing import Union
+from math import log2
+from numbers import Rational
+from typing import TYPE_CHECKING, Union
 
 from pychord.const import *
+from pychord.immutable import Immutable
+from pychord.lazy import lazy_constants
 
+if TYPE_CHECKING:
+    from fractions import Fraction
 
-class Ratio:
+__all__ = ["Ratio", "Cents", "OCTAVE_RATIO", "SEMITONE_RATIO", "OCTAVE_CENTS", "SEMITONE_CENTS"]
+
+
+class Ratio(Immutable):
     """
     Describes an abstract interval between two `Tone`s, the ratio between their frequencies
     """
 
-    ratio: Union[float, Fraction]
+    __slots__ = ("ratio",)
+
+    ratio: Union[float, "Fraction"]
     "Simple mathematical ratio between `Tone`s"
 
-    def __init__(self, ratio: Union[float, Fraction]):
-        self.ratio = ratio
+    def __init__(self, ratio: Union[float, "Fraction"]):
+        object.__setattr__(self, "ratio", ratio)
 
     def __repr__(self):
         return f"[Ratio {self.ratio:.4f}]"
@@ -34,8 +44,8 @@ class Ratio:
             return NotImplemented
         return Ratio(self.ratio / other.ratio)
 
-    def __mul__(self, other: Union[int, float, Fraction]) -> "Ratio":
-        if not isinstance(other, (int, float, Fraction)):
+    def __mul__(self, other: Union[int, float, "Fraction"]) -> "Ratio":
+        if not isinstance(other, (int, float, Rational)):
             return NotImplemented
         return Ratio(self.ratio**other)
 
@@ -45,6 +55,9 @@ class Ratio:
     def __ne__(self, other: "Ratio"):
         return not isinstance(other, Ratio) or self.ratio != other.ratio
 
+    def __hash__(self) -> int:
+        return hash(self.ratio)
+
     def __ge__(self, other: "Ratio") -> bool:
         if not isinstance(other, (Ratio)):
             return NotImplemented
@@ -70,7 +83,7 @@ class Ratio:
         Compliment of `Ratio`, when added to the original `Ratio` will equal an octave
         """
 
-        return -(self - OCTAVE_RATIO)
+        return Ratio(1.0 / (self.ratio / 2))
 
     def inversion(self) -> "Ratio":
         """
@@ -79,9 +92,125 @@ class Ratio:
 
         return Ratio(1.0 / self.ratio)
 
+    def cents(self) -> "Cents":
+        """
+        Return the `Ratio` in the log domain as `Cents`
+        """
+
+        return Cents(CENTS_PER_OCTAVE * log2(self.ratio))
+
+
+class Cents(Immutable):
+    """
+    Describes an abstract interval between two `Tone`s in the log domain, as hundredths of a 12TET semitone.
+    Composing `Cents` is an addition and scaling them a multiplication, the linear ratio is only computed by `to_ratio`
+    or when transposing a `Tone`
+    """
+
+    __slots__ = ("cents",)
+
+    cents: Union[int, float]
+    "Size of the interval in cents, 1200 per octave"
+
+    def __init__(self, cents: Union[int, float]):
+        object.__setattr__(self, "cents", cents)
+
+    def __repr__(self):
+        return f"[Cents {self.cents:.4f}]"
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __neg__(self) -> "Cents":
+        return self.inversion()
+
+    def __add__(self, other: "Cents"):
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return Cents(self.cents + other.cents)
+
+    def __sub__(self, other: "Cents"):
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return Cents(self.cents - other.cents)
+
+    def __mul__(self, other: Union[int, float, "Fraction"]) -> "Cents":
+        if not isinstance(other, (int, float, Rational)):
+            return NotImplemented
+        return Cents(self.cents * other)
+
+    def __eq__(self, other: "Cents"):
+        return isinstance(other, Cents) and self._key() == other._key()
+
+    def __ne__(self, other: "Cents"):
+        return not isinstance(other, Cents) or self._key() != other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __ge__(self, other: "Cents") -> bool:
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return self._key() >= other._key()
+
+    def __gt__(self, other: "Cents") -> bool:
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return self._key() > other._key()
+
+    def __le__(self, other: "Cents") -> bool:
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return self._key() <= other._key()
+
+    def __lt__(self, other: "Cents") -> bool:
+        if not isinstance(other, Cents):
+            return NotImplemented
+        return self._key() < other._key()
+
+    def _key(self) -> Union[int, float]:
+        # Rounding keeps sums like 700 + 500 equal to 1200 despite float error, + 0.0 folds -0.0 into 0.0
+        return round(self.cents, CENTS_PRECISION) + 0.0
+
+    def compliment(self) -> "Cents":
+        """
+        Compliment of `Cents`, when added to the original `Cents` will equal an octave
+        """
+
+        return Cents(CENTS_PER_OCTAVE - self.cents)
+
+    def inversion(self) -> "Cents":
+        """
+        Inversion of `Cents` e.g. up a fifth becomes down a fifth
+        """
+
+        return Cents(-self.cents)
+
+    def to_ratio(self) -> Ratio:
+        """
+        Return the linear `Ratio` of these `Cents`
+        """
+
+        return Ratio(2 ** (self.cents / CENTS_PER_OCTAVE))
+
+
+def _octave_ratio() -> Ratio:
+    from fractions import Fraction
+
+    return Ratio(Fraction(2, 1))
 
-OCTAVE_RATIO = Ratio(Fraction(2, 1))
-"Constant octave `Ratio` (2:1)"
 
-SEMITONE_RATIO = Ratio(2 ** (1 / 12))
-"Constant ratio for a 12TET semitone"
+# Constants are created on first access, which also keeps `fractions` out of the import of pychord
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        # Constant octave `Ratio` (2:1)
+        "OCTAVE_RATIO": _octave_ratio,
+        # Constant ratio for a 12TET semitone
+        "SEMITONE_RATIO": lambda: Ratio(2 ** (1 / 12)),
+        # Constant octave in `Cents` (1200)
+        "OCTAVE_CENTS": lambda: Cents(CENTS_PER_OCTAVE),
+        # Constant 12TET semitone in `Cents` (100)
+        "SEMITONE_CENTS": lambda: Cents(CENTS_PER_SEMITONE),
+    },
+)
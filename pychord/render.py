@@ -0,0 +1,194 @@
+"""
+Audio rendering of note sequences to 16-bit PCM with vectorized oscillators, streamed in fixed size chunks, requires numpy
+"""
+
+import wave
+from itertools import repeat
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+
+from pychord.note import Note
+from pychord.scale import Scale
+from pychord.tone import Tone
+from pychord.tuning import Tuning
+
+RENDER_DEFAULT_SAMPLE_RATE: int = 44100
+"Default sample rate of rendered audio in hertz"
+
+RENDER_DEFAULT_CHUNK_SIZE: int = 4096
+"Default number of samples per chunk yielded by `render_chunks`"
+
+RENDER_DEFAULT_AMPLITUDE: float = 0.25
+"Default peak amplitude of a single note, full scale is 1, overlapping notes add up and are clipped"
+
+
+class Envelope(NamedTuple):
+    """
+    ADSR amplitude envelope, times in seconds. A note ramps up to full level over `attack`, falls to `sustain`
+    over `decay`, holds until its duration ends and then fades out over `release`
+    """
+
+    attack: float = 0.01
+    "Time to reach full level"
+
+    decay: float = 0.1
+    "Time to fall from full level to the sustain level, with 0 the attack ramps to the sustain level directly"
+
+    sustain: float = 0.7
+    "Level held until the note ends, from 0 to 1"
+
+    release: float = 0.2
+    "Time to fade out after the note ends"
+
+    def gains(self, times: np.ndarray, duration: float) -> np.ndarray:
+        """
+        Return the envelope level at each time in seconds after the onset of a note lasting `duration` seconds
+        """
+
+        points = [self.attack]
+        levels = [1.0 if self.decay > 0 else self.sustain]
+
+        if self.attack > 0:
+            points.insert(0, 0.0)
+            levels.insert(0, 0.0)
+        if self.decay > 0:
+            points.append(self.attack + self.decay)
+            levels.append(self.sustain)
+
+        held = np.interp(np.minimum(times, duration), points, levels)
+
+        if self.release > 0:
+            fade = np.clip(1 - (times - duration) / self.release, 0, 1)
+        else:
+            fade = (times < duration).astype(np.float64)
+
+        return held * np.where(times < duration, 1.0, fade)
+
+
+class _Voice:
+    # A note being rendered, sample positions relative to the start of the render
+    __slots__ = ("start", "stop", "frequency", "duration")
+
+    def __init__(self, start: int, stop: int, frequency: float, duration: float):
+        self.start = start
+        self.stop = stop
+        self.frequency = frequency
+        self.duration = duration
+
+
+def render_chunks(
+    notes: Union[Iterable[Union[Note, Tone]], Scale],
+    durations: Union[float, Iterable[float]] = 0.5,
+    envelope: Envelope = Envelope(),
+    sample_rate: int = RENDER_DEFAULT_SAMPLE_RATE,
+    chunk_size: int = RENDER_DEFAULT_CHUNK_SIZE,
+    amplitude: float = RENDER_DEFAULT_AMPLITUDE,
+    tuning: Optional[Tuning] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Lazily render `Note`s or `Tone`s played one after the other as sine tones, yielding int16 chunks of `chunk_size`
+    samples, the last one shorter. `durations` is a length in seconds for every note or one per note.
+    Release tails overlap the following notes. `Note` frequencies come from `tuning` when given.
+    Only the notes sounding in the current chunk are held in memory
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size {chunk_size}!")
+
+    if isinstance(notes, Scale):
+        notes = notes.notes
+
+    if isinstance(durations, (int, float)):
+        durations = repeat(durations)
+
+    pending = zip(notes, durations)
+    voices: list[_Voice] = []
+    onset = 0.0
+    position = 0
+    exhausted = False
+
+    while True:
+        end = position + chunk_size
+
+        # Start the notes beginning before the end of this chunk
+        while not exhausted and round(onset * sample_rate) < end:
+            item = next(pending, None)
+
+            if item is None:
+                exhausted = True
+                break
+
+            note, duration = item
+            frequency = tuning.frequency(note) if tuning is not None and isinstance(note, Note) else note.frequency
+            start = round(onset * sample_rate)
+            voices.append(
+                _Voice(start, round((onset + duration + envelope.release) * sample_rate), frequency, duration)
+            )
+            onset += duration
+
+        if exhausted:
+            # The last chunk ends with the last release tail
+            end = min(end, max((voice.stop for voice in voices), default=position))
+
+            if end <= position:
+                return
+
+        buffer = np.zeros(end - position, dtype=np.float64)
+
+        for voice in voices:
+            first = max(voice.start, position)
+            last = min(voice.stop, end)
+
+            if first >= last:
+                continue
+
+            times = np.arange(first - voice.start, last - voice.start) / sample_rate
+            buffer[first - position : last - position] += (
+                amplitude * envelope.gains(times, voice.duration) * np.sin(2 * np.pi * voice.frequency * times)
+            )
+
+        yield (np.clip(buffer, -1, 1) * np.iinfo(np.int16).max).astype(np.int16)
+
+        position = end
+        voices = [voice for voice in voices if voice.stop > position]
+
+
+def render(
+    notes: Union[Iterable[Union[Note, Tone]], Scale],
+    durations: Union[float, Iterable[float]] = 0.5,
+    envelope: Envelope = Envelope(),
+    sample_rate: int = RENDER_DEFAULT_SAMPLE_RATE,
+    amplitude: float = RENDER_DEFAULT_AMPLITUDE,
+    tuning: Optional[Tuning] = None,
+) -> np.ndarray:
+    """
+    Render notes into a single int16 array, see `render_chunks`
+    """
+
+    chunks = list(render_chunks(notes, durations, envelope, sample_rate, amplitude=amplitude, tuning=tuning))
+
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int16)
+
+
+def write_wav(
+    target: Union[str, BinaryIO], chunks: Iterable[np.ndarray], sample_rate: int = RENDER_DEFAULT_SAMPLE_RATE
+) -> int:
+    """
+    Write mono 16-bit PCM chunks, like the ones from `render_chunks`, to a WAV file chunk by chunk.
+    Return the number of samples written
+    """
+
+    samples = 0
+
+    with wave.open(target, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+
+        for chunk in chunks:
+            chunk = np.ascontiguousarray(chunk, dtype="<i2")
+            f.writeframes(memoryview(chunk).cast("B"))
+            samples += len(chunk)
+
+    return samples
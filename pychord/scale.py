@@ -1,18 +1,32 @@
+from collections import deque
+from itertools import count
+from typing import Iterator, Optional, Union
+
+from pychord.const import *
+from pychord.immutable import Immutable
+from pychord.interval import mask_intervals
 from pychord.note import Note
-from pychord.interval import OCTAVE
+from pychord.pitchclass import pitch_class_mask, rotate_mask
+
 
-class Scale:
+class Scale(Immutable):
     """
     A musical `Scale` consisting of a list of ordered `Note`s
     """
 
-    notes: list[Note]
-    "List of `Note`s in the `Scale`"
+    __slots__ = ("notes", "mask")
+
+    notes: tuple[Note, ...]
+    "Tuple of `Note`s in the `Scale`"
 
-    def __init__(self, notes: list[Note]):
-        if not isinstance(notes, list):
+    mask: int
+    "12-bit pitch class set of the `Scale`, bit `i` is set when a note has pitch class `i` with C = 0"
+
+    def __init__(self, notes: Union[list[Note], tuple[Note, ...]]):
+        if not isinstance(notes, (list, tuple)):
             raise TypeError()
-        self.notes = notes
+        object.__setattr__(self, "notes", tuple(notes))
+        object.__setattr__(self, "mask", pitch_class_mask(note.semitone for note in self.notes))
 
     def __repr__(self) -> str:
         return f"[Scale {' '.join([n.name() for n in self.notes])}]"
@@ -34,6 +48,14 @@ class Scale:
             or any(x != y for x, y in zip(self.notes, other.notes))
         )
 
+    def __hash__(self) -> int:
+        return hash(tuple(note.semitone for note in self.notes))
+
+    def __contains__(self, note: Note) -> bool:
+        if not isinstance(note, Note):
+            return False
+        return bool(self.mask >> (note.semitone % SEMITONES_PER_OCTAVE) & 1)
+
     def __lshift__(self, other: int) -> "Scale":
         if not isinstance(other, int):
             return NotImplemented
@@ -44,8 +66,59 @@ class Scale:
             return NotImplemented
         return self.shifted(-other)
 
-    def __getitem__(self, index: int) -> Note:
-        return self.notes[index % len(self.notes)] + OCTAVE * (index // len(self.notes))
+    def __getitem__(self, index: Union[int, slice]) -> Union[Note, tuple[Note, ...]]:
+        """
+        Return the `Note` on scale degree `index` counting from the tonic, continuing into the octaves above and below.
+        A slice returns a tuple of `Note`s, it covers the first octave by default and its bounds can go past it
+        """
+
+        if isinstance(index, slice):
+            step = 1 if index.step is None else index.step
+            if step > 0:
+                start = 0 if index.start is None else index.start
+                stop = len(self.notes) if index.stop is None else index.stop
+            else:
+                start = len(self.notes) - 1 if index.start is None else index.start
+                stop = -1 if index.stop is None else index.stop
+            return tuple(self.range(start, stop, step))
+
+        octaves, degree = divmod(index, len(self.notes))
+        note = self.notes[degree]
+        return note.in_octave(note.octave + octaves) if octaves else note
+
+    def range(
+        self, start: int, stop: Optional[int] = None, step: int = 1, semitones: bool = False
+    ) -> Iterator[Union[Note, int]]:
+        """
+        Lazily yield the `Note`s on scale degrees `start` up to but excluding `stop` every `step` degrees, like `__getitem__`.
+        Without a `stop` the run never ends, with `semitones` the raw semitones from C0 are yielded instead of `Note`s
+        """
+
+        if not isinstance(start, int) or not isinstance(stop, (int, type(None))) or not isinstance(step, int):
+            raise TypeError()
+
+        if step == 0:
+            raise ValueError("Scale range step must not be zero!")
+
+        notes = self.notes
+        length = len(notes)
+        octave_step, degree_step = divmod(step, length)
+        octaves, degree = divmod(start, length)
+
+        for _ in range(start, stop, step) if stop is not None else count():
+            note = notes[degree]
+
+            if semitones:
+                yield note.semitone + SEMITONES_PER_OCTAVE * octaves
+            else:
+                yield note.in_octave(note.octave + octaves) if octaves else note
+
+            # Advance the degree and carry into the octave with integers only
+            degree += degree_step
+            octaves += octave_step
+            if degree >= length:
+                degree -= length
+                octaves += 1
 
     def shifted(self, steps: int) -> "Scale":
         """
@@ -55,15 +128,93 @@ class Scale:
         if not isinstance(steps, int):
             raise TypeError()
 
-        shifted_notes = self.notes.copy()
+        if steps == 0 or not self.notes:
+            return Scale(self.notes)
+
+        length = len(self.notes)
+        moves = min(abs(steps), length)
+        semitones = deque(note.semitone for note in self.notes)
+
+        self._shift_semitones(semitones, moves if steps > 0 else -moves)
+
+        # Once every note has moved a full cycle of `length` steps moves them all by the same offset
+        cycles, rest = divmod(abs(steps) - moves, length)
+
+        if cycles:
+            first, last = semitones[0], semitones[-1]
+            if steps > 0:
+                offset = cycles * (last + ((first - last) % SEMITONES_PER_OCTAVE or SEMITONES_PER_OCTAVE) - first)
+            else:
+                offset = cycles * (first - ((first - last) % SEMITONES_PER_OCTAVE or SEMITONES_PER_OCTAVE) - last)
+            semitones = deque(semitone + offset for semitone in semitones)
+
+        self._shift_semitones(semitones, rest if steps > 0 else -rest)
+
+        # The notes are rotated by `steps`, each keeps its spelling and notes that were not moved are reused
+        notes = []
 
-        for _ in range(abs(steps)):
-            if steps < 0:
-                shifted_notes.insert(0, shifted_notes.pop(-1).preceding(shifted_notes[0]))
-            elif steps > 0:
-                shifted_notes.append(shifted_notes.pop(0).following(shifted_notes[-1]))
+        for i, semitone in enumerate(semitones):
+            note = self.notes[(i + steps) % length]
+            if note.semitone != semitone:
+                note = note.in_octave(note.octave + (semitone - note.semitone) // SEMITONES_PER_OCTAVE)
+            notes.append(note)
+
+        return Scale(notes)
+
+    @staticmethod
+    def _shift_semitones(semitones: deque, steps: int):
+        # Integer version of moving the first note after the last one with `Note.following` or the reverse
+        for _ in range(steps):
+            moved = semitones.popleft()
+            last = semitones[-1] if semitones else moved
+            semitones.append(last + ((moved - last) % SEMITONES_PER_OCTAVE or SEMITONES_PER_OCTAVE))
+
+        for _ in range(-steps):
+            moved = semitones.pop()
+            first = semitones[0] if semitones else moved
+            semitones.appendleft(first - ((first - moved) % SEMITONES_PER_OCTAVE or SEMITONES_PER_OCTAVE))
+
+    @classmethod
+    def from_mask(cls, mask: int, tonic: Note) -> "Scale":
+        """
+        Build the ascending `Scale` of a 12-bit pitch class set, starting from the octave of `tonic` and spelled from it,
+        see `mask_intervals`. The pitch class of `tonic` must be in the set
+        """
+
+        tonic_pitch_class = tonic.semitone % SEMITONES_PER_OCTAVE
+
+        if not mask >> tonic_pitch_class & 1:
+            raise ValueError(f"Tonic {tonic.name()} is not in the pitch class set {mask:#05x}!")
+
+        return cls([tonic + interval for interval in mask_intervals(rotate_mask(mask, tonic_pitch_class))])
+
+    def union(self, other: "Scale") -> "Scale":
+        """
+        Return the `Scale` with the pitch classes of both scales, starting from the tonic of this `Scale`
+        """
+
+        return Scale.from_mask(self.mask | other.mask, self.tonic())
+
+    def intersection(self, other: "Scale") -> "Scale":
+        """
+        Return the `Scale` of the notes of this `Scale` whose pitch classes are in `other`, keeping their spelling
+        """
+
+        return Scale([note for note in self.notes if note in other])
+
+    def issubset(self, other: "Scale") -> bool:
+        """
+        Return whether every pitch class of this `Scale` is in `other`
+        """
+
+        return self.mask & ~other.mask == 0
+
+    def issuperset(self, other: "Scale") -> bool:
+        """
+        Return whether every pitch class of `other` is in this `Scale`
+        """
 
-        return Scale(shifted_notes)
+        return other.mask & ~self.mask == 0
 
     def tonic(self) -> Note:
         """
@@ -0,0 +1,348 @@
+"""
+Asynchronous pipelines transforming live streams of `NoteEvent`s, such as transposing, snapping to a `Scale` and
+adding harmony voices. Stages run as asyncio tasks connected by bounded queues, so a slow consumer holds back
+the source instead of events piling up, and the time each stage spends on an event is recorded
+"""
+
+import asyncio
+from inspect import isawaitable
+from time import perf_counter
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Optional, Union
+
+from pychord.const import *
+from pychord.interval import Interval
+from pychord.midi import NoteEvent
+from pychord.scale import Scale
+
+STREAM_DEFAULT_BUFFER_SIZE: int = 16
+"Default number of events each queue between pipeline stages holds before the stage feeding it waits"
+
+# Marks the end of the stream in the queues between stages
+_END = object()
+
+
+class _Failure:
+    # Carries an exception raised by the source or a stage down to the consumer
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class StageStats:
+    """
+    Counters of the events a pipeline stage handled and the time it spent on them
+    """
+
+    name: str
+    "Name of the stage"
+
+    events: int
+    "Number of events the stage received"
+
+    emitted: int
+    "Number of events the stage passed on"
+
+    seconds: float
+    "Total time spent processing events in seconds"
+
+    max_seconds: float
+    "Longest time spent on a single event in seconds"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events = 0
+        self.emitted = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def __repr__(self) -> str:
+        return f"[StageStats {self.name} {self.events} events {self.mean_seconds() * 1e6:.1f}us mean]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def mean_seconds(self) -> float:
+        """
+        Return the mean time spent on an event in seconds, 0 before any event
+        """
+
+        return self.seconds / self.events if self.events else 0.0
+
+
+class Stage:
+    """
+    A step of a `Pipeline` mapping each `NoteEvent` to any number of events. `function` returns a `NoteEvent`,
+    an iterable of them or None to drop the event, and may be a coroutine function.
+    Subclasses override `process` instead. Stages compose into a `Pipeline` with `|`
+    """
+
+    name: str
+    "Name of the stage in the `Pipeline` statistics"
+
+    def __init__(self, function: Optional[Callable] = None, name: Optional[str] = None):
+        if function is None and type(self).process is Stage.process:
+            raise TypeError(f"{type(self).__name__} needs a function or a process method!")
+
+        self._function = function
+        self.name = name or getattr(function, "__name__", None) or type(self).__name__
+
+    def __repr__(self) -> str:
+        return f"[Stage {self.name}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __or__(self, other: Union["Stage", "Pipeline"]) -> "Pipeline":
+        if isinstance(other, Pipeline):
+            return Pipeline(self, *other.stages, buffer_size=other.buffer_size)
+        if not isinstance(other, Stage):
+            return NotImplemented
+        return Pipeline(self, other)
+
+    def process(self, event: NoteEvent):
+        """
+        Return the events replacing `event`, see `Stage`
+        """
+
+        return self._function(event)
+
+
+class Transpose(Stage):
+    """
+    Transposes every event by an `Interval`, spelled by its quantity
+    """
+
+    interval: Interval
+    "The `Interval` events are transposed by"
+
+    def __init__(self, interval: Interval, name: Optional[str] = None):
+        super().__init__(name=name or f"transpose {interval.name()}")
+        self.interval = interval
+
+    def process(self, event: NoteEvent) -> NoteEvent:
+        return event._replace(note=event.note + self.interval)
+
+
+class SnapToScale(Stage):
+    """
+    Moves every event to the nearest pitch class of a `Scale`, spelled like the `Scale`. Ties go down unless `up`
+    """
+
+    scale: Scale
+    "The `Scale` events are snapped to"
+
+    def __init__(self, scale: Scale, up: bool = False, name: Optional[str] = None):
+        if not scale.notes:
+            raise ValueError("Can not snap to an empty scale!")
+
+        super().__init__(name=name or "snap to scale")
+        self.scale = scale
+
+        # Pitch class to the offset of the nearest scale pitch class and the scale note spelling it
+        spellings = {note.semitone % SEMITONES_PER_OCTAVE: note for note in scale.notes}
+        order = (1, -1) if up else (-1, 1)
+        self._table = []
+
+        for pitch_class in range(SEMITONES_PER_OCTAVE):
+            for distance in range(SEMITONES_PER_OCTAVE):
+                offsets = [
+                    sign * distance
+                    for sign in order
+                    if (pitch_class + sign * distance) % SEMITONES_PER_OCTAVE in spellings
+                ]
+                if offsets:
+                    offset = offsets[0]
+                    self._table.append((offset, spellings[(pitch_class + offset) % SEMITONES_PER_OCTAVE]))
+                    break
+
+    def process(self, event: NoteEvent) -> NoteEvent:
+        note = event.note
+        offset, spelling = self._table[note.semitone % SEMITONES_PER_OCTAVE]
+        semitone = note.semitone + offset
+
+        if offset == 0 and note.letter == spelling.letter:
+            return event
+
+        return event._replace(
+            note=spelling.in_octave(spelling.octave + (semitone - spelling.semitone) // SEMITONES_PER_OCTAVE)
+        )
+
+
+class Harmonize(Stage):
+    """
+    Adds a harmony voice to every event, a fixed `Interval` away or, with a `Scale`, `voice` scale degrees away
+    like a diatonic third with `voice` 2. Notes outside the `Scale` are harmonized from the scale degree below them
+    """
+
+    voice: Union[Interval, int]
+    "The `Interval` or number of scale degrees between the events and their harmony"
+
+    scale: Optional[Scale]
+    "The `Scale` of a diatonic harmony"
+
+    def __init__(self, voice: Union[Interval, int], scale: Optional[Scale] = None, name: Optional[str] = None):
+        if isinstance(voice, int) and (scale is None or not scale.notes):
+            raise ValueError("Diatonic harmony needs a scale!")
+
+        super().__init__(name=name or f"harmonize {voice.name() if isinstance(voice, Interval) else voice}")
+        self.voice = voice
+        self.scale = scale
+
+        if isinstance(voice, int):
+            # Pitch class to the scale degree at or below it and the semitones above that degree
+            degrees = {note.semitone % SEMITONES_PER_OCTAVE: degree for degree, note in enumerate(scale.notes)}
+            self._table = []
+
+            for pitch_class in range(SEMITONES_PER_OCTAVE):
+                below = next(
+                    d for d in range(SEMITONES_PER_OCTAVE) if (pitch_class - d) % SEMITONES_PER_OCTAVE in degrees
+                )
+                self._table.append((degrees[(pitch_class - below) % SEMITONES_PER_OCTAVE], below))
+
+    def process(self, event: NoteEvent) -> tuple[NoteEvent, NoteEvent]:
+        note = event.note
+
+        if isinstance(self.voice, Interval):
+            return event, event._replace(note=note + self.voice)
+
+        degree, above = self._table[note.semitone % SEMITONES_PER_OCTAVE]
+        base = self.scale[degree]
+        harmony = self.scale[degree + self.voice]
+        octaves = (note.semitone - above - base.semitone) // SEMITONES_PER_OCTAVE
+
+        return event, event._replace(note=harmony.in_octave(harmony.octave + octaves) if octaves else harmony)
+
+
+class Pipeline:
+    """
+    A chain of `Stage`s applied to an asynchronous stream of `NoteEvent`s, each stage running as its own task.
+    Queues of `buffer_size` events between the stages bound the work in flight, `stats` accumulate over runs
+    """
+
+    stages: tuple[Stage, ...]
+    "The stages in the order events go through them"
+
+    buffer_size: int
+    "Number of events each queue between stages holds"
+
+    stats: list[StageStats]
+    "Statistics of each stage, in the order of `stages`"
+
+    def __init__(self, *stages: Stage, buffer_size: int = STREAM_DEFAULT_BUFFER_SIZE):
+        if buffer_size < 1:
+            raise ValueError(f"Invalid buffer size {buffer_size}!")
+
+        if not all(isinstance(stage, Stage) for stage in stages):
+            raise TypeError()
+
+        self.stages = stages
+        self.buffer_size = buffer_size
+        self.stats = [StageStats(stage.name) for stage in stages]
+
+    def __repr__(self) -> str:
+        return f"[Pipeline {' | '.join(stage.name for stage in self.stages)}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __or__(self, other: Union[Stage, "Pipeline"]) -> "Pipeline":
+        if isinstance(other, Stage):
+            return Pipeline(*self.stages, other, buffer_size=self.buffer_size)
+        if isinstance(other, Pipeline):
+            return Pipeline(*self.stages, *other.stages, buffer_size=self.buffer_size)
+        return NotImplemented
+
+    async def run(self, source: AsyncIterable[NoteEvent]) -> AsyncIterator[NoteEvent]:
+        """
+        Lazily yield the events of `source` after every stage. Errors raised by the source or a stage are raised here,
+        and the stage tasks are cancelled once the output is closed or abandoned
+        """
+
+        queues = [asyncio.Queue(self.buffer_size) for _ in range(len(self.stages) + 1)]
+        tasks = [asyncio.ensure_future(_feed(source, queues[0]))] + [
+            asyncio.ensure_future(_work(stage, stats, queues[i], queues[i + 1]))
+            for i, (stage, stats) in enumerate(zip(self.stages, self.stats))
+        ]
+
+        try:
+            while True:
+                item = await queues[-1].get()
+
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def report(self) -> str:
+        """
+        Return a table of the event counts and latencies of each stage
+        """
+
+        lines = [f"{'events':>10} {'emitted':>10} {'mean us':>10} {'max us':>10}  stage"]
+
+        for stats in self.stats:
+            lines.append(
+                f"{stats.events:>10} {stats.emitted:>10} {stats.mean_seconds() * 1e6:>10.1f} "
+                f"{stats.max_seconds * 1e6:>10.1f}  {stats.name}"
+            )
+
+        return "\n".join(lines)
+
+
+async def event_source(events: Iterable[NoteEvent], delay: float = 0.0) -> AsyncIterator[NoteEvent]:
+    """
+    Yield `events` as an asynchronous stream, waiting `delay` seconds before each one, a stand-in for a live input
+    in tests and demos
+    """
+
+    for event in events:
+        await asyncio.sleep(delay)
+        yield event
+
+
+async def _feed(source: AsyncIterable[NoteEvent], output: asyncio.Queue):
+    try:
+        async for event in source:
+            await output.put(event)
+    except Exception as error:
+        await output.put(_Failure(error))
+    else:
+        await output.put(_END)
+
+
+async def _work(stage: Stage, stats: StageStats, incoming: asyncio.Queue, output: asyncio.Queue):
+    while True:
+        event = await incoming.get()
+
+        if event is _END or isinstance(event, _Failure):
+            await output.put(event)
+            return
+
+        start = perf_counter()
+
+        try:
+            result = stage.process(event)
+            if isawaitable(result):
+                result = await result
+        except Exception as error:
+            await output.put(_Failure(error))
+            return
+
+        elapsed = perf_counter() - start
+        stats.events += 1
+        stats.seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+
+        if result is None:
+            continue
+
+        for item in (result,) if isinstance(result, NoteEvent) else result:
+            stats.emitted += 1
+            await output.put(item)
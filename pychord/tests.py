@@ -1,12 +1,45 @@
+import asyncio
+import copy
+import io
+import itertools
+import os
+import pickle
+import subprocess
+import sys
 import unittest
+import wave
+from fractions import Fraction
 
+from pychord.batch import *
+from pychord.benchmarks import BENCHMARKS, compare, run
+from pychord.cache import *
+from pychord.catalog import *
+from pychord.chord import *
 from pychord.const import *
 from pychord.interval import *
+from pychord.keyindex import *
+from pychord.midi import *
 from pychord.note import *
+from pychord.parse import *
+from pychord.pitchclass import *
+from pychord.profiling import *
 from pychord.ratio import *
 from pychord.tone import *
+from pychord.tuning import *
 from pychord.mode import *
 from pychord.scale import *
+from pychord.stream import *
+
+try:
+    import numpy as np
+
+    from pychord.arrays import *
+    from pychord.keydetect import *
+    from pychord.quantize import *
+    from pychord.render import *
+    from pychord.voicing import *
+except ImportError:
+    np = None
 
 
 class PyChordUnitTests(unittest.TestCase):
@@ -36,6 +69,50 @@ class PyChordUnitTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             Note("G#b")
 
+    def test_note_frequency(self):
+        for semitone in range(-48, 144):
+            self.assertEqual(
+                Note(semitone).frequency,
+                (
+                    Tone(C0_FREQUENCY)
+                    + Interval(semitone % SEMITONES_PER_OCTAVE)
+                    + (OCTAVE * (semitone // SEMITONES_PER_OCTAVE))
+                ).frequency,
+            )
+
+    def test_tuning(self):
+        for semitone in range(TUNING_LOWEST_SEMITONE, TUNING_HIGHEST_SEMITONE + 1):
+            self.assertAlmostEqual(EQUAL_TEMPERAMENT.frequency(semitone) / Note(semitone).frequency, 1, places=12)
+
+        self.assertAlmostEqual(Tuning.equal(442).frequency(Note("A4")), 442)
+        self.assertAlmostEqual(Tuning.equal(415).frequency(Note("A3")), 207.5)
+
+        just = Tuning.just(Note("C"))
+        self.assertAlmostEqual(just.frequency(Note("A4")), 440)
+        self.assertAlmostEqual(just.frequency(Note("E4")) / just.frequency(Note("C4")), 5 / 4)
+        self.assertAlmostEqual(just.frequency(Note("G5")) / just.frequency(Note("C4")), 3)
+
+        pythagorean = Tuning.pythagorean(Note("D"), 415)
+        self.assertAlmostEqual(pythagorean.frequency(Note("A4")), 415)
+        self.assertAlmostEqual(pythagorean.frequency(Note("A4")) / pythagorean.frequency(Note("D4")), 3 / 2)
+        self.assertAlmostEqual(pythagorean.frequency(Note("F#4")) / pythagorean.frequency(Note("D4")), 81 / 64)
+
+        custom = Tuning([Cents(0)] + [Cents(100 * i + 10) for i in range(1, 12)])
+        self.assertAlmostEqual(custom.frequency(Note("A4")), 440)
+        self.assertAlmostEqual(custom.frequency(Note("C5")) / custom.frequency(Note("A4")), 2 ** (290 / 1200))
+        self.assertAlmostEqual(custom.frequency(Note("C#5")) / custom.frequency(Note("C5")), 2 ** (110 / 1200))
+
+        self.assertEqual(
+            list(just.frequencies([Note("C4"), 60, Note("B#3")])),
+            [just.frequency(48), just.frequency(60), just.frequency(48)],
+        )
+        with self.assertRaises(IndexError):
+            just.frequency(TUNING_HIGHEST_SEMITONE + 1)
+        with self.assertRaises(IndexError):
+            just.frequencies([0, TUNING_LOWEST_SEMITONE - 1])
+        with self.assertRaises(ValueError):
+            Tuning([0, 100])
+
     def test_12tet_interval_name_parsing(self):
         self.assertEqual(Interval("P1").semitones, 0)
         self.assertEqual(Interval("m2").semitones, 1)
@@ -60,6 +137,29 @@ class PyChordUnitTests(unittest.TestCase):
         self.assertEqual(Interval("m10").name(), "m10")
         self.assertEqual(Interval("P15").name(), "P15")
 
+    def test_bulk_parsing(self):
+        names = ["C4", "Db", "Hb3", "B#2", 7, "Cbb0", "G#b"]
+        result = parse_notes(names)
+
+        self.assertEqual(list(result.values), [Note(n).semitone for n in ["C4", "Db", "B#2", "Cbb0"]])
+        self.assertEqual(list(result.indices), [0, 1, 3, 5])
+        self.assertEqual(sorted(result.errors), [2, 4, 6])
+        self.assertEqual(result.errors[2], "Invalid note name 'Hb3'!")
+        self.assertFalse(result.ok())
+
+        notes = parse_notes(["Db4", "A"], as_notes=True)
+        self.assertTrue(notes.ok())
+        self.assertEqual([n.name() for n in notes.values], ["Db4", "A4"])
+
+        names = ["P1", "m10", "A4", "d5", "P15", "M4", "X2", "P"]
+        result = parse_intervals(names)
+
+        self.assertEqual(list(result.values), [Interval(n).semitones for n in names[:5]])
+        self.assertEqual(sorted(result.errors), [5, 6, 7])
+
+        intervals = parse_intervals(["A4", "m10"], as_intervals=True)
+        self.assertEqual([i.name() for i in intervals.values], ["A4", "m10"])
+
     def test_12tet_interval_ratio(self):
         self.assertAlmostEqual(Interval("P1").ratio, 1, delta=0.001)
         self.assertAlmostEqual(Interval("m2").ratio, 1.0595, delta=0.001)
@@ -75,6 +175,32 @@ class PyChordUnitTests(unittest.TestCase):
         self.assertAlmostEqual(Interval("M7").ratio, 1.8877, delta=0.001)
         self.assertAlmostEqual(Interval("P8").ratio, 2, delta=0.001)
 
+    def test_cents(self):
+        self.assertEqual(Interval("P5").cents() + Interval("P4").cents(), OCTAVE_CENTS)
+        self.assertEqual(Interval("M3").cents(), Cents(400))
+        self.assertEqual(Cents(0.1) + Cents(0.2), Cents(0.3))
+        self.assertEqual(hash(Cents(0.1) + Cents(0.2)), hash(Cents(0.3)))
+        self.assertEqual(hash(Cents(1200)), hash(Cents(1200.0)))
+        self.assertEqual(Cents(0.0), -Cents(0.0))
+        self.assertEqual(SEMITONE_CENTS * 7, Interval("P5").cents())
+        self.assertEqual(-Cents(700), Cents(-700))
+        self.assertEqual(Cents(700).compliment(), Cents(500))
+        self.assertLess(Cents(699.9), Cents(700))
+        self.assertEqual(sorted([Cents(700), Cents(-100), Cents(0)]), [Cents(-100), Cents(0), Cents(700)])
+
+        self.assertAlmostEqual(Cents(700).to_ratio().ratio, Interval("P5").ratio)
+        self.assertAlmostEqual(Ratio(1.5).cents().cents, 701.955, places=3)
+        self.assertAlmostEqual(OCTAVE_RATIO.cents().cents, 1200)
+
+        self.assertAlmostEqual((Tone(440) + Cents(1200)).frequency, 880)
+        self.assertAlmostEqual((Note("A4") - Cents(1200)).frequency, 220)
+        self.assertAlmostEqual((Note("A4") + Interval("m3").cents()).frequency, Note("C5").frequency)
+
+        # The ratios are computed from a table and still match composing the semitone and octave ratios
+        for semitones in range(-30, 30):
+            interval = (SEMITONE_RATIO * (abs(semitones) % 12)) + (OCTAVE_RATIO * (abs(semitones) // 12))
+            self.assertEqual(Interval(semitones).ratio, (interval if semitones >= 0 else -interval).ratio)
+
     def test_12tet_interval_arithmetic(self):
         self.assertEqual(Interval(1), -Interval(-1))
         self.assertNotEqual(Interval(1), Interval(2))
@@ -110,6 +236,53 @@ class PyChordUnitTests(unittest.TestCase):
         self.assertEqual((-Ratio(1.5)), Ratio(1 / 1.5))
         self.assertEqual(Ratio(1.25).compliment(), Ratio(1.6))
 
+    def test_value_semantics(self):
+        self.assertEqual(len({Note("C#4"), Note("Db4"), Note(49), Note("D4")}), 2)
+        self.assertEqual(len({Interval("A4"), Interval("d5"), Interval(7)}), 2)
+        self.assertEqual({Note("A4"): 1}[Note(57)], 1)
+        self.assertEqual(len({IONIAN, PHRYGIAN >> 2, DORIAN}), 2)
+        self.assertEqual(len({IONIAN.to_scale(Note("C")), IONIAN.to_scale(Note("C4"))}), 1)
+
+        self.assertEqual(sorted([Note("E4"), Note("Cb4"), Note("C4")]), [Note("B3"), Note("C4"), Note("E4")])
+        self.assertEqual(
+            sorted([Interval("P5"), -Interval("m2"), Interval("A4")]), [Interval(-1), Interval(6), Interval(7)]
+        )
+        self.assertLess(Note("B3"), Note("C4"))
+        self.assertGreaterEqual(Note("C#4"), Note("Db4"))
+        self.assertEqual(Note("A4"), Tone(Note("A4").frequency))
+        self.assertIn(Tone(Note("A4").frequency), {Note("A4")})
+        self.assertIn(Note(-21), {Tone(Note(-21).frequency)})
+        self.assertEqual(hash(Interval(12)), hash(Ratio(2.0)))
+        self.assertEqual(hash(Interval(0)), hash(Ratio(1.0)))
+        self.assertIn(Ratio(Interval(-5).ratio), {Interval(-5)})
+
+        note = Note("Db4")
+        with self.assertRaises(AttributeError):
+            note.semitone = 0
+        with self.assertRaises(AttributeError):
+            del Interval(3).quality
+        with self.assertRaises(AttributeError):
+            IONIAN.intervals = ()
+        with self.assertRaises(AttributeError):
+            Note(1).velocity = 100
+
+        values = [
+            note,
+            Interval("A4"),
+            Ratio(1.5),
+            Cents(702),
+            Tone(440),
+            IONIAN,
+            IONIAN.to_scale(note),
+            Chord("Bb", "m7"),
+        ]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for value in values:
+                self.assertEqual(pickle.loads(pickle.dumps(value, protocol)), value)
+        self.assertEqual(pickle.loads(pickle.dumps(note, 0)).name(), "Db4")
+        self.assertEqual(copy.deepcopy(Interval("A4")).name(), "A4")
+        self.assertEqual(copy.copy(IONIAN), IONIAN)
+
     def test_modes_scales(self):
         self.assertEqual(
             IONIAN.to_scale(Note("C")),
@@ -140,6 +313,732 @@ class PyChordUnitTests(unittest.TestCase):
 
         self.assertEqual(AEOLIAN.to_scale(Note("A3")), IONIAN.to_scale(Note("C")) >> 2)
 
+    def test_spelling(self):
+        def names(notes):
+            return [note.name() for note in notes]
+
+        self.assertEqual(names(IONIAN.to_scale(Note("F4")).notes), "F4 G4 A4 Bb4 C5 D5 E5".split())
+        self.assertEqual(names(LYDIAN.to_scale(Note("F4")).notes), "F4 G4 A4 B4 C5 D5 E5".split())
+        self.assertEqual(names(AEOLIAN.to_scale(Note("Eb4")).notes), "Eb4 F4 Gb4 Ab4 Bb4 Cb5 Db5".split())
+        self.assertEqual(names(IONIAN.to_scale(Note("C#4")).notes), "C#4 D#4 E#4 F#4 G#4 A#4 B#4".split())
+        self.assertEqual([interval.name() for interval in LYDIAN.intervals], "P1 M2 M3 A4 P5 M6 M7".split())
+        self.assertEqual(Mode.from_mask(0b100110101101).intervals[1], Interval("M2"))
+        self.assertEqual(mask_intervals(0b100110101101)[6].name(), "M7")
+        self.assertEqual((Note("C4") - Interval("A4")).name(), "Gb3")
+        self.assertEqual((Note("E4") - Interval("A2")).name(), "Db4")
+        self.assertEqual((Note("C4") - Interval("d7")).name(), "D#3")
+        self.assertEqual((Note("C4") - Interval("d2")).name(), "B#3")
+        self.assertEqual((-Interval("A4")).name(), "-A4")
+        for note, interval in itertools.product(["C4", "F#4", "Bb3"], ["A4", "d5", "A2", "d7", "A6", "d3", "A1"]):
+            self.assertEqual((Note(note) + Interval(interval) - Interval(interval)).name(), note)
+            self.assertEqual((Note(note) - Interval(interval) + Interval(interval)).name(), note)
+        self.assertEqual(names(Scale.from_mask(IONIAN.mask, Note("D4")).notes), "D4 E4 F4 G4 A4 B4 C5".split())
+        with self.assertRaises(ValueError):
+            Scale.from_mask(IONIAN.mask, Note("Db4"))
+
+        self.assertEqual((Note("F4") + Interval("P4")).name(), "Bb4")
+        self.assertEqual((Note("F4") + Interval("A3")).name(), "A#4")
+        self.assertEqual((Note("B#4") + Interval("M3")).name(), "D##5")
+        self.assertEqual((Note("Cb4") - Interval("M3")).name(), "Abb3")
+        self.assertEqual((Note("E4") - Interval("m2")).name(), "D#4")
+        self.assertEqual((Note("B3") + Interval("m9")).name(), "C5")
+        self.assertEqual((Note("C4") - Interval("P8")).name(), "C3")
+        self.assertEqual(Interval("A2").semitones, 3)
+        self.assertEqual(Interval("d7").semitones, 9)
+        # More than a double accidental falls back to the default spelling
+        self.assertEqual((Note("Bbb4") + Interval("d2")).name(), "A4")
+
+        scale = IONIAN.to_scale(Note("Eb4"))
+        self.assertEqual(names((scale << 1).notes), "F4 G4 Ab4 Bb4 C5 D5 Eb5".split())
+        self.assertEqual(names((scale >> 10).notes), "Bb2 C3 D3 Eb3 F3 G3 Ab3".split())
+        self.assertEqual(names(scale[5:12:3]), ["C5", "F5", "Bb5"])
+        self.assertEqual(scale[-1].name(), "D4")
+        self.assertEqual(Note("A#4").following(Note("C4")).name(), "A#4")
+        self.assertEqual(Note("Bb4").preceding(Note("C4")).name(), "Bb3")
+        self.assertEqual(names(Chord("C", "aug").notes), ["C4", "E4", "G#4"])
+        self.assertEqual(names(Chord("F", "m7").notes), ["F4", "Ab4", "C5", "Eb5"])
+        self.assertEqual(names(Chord("C", "dim7").notes), ["C4", "Eb4", "Gb4", "Bbb4"])
+        self.assertEqual(names(Chord("Bb", "dim7").notes), ["Bb4", "Db5", "Fb5", "Abb5"])
+        self.assertEqual(names(Chord("C", "6").notes), ["C4", "E4", "G4", "A4"])
+        for quality, semitones in CHORD_QUALITY_TO_SEMITONES.items():
+            self.assertEqual(tuple(i.semitones for i in Chord("C", quality).intervals()), semitones)
+
+    def test_catalog(self):
+        self.assertEqual(len(list(CATALOG)), len(CATALOG))
+        self.assertEqual(LYDIAN.identify().names, ("Lydian",))
+        self.assertEqual(LYDIAN.identify().forte, "7-35")
+        self.assertEqual(Mode.from_name("phrygian  Dominant").mask, pitch_class_mask([0, 1, 4, 5, 7, 8, 10]))
+        self.assertEqual(Mode.from_name("Major"), IONIAN)
+        self.assertEqual(CATALOG.lookup("Altered").identify().names, ("Altered",))
+        self.assertEqual(CATALOG.identify(0b000010010001).name(), "3-11")
+        with self.assertRaises(ValueError):
+            Mode.from_name("Superlydian")
+        with self.assertRaises(ValueError):
+            CATALOG.identify(0b10)
+        with self.assertRaises(ValueError):
+            CATALOG.identify(0x1001)
+        with self.assertRaises(ValueError):
+            CATALOG.identify(-1)
+        with self.assertRaises(TypeError):
+            CATALOG.identify("Ionian")
+
+        # One Forte number per set class, with the classic counts per size
+        entries = list(CATALOG)
+        classes = {}
+        for entry in entries:
+            self.assertEqual(pitch_class_mask(entry.normal_form), entry.mask)
+            self.assertEqual(entry.prime_form, prime_form(entry.mask))
+            classes.setdefault(entry.forte, set()).add(entry.prime_form)
+        self.assertTrue(all(len(primes) == 1 for primes in classes.values()))
+        counts = {}
+        for forte in classes:
+            counts[int(forte.split("-")[0])] = counts.get(int(forte.split("-")[0]), 0) + 1
+        self.assertEqual([counts[size] for size in range(1, 13)], [1, 6, 12, 29, 38, 50, 38, 29, 12, 6, 1, 1])
+        self.assertEqual(sum(1 for forte in classes if "Z" in forte), 46)
+
+        # Prime forms follow Forte, most packed to the left
+        self.assertEqual(CATALOG.set_class("5-20")[0].prime_form, (0, 1, 3, 7, 8))
+        self.assertEqual(CATALOG.set_class("4-Z29")[0].prime_form, (0, 1, 3, 7))
+        self.assertEqual(CATALOG.set_class("6-Z44")[0].forte, "6-Z44")
+        self.assertEqual(CATALOG.set_class("6-z29"), CATALOG.set_class("6-Z29"))
+        self.assertEqual(CATALOG.set_class("6-3")[0].interval_vector, CATALOG.set_class("6-36")[0].interval_vector)
+        self.assertEqual(CATALOG.identify(Mode.from_name("Melodic Minor")).forte, "7-34")
+        self.assertEqual(CATALOG.identify(Mode.from_name("Harmonic Minor")).forte, "7-32")
+        self.assertEqual(CATALOG.identify(Mode.from_name("Octatonic")).forte, "8-28")
+        self.assertEqual(interval_vector(IONIAN.mask), (2, 5, 4, 3, 6, 1))
+        self.assertEqual(normal_form(pitch_class_mask([0, 4, 7, 11])), (11, 0, 4, 7))
+
+        # Modes of one scale are transpositions of each other, major and minor triads only inversions
+        self.assertTrue(CATALOG.equivalent(DORIAN, LOCRIAN))
+        self.assertFalse(CATALOG.equivalent(IONIAN, Mode.from_name("Melodic Minor")))
+        self.assertFalse(CATALOG.equivalent(0b000010010001, 0b000010001001))
+        self.assertTrue(CATALOG.equivalent(0b000010010001, 0b000010001001, inversion=True))
+        self.assertEqual(
+            IONIAN.identify(),
+            Mode(
+                [
+                    Interval("P8"),
+                    Interval("M9"),
+                    Interval("M3"),
+                    Interval("P4"),
+                    Interval("P5"),
+                    Interval("M6"),
+                    Interval("M7"),
+                ]
+            ).identify(),
+        )
+
+    def test_scale_ranges(self):
+        scale = IONIAN.to_scale(Note("C4"))
+
+        self.assertEqual(scale[7], Note("C5"))
+        self.assertEqual(scale[-1], Note("B3"))
+        self.assertEqual(scale[16], Note("E6"))
+        self.assertEqual(scale[:], scale.notes)
+        self.assertEqual(scale[::-1], scale.notes[::-1])
+        self.assertEqual(scale[5:9], (Note("A4"), Note("B4"), Note("C5"), Note("D5")))
+        self.assertEqual(scale[2:-5:-3], (Note("E4"), Note("B3"), Note("F3")))
+
+        arpeggio = scale.range(0, 10, 2)
+        self.assertNotIsInstance(arpeggio, (list, tuple))
+        self.assertEqual(list(arpeggio), [Note("C4"), Note("E4"), Note("G4"), Note("B4"), Note("D5")])
+        self.assertEqual(list(scale.range(1, -2, -1, semitones=True)), [50, 48, 47])
+        self.assertEqual(list(zip(range(3), scale.range(20)))[-1], (2, Note("D7")))
+
+        for step in (1, 3, 7, 9, -1, -2, -8):
+            self.assertEqual(list(scale.range(-10, 30 * step, step)), [scale[i] for i in range(-10, 30 * step, step)])
+
+        with self.assertRaises(ValueError):
+            scale.range(0, 10, 0).__next__()
+
+    def test_scale_shifted(self):
+        scale = Scale([Note("C4"), Note("E4"), Note("Fb4"), Note("G#5"), Note("D4")])
+
+        # Reference implementation moving one note at a time
+        def shifted(notes, steps):
+            notes = list(notes)
+            for _ in range(abs(steps)):
+                if steps < 0:
+                    notes.insert(0, notes.pop(-1).preceding(notes[0]))
+                else:
+                    notes.append(notes.pop(0).following(notes[-1]))
+            return notes
+
+        for steps in range(-23, 24):
+            self.assertEqual(
+                [note.name() for note in (scale << steps).notes], [note.name() for note in shifted(scale.notes, steps)]
+            )
+
+        major = IONIAN.to_scale(Note("C4"))
+        self.assertEqual((major << 7002).notes, tuple(Note(note.semitone + 12000) for note in (major << 2).notes))
+        self.assertEqual((major >> 7002).notes, tuple(Note(note.semitone - 12000) for note in (major >> 2).notes))
+        self.assertEqual(Scale([Note("C4")]) << 2, Scale([Note("C6")]))
+        self.assertEqual(Scale([]) << 2, Scale([]))
+
+    def test_interning(self):
+        self.assertIsNot(Note(60), Note(60))
+        self.assertNotIn("__call__", vars(Interned))
+
+        Note.cache.enable(maxsize=2)
+        Interval.cache.enable()
+
+        try:
+            self.assertIs(Note(60), Note(60))
+            self.assertIs(Note("C#4"), Note("C#4"))
+            self.assertIsNot(Note("C#4"), Note("Db4"))
+            self.assertEqual(Note.cache.info(), CacheInfo(hits=3, misses=3, maxsize=2, currsize=2))
+
+            # Note(60) is the least recently used entry and was evicted by Note("Db4")
+            self.assertEqual(Note(60), Note(60))
+            self.assertEqual(Note.cache.misses, 4)
+
+            self.assertIs(Interval(7), Interval(7))
+            self.assertIs(Note(12) + Interval(7), Note(19))
+            self.assertIs(Note("C#4").in_octave(2), Note("C#4").in_octave(2))
+            self.assertEqual((Note("C0") + Interval(-4)).name(), "Ab-1")
+            self.assertIs(Note("C0") + Interval(-4), Note("C0") + Interval(-4))
+            self.assertEqual(Note("Db0").in_octave(-1).name(), "Db-1")
+        finally:
+            Note.cache.disable()
+            Interval.cache.disable()
+
+        self.assertEqual(len(Note.cache), 0)
+        self.assertIsNot(Interval(7), Interval(7))
+        self.assertNotIn("__call__", vars(Interned))
+
+        Interval.cache.enable()
+
+        try:
+            self.assertIsNot(Note(60), Note(60))
+        finally:
+            Interval.cache.disable()
+
+        with self.assertRaises(ValueError):
+            InternCache(0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_note_array(self):
+        notes = [Note("C4"), Note("A4"), Note("Eb2"), Note(-3)]
+        array = NoteArray(notes)
+
+        self.assertEqual(len(array), 4)
+        self.assertEqual(array.to_notes(), notes)
+        self.assertEqual(array[1], Note("A4"))
+        self.assertEqual(array[1:], NoteArray(notes[1:]))
+        self.assertEqual(NoteArray(np.array([48, 57, 27, -3], dtype=np.int16)), array)
+
+        self.assertEqual(array.octaves().tolist(), [n.octave for n in notes])
+        self.assertEqual(array.pitch_classes().tolist(), [0, 9, 3, 9])
+        self.assertEqual(array.frequencies().tolist(), [n.frequency for n in notes])
+        self.assertAlmostEqual(array.frequencies()[1], 440, delta=0.001)
+        just = Tuning.just()
+        self.assertEqual(array.frequencies(just).tolist(), list(just.frequencies(notes)))
+        with self.assertRaises(IndexError):
+            NoteArray([200]).frequencies(just)
+
+        self.assertEqual((array + Interval("P5")).to_notes(), [n + Interval("P5") for n in notes])
+        self.assertEqual(array - 12, NoteArray([n - Interval("P8") for n in notes]))
+        self.assertEqual(array.transposed(IntervalArray([0, 1, 2, 3])), NoteArray([48, 58, 29, 0]))
+
+        intervals = array - NoteArray([48, 48, 48, 48])
+        self.assertIsInstance(intervals, IntervalArray)
+        self.assertEqual(intervals.to_intervals(), [Interval(0), Interval(9), Interval(-21), Interval(-51)])
+
+        scale = IONIAN.to_scale(Note("C"))
+        self.assertEqual(NoteArray(scale).to_scale(), scale)
+
+        with self.assertRaises(TypeError):
+            NoteArray(np.array([1.5]))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_interval_array(self):
+        semitones = [0, 1, 6, 7, 12, 15, 24, -4, -19]
+        intervals = [Interval(i) for i in semitones]
+        array = IntervalArray(intervals)
+
+        self.assertEqual(array.names().tolist(), [i.name() for i in intervals])
+        self.assertEqual(array.qualities().tolist(), [i.quality for i in intervals])
+        self.assertEqual(array.quantities().tolist(), [i.quantity for i in intervals])
+        self.assertEqual(array.ratios().tolist(), [i.ratio for i in intervals])
+
+        self.assertEqual(array.decompound().to_intervals(), [i.decompound() for i in intervals])
+        self.assertEqual(array.compliment().to_intervals(), [i.compliment() for i in intervals])
+        self.assertEqual((-array).to_intervals(), [-i for i in intervals])
+        self.assertEqual((array * 2).to_intervals(), [i * 2 for i in intervals])
+        self.assertEqual((array + Interval("P5")).to_intervals(), [i + Interval("P5") for i in intervals])
+        self.assertEqual((array - array).semitones.tolist(), [0] * len(intervals))
+        self.assertEqual((12 - array).to_intervals(), array.compliment().to_intervals())
+
+        self.assertEqual(IntervalArray.from_names(["P1", "m10", "A4"]), IntervalArray([0, 15, 6]))
+        with self.assertRaises(ValueError):
+            IntervalArray.from_names(["P1", "Q4"])
+
+        melody = NoteArray([Note("C4"), Note("E4"), Note("G4"), Note("C4")])
+        self.assertEqual(melody.melodic_intervals().names().tolist(), ["M3", "m3", "-P5"])
+
+    def test_pitch_class_masks(self):
+        self.assertEqual(IONIAN.mask, 0b101010110101)
+        self.assertEqual(Mode.from_mask(IONIAN.mask), IONIAN)
+        self.assertEqual(rotate_mask(IONIAN.mask, 2), DORIAN.mask)
+        self.assertEqual(mask_pitch_classes(AEOLIAN.mask), (0, 2, 3, 5, 7, 8, 10))
+
+        for steps in range(-8, 15):
+            legacy = [
+                (IONIAN.intervals[(i + steps % 7) % 7] - IONIAN.intervals[steps % 7]).decompound() for i in range(7)
+            ]
+            self.assertEqual(IONIAN << steps, Mode(legacy))
+
+        # Modes that are not ascending within an octave keep their interval order when shifted
+        self.assertEqual(
+            Mode([Interval(0), Interval(7), Interval(4)]) << 1, Mode([Interval(0), Interval(9), Interval(5)])
+        )
+
+        self.assertIn(Interval("M3"), IONIAN)
+        self.assertIn(Interval("M10"), IONIAN)
+        self.assertNotIn(Interval("m3"), IONIAN)
+        self.assertIn(3, AEOLIAN)
+
+        self.assertEqual(IONIAN | AEOLIAN, Mode.from_mask(0b111110111101))
+        self.assertEqual(IONIAN & AEOLIAN, Mode([Interval(i) for i in (0, 2, 5, 7)]))
+        self.assertTrue((IONIAN & AEOLIAN).issubset(IONIAN))
+        self.assertTrue(IONIAN.issuperset(IONIAN & AEOLIAN))
+        self.assertFalse(IONIAN.issubset(AEOLIAN))
+
+        c_major = IONIAN.to_scale(Note("C"))
+        a_minor = AEOLIAN.to_scale(Note("A3"))
+        self.assertEqual(c_major.mask, a_minor.mask)
+        self.assertTrue(c_major.issubset(a_minor) and c_major.issuperset(a_minor))
+        self.assertIn(Note("E7"), c_major)
+        self.assertNotIn(Note("Eb4"), c_major)
+        self.assertEqual(Scale.from_mask(a_minor.mask, Note("A3")), a_minor)
+        self.assertEqual(c_major.union(AEOLIAN.to_scale(Note("C"))).mask, (IONIAN | AEOLIAN).mask)
+        self.assertEqual(c_major.intersection(AEOLIAN.to_scale(Note("C"))).notes[-1], Note("G4"))
+        self.assertEqual(c_major.intersection(IONIAN.to_scale(Note("Db4"))).notes, (Note("C4"), Note("F4")))
+
+    def test_key_index(self):
+        notes = [Note("C"), Note("E"), Note("G"), Note("B")]
+        keys = KEY_INDEX.keys_containing(notes)
+
+        brute_force = [
+            (Note(tonic + 48), mode)
+            for mode in [IONIAN, DORIAN, PHRYGIAN, LYDIAN, MIXOLYDIAN, AEOLIAN, LOCRIAN]
+            for tonic in range(12)
+            if all(note in mode.to_scale(Note(tonic)) for note in notes)
+        ]
+        self.assertEqual(list(keys), brute_force)
+        self.assertIn((Note("C4"), IONIAN), keys)
+        self.assertIn((Note("E4"), PHRYGIAN), keys)
+        self.assertNotIn((Note("F4"), IONIAN), keys)
+
+        self.assertEqual(len(KEY_INDEX.keys_containing(IONIAN.to_scale(Note("D")))), 7)
+        self.assertEqual(KEY_INDEX.keys_containing([Note("C"), Note("C#"), Note("D")]), ())
+
+        self.assertEqual(KEY_INDEX.best_key(notes), (Note("C4"), IONIAN))
+        self.assertEqual(KEY_INDEX.best_key([Note("D3"), Note("F#5"), Note("A")]), (Note("D4"), IONIAN))
+        self.assertEqual(KEY_INDEX.best_key([Note("C"), Note("C#"), Note("D")]), (Note("C4"), IONIAN))
+        self.assertIsNone(KEY_INDEX.best_key([]))
+
+        index = KeyIndex([IONIAN])
+        harmonic_minor = Mode([Interval(i) for i in (0, 2, 3, 5, 7, 8, 11)])
+        self.assertEqual(index.keys_containing([Note("G#"), Note("A"), Note("F")]), ())
+        index.register(harmonic_minor)
+        index.register(IONIAN)
+        self.assertEqual(index.modes, [IONIAN, harmonic_minor])
+        self.assertEqual(
+            index.keys_containing([Note("G#"), Note("A"), Note("F"), Note("C")]), ((Note("A4"), harmonic_minor),)
+        )
+
+    def test_chords(self):
+        chord = parse_chord("Cmaj7/G")
+        self.assertEqual(chord.root, Note("C4"))
+        self.assertEqual(chord.quality, "maj7")
+        self.assertEqual(chord.bass, Note("G3"))
+        self.assertEqual(chord.notes, (Note("G3"), Note("C4"), Note("E4"), Note("B4")))
+        self.assertEqual(chord.name(), "Cmaj7/G")
+        self.assertIs(parse_chord("Cmaj7/G"), chord)
+
+        self.assertEqual(parse_chord("F#m").notes, (Note("F#4"), Note("A4"), Note("C#5")))
+        self.assertEqual(parse_chord("Bbø").name(), "Bbm7b5")
+        self.assertEqual(parse_chord("C/Bb").name(), "C/Bb")
+        self.assertEqual(parse_chord("Am/A"), parse_chord("Am"))
+        self.assertEqual(parse_chord("E7"), Chord(Note("E4"), "7"))
+        self.assertEqual(Chord("D", "m9").intervals(), [Interval(i) for i in (0, 3, 7, 10, 14)])
+        self.assertIn(Note("E1"), chord)
+        self.assertNotIn(Note("F4"), chord)
+
+        for symbol in ["H7", "Cfoo", "C/X", "", "/C"]:
+            with self.assertRaises(ValueError):
+                parse_chord(symbol)
+
+        with self.assertRaises(ValueError):
+            Chord("C", "maj13")
+
+        self.assertEqual(recognize_chord(parse_chord("Cmaj7/G").notes), ("Cmaj7/G",))
+        self.assertEqual(recognize_chord([Note("C4"), Note("E4"), Note("G4"), Note("A4")]), ("C6", "Am7/C"))
+        self.assertEqual(recognize_chord([Note("A3"), Note("C4"), Note("E4"), Note("G5")]), ("Am7", "C6/A"))
+        self.assertEqual(recognize_chord([Note("E2"), Note("G#3"), Note("B4"), Note("E5")]), ("E",))
+        self.assertEqual(recognize_chord([Note("C4"), Note("C#4")]), ())
+        self.assertEqual(recognize_chord([]), ())
+        self.assertEqual(recognize_chord(parse_chord("Ebm7").notes), ("Ebm7", "Gb6/Eb"))
+        self.assertEqual(recognize_chord([58, 62, 65]), ("A#",))
+        for name in ["Bb", "Ebm7", "Abmaj7", "Dbdim7", "Gb7/Bb", "Cb"]:
+            self.assertEqual(recognize_chord(parse_chord(name).notes)[0], name)
+
+    def test_batch_analysis(self):
+        melody = [Note("C4"), Note("E4"), Note("G4"), Note("E4"), Note("C5")]
+        analysis = analyze(melody)
+        self.assertEqual((analysis.notes, analysis.lowest, analysis.highest), (5, 48, 60))
+        self.assertEqual(analysis.range(), (Note("C4"), Note("C5")))
+        self.assertEqual(analysis.intervals, {-3: 1, 3: 1, 4: 1, 8: 1})
+        self.assertEqual(analysis.pitch_classes, (2, 0, 0, 0, 2, 0, 0, 1, 0, 0, 0, 0))
+        self.assertEqual(analysis.keys()[0], (Note("C4"), IONIAN))
+        self.assertEqual(len(analysis.keys()), len(KEY_INDEX.keys_containing(melody)))
+        self.assertIsNone(analyze([]).range())
+
+        corpus = [[(i * 7 + j * 5) % 40 + 30 for j in range(i % 17)] for i in range(200)]
+        inline = list(analyze_batch(corpus, workers=0, chunksize=7))
+        self.assertEqual(inline, [analyze(sequence) for sequence in corpus])
+        self.assertEqual(list(analyze_batch(corpus, workers=2, chunksize=9)), inline)
+
+        merged = analyze_corpus(corpus, workers=0)
+        self.assertEqual(merged, merge_analyses(reversed(inline)))
+        self.assertEqual(merged.notes, sum(len(sequence) for sequence in corpus))
+        self.assertEqual((merged.lowest, merged.highest), (30, 69))
+        self.assertEqual(sum(merged.intervals.values()), sum(max(len(sequence) - 1, 0) for sequence in corpus))
+        self.assertEqual(list(merged.intervals), sorted(merged.intervals))
+        with self.assertRaises(ValueError):
+            list(analyze_batch(corpus, chunksize=0))
+
+    def test_midi(self):
+        track = bytes.fromhex("00903c64" "004050" "603c00" "00f00201f7" "00c005" "1e804000" "00ff2f00")
+        tempo = bytes.fromhex("00ff510307a120" "00ff2f00")
+        data = (
+            b"MThd"
+            + bytes.fromhex("00000006" "0001" "0002" "0060")
+            + b"MTrk"
+            + len(tempo).to_bytes(4, "big")
+            + tempo
+            + b"MTrk"
+            + len(track).to_bytes(4, "big")
+            + track
+        )
+
+        with MidiFile(data) as midi:
+            self.assertEqual((midi.format, midi.track_count, midi.ticks_per_beat), (1, 2, 96))
+            self.assertEqual(len(midi.tracks()), 2)
+            self.assertEqual(
+                list(midi.events()), [NoteEvent(0, 96, Note("C4"), 100, 0, 1), NoteEvent(0, 126, Note("E4"), 80, 0, 1)]
+            )
+
+        # Notes come out in onset order even when a later note ends first, unterminated notes end with the track
+        events = [
+            NoteEvent(0, 960, Note("C3"), 90, 1),
+            NoteEvent(240, 120, Note("G4")),
+            NoteEvent(480, 480, Note("E4")),
+            NoteEvent(480, 480, Note("E4")),
+        ]
+        f = io.BytesIO()
+        write_midi(f, events, ticks_per_beat=240)
+        self.assertEqual(list(read_midi(f.getvalue())), events)
+        self.assertEqual(list(read_midi(data[:-4]))[-1].duration, 126)
+        with self.assertRaises(ValueError):
+            list(read_midi(data[:-6]))
+
+        f = io.BytesIO()
+        write_midi(f, IONIAN.to_scale(Note("A3")))
+        self.assertEqual([event.note for event in read_midi(f.getvalue())], list(IONIAN.to_scale(Note("A3")).notes))
+        self.assertEqual([event.onset for event in read_midi(f.getvalue())], list(range(0, 480 * 7, 480)))
+        for invalid in [
+            NoteEvent(0, -10, Note("C4")),
+            NoteEvent(-1, 10, Note("C4")),
+            NoteEvent(0, 10, Note("C4"), channel=16),
+            NoteEvent(0, 10, Note("C4"), velocity=128),
+            NoteEvent(0, 10, Note("C4"), velocity=0),
+        ]:
+            with self.assertRaises(ValueError):
+                write_midi(io.BytesIO(), [invalid])
+        with self.assertRaises(ValueError):
+            write_midi(io.BytesIO(), [Note("C4")], velocity=-1)
+        with self.assertRaises(ValueError):
+            write_midi(io.BytesIO(), [Note("C4")], ticks_per_beat=0)
+        with self.assertRaises(ValueError):
+            write_midi(io.BytesIO(), [Note("C4")], ticks_per_beat=0x8000)
+        with self.assertRaises(ValueError):
+            write_midi(io.BytesIO(), [Note("C4")], tempo=1 << 24)
+
+        self.assertEqual(notes_to_midi([Note("C4"), Note("A0"), 0]).tolist(), [60, 21, 12])
+        self.assertEqual(midi_to_notes([60, 127]), [Note("C4"), Note("G9")])
+        with self.assertRaises(ValueError):
+            notes_to_midi([Note("A9")])
+        with self.assertRaises(ValueError):
+            MidiFile(b"RIFF0000000000")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_key_detection(self):
+        self.assertEqual(mode_profile(IONIAN).tolist(), list(KEY_PROFILE_MAJOR))
+        self.assertEqual(mode_profile(DORIAN).tolist(), [2, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 0])
+
+        detector = KeyDetector()
+        self.assertIsNone(detector.best())
+        self.assertEqual(list(detector.process(IONIAN.to_scale(Note("G3")).notes))[-1], (Note("G4"), IONIAN))
+
+        # A minor arpeggios, then the window slides over to E major
+        detector = KeyDetector(window=8)
+        a_minor = [Note("A3"), Note("C4"), Note("E4"), Note("A4"), Note("B3"), Note("G#3"), Note("A3"), Note("E4")]
+        e_major = [Note("E3"), Note("G#3"), Note("B3"), Note("E4"), Note("F#3"), Note("D#4"), Note("E4"), Note("B3")]
+        self.assertEqual(list(detector.process(a_minor))[-1], (Note("A4"), AEOLIAN))
+        self.assertEqual(list(detector.process(e_major))[-1], (Note("E4"), IONIAN))
+        self.assertEqual(detector.histogram.sum(), 8)
+
+        # The incremental histogram matches one rebuilt from the window
+        self.assertEqual(
+            detector.histogram.tolist(), np.bincount([n.semitone % 12 for n in e_major], minlength=12).tolist()
+        )
+        scores = detector.scores()
+        self.assertEqual(scores.shape, (24,))
+        self.assertAlmostEqual(
+            scores[detector.keys.index((Note("E4"), IONIAN))],
+            np.corrcoef(detector.histogram, np.roll(KEY_PROFILE_MAJOR, 4))[0, 1],
+        )
+
+        detector = KeyDetector(window=4, modes=[IONIAN, DORIAN])
+        self.assertEqual(len(detector.keys), 24)
+        detector.push(NoteEvent(0, 10, Note("D4")))
+        detector.push(Note("F4"))
+        self.assertEqual(detector.histogram[2], 10)
+        detector.reset()
+        self.assertIsNone(detector.best())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_voice_leading(self):
+        candidates = voicings(parse_chord("G7"), ranges=(Note("C3"), Note("C5")))
+        self.assertEqual(candidates[0].tolist(), [43, 47, 50, 53])
+        self.assertTrue(all(row[0] % 12 == 7 and pitch_class_mask(row) == parse_chord("G7").mask for row in candidates))
+        self.assertEqual(voicings([0, 4, 7], 4, ranges=(60, 72)).tolist(), [[60, 64, 67, 72]])
+        self.assertEqual(len(voicings([0, 4, 7], 4, ranges=(60, 71))), 0)
+        self.assertEqual(voicing_distances(np.array([[0, 4, 7]]), np.array([[0, 5, 9], [-1, 2, 7]])).tolist(), [[3, 3]])
+        with self.assertRaises(ValueError):
+            voicings(parse_chord("G7"), 3)
+        with self.assertRaises(ValueError):
+            voicings([0, 4, 7], ranges=[(48, 60), (48, 72)])
+
+        # The dynamic programming path matches an exhaustive search over every combination of voicings
+        progression = [parse_chord(symbol) for symbol in ("C", "Am", "F", "G7", "C")]
+        result = voice_lead(progression, ranges=(Note("C4"), Note("C6")))
+        options = [voicings(chord, 4, (Note("C4"), Note("C6"))) for chord in progression]
+        best = min(
+            sum(int(np.abs(a - b).sum()) for a, b in zip(path, path[1:])) for path in itertools.product(*options)
+        )
+        self.assertEqual(result.motion, best)
+        self.assertEqual(
+            sum(
+                abs(b.semitone - a.semitone) for x, y in zip(result.voicings, result.voicings[1:]) for a, b in zip(x, y)
+            ),
+            best,
+        )
+        self.assertTrue(
+            all(voicing[0].letter == chord.bass.letter for voicing, chord in zip(result.voicings, progression))
+        )
+
+        result = voice_lead(
+            [[Note("C4"), Note("E4"), Note("G4")], [Note("F4"), Note("A4"), Note("C5")]], ranges=(48, 60)
+        )
+        self.assertEqual(
+            result, VoiceLeading([(Note("C4"), Note("E4"), Note("G4")), (Note("C4"), Note("F4"), Note("A4"))], 3)
+        )
+        self.assertEqual(voice_lead([Chord("F#"), Chord("Gb")]).motion, 0)
+        self.assertEqual(voice_lead([Chord("Gb")]).voicings[0][0], Note("Gb3"))
+        self.assertEqual(voice_lead([]), VoiceLeading([], 0))
+        with self.assertRaises(ValueError):
+            voice_lead([Chord("C")], ranges=(60, 62))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_render(self):
+        envelope = Envelope(attack=0.1, decay=0.1, sustain=0.5, release=0.1)
+        gains = envelope.gains(np.array([0, 0.05, 0.1, 0.15, 0.3, 0.5, 0.55, 0.6, 1]), 0.5)
+        self.assertTrue(np.allclose(gains, [0, 0.5, 1, 0.75, 0.5, 0.5, 0.25, 0, 0]))
+        self.assertTrue(np.allclose(Envelope(0, 0, 1, 0).gains(np.array([0, 0.49, 0.5]), 0.5), [1, 1, 0]))
+
+        scale = IONIAN.to_scale(Note("C4"))
+        samples = render(scale, 0.25, envelope, sample_rate=8000)
+        self.assertEqual(samples.dtype, np.int16)
+        self.assertEqual(len(samples), round((7 * 0.25 + 0.1) * 8000))
+        self.assertLessEqual(np.abs(samples).max(), 0.25 * 32767 + 1)
+
+        chunks = list(render_chunks(scale, 0.25, envelope, sample_rate=8000, chunk_size=1000))
+        self.assertTrue(all(len(chunk) == 1000 for chunk in chunks[:-1]))
+        self.assertTrue(np.array_equal(np.concatenate(chunks), samples))
+
+        # A single A4 crosses zero 880 times a second
+        tone = render([Note("A4")], 1, Envelope(0, 0, 1, 0), sample_rate=8000)
+        self.assertAlmostEqual(np.count_nonzero(np.diff(np.signbit(tone))), 880, delta=2)
+        shifted = render([Note("A4")], 1, Envelope(0, 0, 1, 0), sample_rate=8000, tuning=Tuning.equal(415))
+        self.assertAlmostEqual(np.count_nonzero(np.diff(np.signbit(shifted))), 830, delta=2)
+
+        f = io.BytesIO()
+        self.assertEqual(write_wav(f, chunks, 8000), len(samples))
+        f.seek(0)
+        with wave.open(f) as wav:
+            self.assertEqual((wav.getframerate(), wav.getsampwidth(), wav.getnchannels()), (8000, 2, 1))
+            self.assertTrue(np.array_equal(np.frombuffer(wav.readframes(len(samples)), "<i2"), samples))
+
+        self.assertEqual(len(render([])), 0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_quantize(self):
+        note, cents = nearest_note(Tone(445))
+        self.assertEqual(note, Note("A4"))
+        self.assertAlmostEqual(cents, 19.56, delta=0.01)
+        self.assertEqual(nearest_note(Note("C#2").frequency)[0], Note("C#2"))
+        with self.assertRaises(ValueError):
+            nearest_note(0)
+
+        frequencies = [Note(n).frequency for n in range(-12, 120)]
+        semitones, cents = quantize(np.array(frequencies) * 2 ** (10 / 1200))
+        self.assertEqual(semitones.tolist(), list(range(-12, 120)))
+        self.assertTrue(np.allclose(cents, 10))
+
+        semitones, cents = quantize([440.0, 0.0, np.nan, -1.0, 430.0])
+        self.assertEqual(semitones.tolist(), [57, UNVOICED, UNVOICED, UNVOICED, 57])
+        self.assertEqual(np.isnan(cents).tolist(), [False, True, True, True, False])
+
+        # A4 with a two frame octave error, then a real octave leap to A5 and a step to B5
+        track = [440, 440, 880, 880, 440, 0, 880, 880, 880, 880, 987.77]
+        expected = [57, 57, 57, 57, 57, UNVOICED, 57, 57, 69, 69, 71]
+        chunks = [track[:3], track[3:7], track[7:]]
+
+        smoothed = np.concatenate([semitones for semitones, _ in quantize_stream(chunks, octave_hold=3)])
+        self.assertEqual(smoothed.tolist(), expected)
+
+        raw = np.concatenate([semitones for semitones, _ in quantize_stream(chunks, octave_hold=1)])
+        self.assertEqual(raw.tolist(), quantize(track)[0].tolist())
+
+        with self.assertRaises(ValueError):
+            Quantizer(0)
+
+    def test_stream(self):
+        scale = IONIAN.to_scale(Note("F4"))
+        events = [NoteEvent(i, 1, Note(name)) for i, name in enumerate(["C4", "A#4", "B4", "E4", "F#4"])]
+        pipeline = Transpose(Interval("P5")) | SnapToScale(scale) | Harmonize(2, scale)
+
+        async def collect(pipeline, source):
+            return [event async for event in pipeline.run(source)]
+
+        output = asyncio.run(collect(pipeline, event_source(events)))
+        self.assertEqual([event.note.name() for event in output], "G4 Bb4 F5 A5 F5 A5 Bb4 D5 C5 E5".split())
+        self.assertEqual([event.onset for event in output], [0, 0, 1, 1, 2, 2, 3, 3, 4, 4])
+        self.assertEqual([(stats.events, stats.emitted) for stats in pipeline.stats], [(5, 5), (5, 5), (5, 10)])
+        self.assertTrue(all(stats.max_seconds >= stats.mean_seconds() > 0 for stats in pipeline.stats))
+        self.assertIn("harmonize 2", pipeline.report())
+
+        self.assertEqual(SnapToScale(scale, up=True).process(events[2]).note, Note("C5"))
+        self.assertEqual(SnapToScale(scale).process(events[1]).note.name(), "Bb4")
+        self.assertEqual(Harmonize(2, scale).process(events[2])[1].note.name(), "D5")
+        self.assertEqual(Harmonize(MAJOR_THIRD).process(events[0])[1].note, Note("E4"))
+        with self.assertRaises(ValueError):
+            Harmonize(2)
+        with self.assertRaises(TypeError):
+            Stage()
+
+        # Stages can be plain or async functions and drop events by returning None
+        async def delayed(event):
+            await asyncio.sleep(0)
+            return event
+
+        pipeline = Stage(lambda event: event if event.onset % 2 == 0 else None, "even") | Stage(delayed)
+        output = asyncio.run(collect(pipeline, event_source(events)))
+        self.assertEqual([event.onset for event in output], [0, 2, 4])
+        self.assertEqual(pipeline.stats[1].name, "delayed")
+
+        # A slow consumer holds back the source
+        produced = []
+
+        async def source():
+            for event in events * 20:
+                produced.append(event)
+                yield event
+
+        async def consume_slowly():
+            stream = Pipeline(Transpose(OCTAVE), buffer_size=1).run(source())
+            await stream.__anext__()
+            for _ in range(20):
+                await asyncio.sleep(0)
+            backlog = len(produced)
+            await stream.aclose()
+            return backlog
+
+        self.assertLess(asyncio.run(consume_slowly()), 8)
+
+        def fail(event):
+            raise RuntimeError("stage failed")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(collect(Pipeline(Stage(fail)), event_source(events)))
+        with self.assertRaises(ValueError):
+            Pipeline(buffer_size=0)
+        self.assertEqual(asyncio.run(collect(Pipeline(), event_source(events))), events)
+
+    def test_lazy_constants(self):
+        # Importing pychord creates no constants and does not import fractions or multiprocessing
+        script = (
+            "import sys, pychord; "
+            "modules = [pychord, pychord.interval, pychord.mode, pychord.ratio, pychord.keyindex, pychord.tuning, pychord.catalog]; "
+            "print([n for m in modules for n in ('OCTAVE', 'IONIAN', 'OCTAVE_RATIO', 'KEY_INDEX', 'EQUAL_TEMPERAMENT', 'CATALOG') "
+            "if n in vars(m)]); "
+            "print(any(name in sys.modules for name in ('fractions', 'multiprocessing'))); "
+            "print(pychord.DORIAN == pychord.mode.IONIAN << 1, pychord.TRITONE is pychord.interval.DIMINISHED_FIFTH)"
+        )
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split("\n")[:3], ["[]", "False", "True True"])
+
+        self.assertIs(OCTAVE, sys.modules["pychord.interval"].OCTAVE)
+        self.assertIn("IONIAN", dir(sys.modules["pychord.mode"]))
+        with self.assertRaises(AttributeError):
+            sys.modules["pychord.mode"].SUPERLOCRIAN
+        self.assertEqual(Ratio(1.5).compliment(), Ratio(1.0 / 0.75))
+        self.assertEqual(Ratio(1.5) * Fraction(1, 2), Ratio(1.5**0.5))
+
+    def test_profiling(self):
+        original = Note.__init__
+
+        with profiled() as stats:
+            self.assertIsNot(Note.__init__, original)
+            with self.assertRaises(RuntimeError):
+                enable()
+            Note("A4") + MAJOR_THIRD
+            Scale([Note("C4"), Note("E4"), Note("G4")]).shifted(1)
+
+        with profiled() as transposed:
+            notes = [Note("C4").in_octave(octave) for octave in range(8)] + [Note("C0") + Interval(-4)]
+
+        self.assertIs(Note.__init__, original)
+        self.assertEqual(transposed.instances["Note"], 2 * len(notes))
+        self.assertIsNone(disable())
+        self.assertEqual(stats.calls["Note.__add__"], 1)
+        self.assertEqual(stats.calls["Scale.shifted"], 1)
+        self.assertGreaterEqual(stats.calls["Tone.__init__"], stats.instances["Note"])
+        self.assertNotIn("Tone", stats.instances)
+        self.assertNotIn("Note.__repr__", stats.calls)
+        self.assertEqual(stats.hot_paths(1)[0][2], max(stats.seconds.values()))
+        self.assertIn("Scale.shifted", stats.report())
+
+        script = "import pychord; pychord.Note('C4')"
+        environment = {**os.environ, PROFILE_ENVIRONMENT_VARIABLE: "1"}
+        report = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=environment).stderr
+        self.assertIn("Note.__init__", report)
+
+    def test_benchmarks(self):
+        current = run(["note.init_int", "mode.shifted"], repeat=1)
+        self.assertEqual(list(current["results"]), ["note.init_int", "mode.shifted"])
+        self.assertEqual(current["results"]["note.init_int"]["items"], BENCHMARKS["note.init_int"][2])
+        self.assertEqual(compare(current, current), {})
+
+        slower = {"results": {name: dict(result) for name, result in current["results"].items()}}
+        slower["results"]["mode.shifted"]["seconds_per_item"] *= 2
+        self.assertEqual(list(compare(slower, current, 0.5)), ["mode.shifted"])
+        self.assertEqual(compare(slower, current, 1.5), {})
+        self.assertEqual(compare(current, {"results": {}}), {})
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
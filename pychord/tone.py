@@ -1,18 +1,21 @@
 from typing import Union
 
-from pychord.ratio import Ratio
+from pychord.immutable import Immutable
+from pychord.ratio import Cents, Ratio
 
 
-class Tone:
+class Tone(Immutable):
     """
     Describes an abstract musical frequency
     """
 
+    __slots__ = ("frequency",)
+
     frequency: Union[int, float]
     "The frequency of the tone in hertz"
 
     def __init__(self, frequency: Union[int, float]):
-        self.frequency = frequency
+        object.__setattr__(self, "frequency", frequency)
 
     def __repr__(self) -> str:
         return f"[Tone ({self.frequency:.4f})]"
@@ -20,13 +23,13 @@ class Tone:
     def __str__(self) -> str:
         return self.__repr__()
 
-    def __add__(self, other: Ratio) -> "Tone":
-        if not isinstance(other, Ratio):
+    def __add__(self, other: Union[Ratio, Cents]) -> "Tone":
+        if not isinstance(other, (Ratio, Cents)):
             return NotImplemented
         return self.transposed(other)
 
-    def __sub__(self, other: Union[Ratio, "Tone"]) -> Union[Ratio, "Tone"]:
-        if isinstance(other, Ratio):
+    def __sub__(self, other: Union[Ratio, Cents, "Tone"]) -> Union[Ratio, "Tone"]:
+        if isinstance(other, (Ratio, Cents)):
             return self.transposed(-other)
         elif isinstance(other, Tone):
             return Ratio(self.frequency / other.frequency)
@@ -39,6 +42,9 @@ class Tone:
     def __ne__(self, other: "Tone"):
         return not isinstance(other, Tone) or self.frequency != other.frequency
 
+    def __hash__(self) -> int:
+        return hash(self.frequency)
+
     def __ge__(self, other: "Tone") -> bool:
         if not isinstance(other, Tone):
             return NotImplemented
@@ -59,11 +65,13 @@ class Tone:
             return NotImplemented
         return self.frequency < other.frequency
 
-    def transposed(self, ratio: "Ratio") -> "Tone":
+    def transposed(self, ratio: Union[Ratio, Cents]) -> "Tone":
         """
-        Multiply the tone frequency by the input ratio
+        Multiply the tone frequency by the input ratio, `Cents` are converted to a linear ratio first
         """
 
+        if isinstance(ratio, Cents):
+            ratio = ratio.to_ratio()
         if not isinstance(ratio, Ratio):
             raise TypeError()
         return Tone(self.frequency * ratio.ratio)
@@ -0,0 +1,166 @@
+from array import array
+from math import ldexp, log2
+from typing import Iterable, Sequence, Union
+
+from pychord.const import *
+from pychord.note import Note
+from pychord.lazy import lazy_constants
+from pychord.ratio import Cents
+
+__all__ = ["Tuning", "EQUAL_TEMPERAMENT"]
+
+
+class Tuning:
+    """
+    A tuning system mapping `Note`s to frequencies, a temperament given as the cents of the 12 pitch classes
+    above a tonic plus the frequency of the reference note A4.
+    The frequencies of every semitone from `TUNING_LOWEST_SEMITONE` to `TUNING_HIGHEST_SEMITONE` are computed once
+    so that looking up a frequency is a single array index
+    """
+
+    name: str
+    "Name of the tuning system"
+
+    cents: tuple[float, ...]
+    "Cents of the 12 pitch classes above the tonic, starting with 0 for the tonic itself"
+
+    tonic: int
+    "Pitch class the temperament is built on, with C = 0"
+
+    reference: float
+    "Frequency of A4 in hertz"
+
+    table: array
+    "Frequency in hertz of each semitone from `TUNING_LOWEST_SEMITONE` to `TUNING_HIGHEST_SEMITONE`"
+
+    def __init__(
+        self,
+        cents: Sequence[Union[float, Cents]],
+        reference: float = TUNING_DEFAULT_REFERENCE,
+        tonic: Union[Note, int] = 0,
+        name: str = "custom",
+    ):
+        """
+        `cents` are the sizes of the 12 pitch classes above `tonic` as numbers or `Cents`, the first one is the tonic
+        """
+
+        cents = [value.cents if isinstance(value, Cents) else value for value in cents]
+
+        if len(cents) != SEMITONES_PER_OCTAVE:
+            raise ValueError(f"A tuning needs {SEMITONES_PER_OCTAVE} pitch classes, got {len(cents)}!")
+
+        if not reference > 0:
+            raise ValueError(f"Invalid reference frequency {reference}!")
+
+        if isinstance(tonic, Note):
+            tonic = tonic.semitone
+
+        self.name = name
+        self.cents = tuple(value - cents[0] for value in cents)
+        self.tonic = tonic % SEMITONES_PER_OCTAVE
+        self.reference = reference
+
+        # Frequencies of the pitch classes in the octave starting on the tonic in octave 0, scaled by powers of two
+        octaves, pitch_class = divmod(TUNING_REFERENCE_SEMITONE - self.tonic, SEMITONES_PER_OCTAVE)
+        tonic_frequency = ldexp(reference / 2 ** (self.cents[pitch_class] / CENTS_PER_OCTAVE), -octaves)
+        frequencies = [tonic_frequency * 2 ** (value / CENTS_PER_OCTAVE) for value in self.cents]
+
+        self.table = array(
+            "d",
+            (
+                ldexp(
+                    frequencies[(semitone - self.tonic) % SEMITONES_PER_OCTAVE],
+                    (semitone - self.tonic) // SEMITONES_PER_OCTAVE,
+                )
+                for semitone in range(TUNING_LOWEST_SEMITONE, TUNING_HIGHEST_SEMITONE + 1)
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"[Tuning {self.name} A4={self.reference:g}]"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @classmethod
+    def equal(cls, reference: float = TUNING_DEFAULT_REFERENCE) -> "Tuning":
+        """
+        Return 12TET, the tuning `Note` uses at the default reference of 440Hz
+        """
+
+        return cls([CENTS_PER_SEMITONE * i for i in range(SEMITONES_PER_OCTAVE)], reference, 0, "12TET")
+
+    @classmethod
+    def just(cls, tonic: Union[Note, int] = 0, reference: float = TUNING_DEFAULT_REFERENCE) -> "Tuning":
+        """
+        Return 5-limit just intonation built on `tonic`, see `TUNING_JUST_RATIOS`
+        """
+
+        return cls.from_ratios(TUNING_JUST_RATIOS, reference, tonic, "just")
+
+    @classmethod
+    def pythagorean(cls, tonic: Union[Note, int] = 0, reference: float = TUNING_DEFAULT_REFERENCE) -> "Tuning":
+        """
+        Return Pythagorean tuning built on `tonic`, see `TUNING_PYTHAGOREAN_RATIOS`
+        """
+
+        return cls.from_ratios(TUNING_PYTHAGOREAN_RATIOS, reference, tonic, "pythagorean")
+
+    @classmethod
+    def from_ratios(
+        cls,
+        ratios: Sequence[tuple[int, int]],
+        reference: float = TUNING_DEFAULT_REFERENCE,
+        tonic: Union[Note, int] = 0,
+        name: str = "custom",
+    ) -> "Tuning":
+        """
+        Build a `Tuning` from the frequency ratios of the 12 pitch classes above `tonic` as numerator, denominator pairs
+        """
+
+        return cls(
+            [CENTS_PER_OCTAVE * log2(numerator / denominator) for numerator, denominator in ratios],
+            reference,
+            tonic,
+            name,
+        )
+
+    def frequency(self, note: Union[Note, int]) -> float:
+        """
+        Return the frequency in hertz of a `Note` or semitone from C0 in this tuning
+        """
+
+        semitone = note.semitone if isinstance(note, Note) else note
+
+        if not TUNING_LOWEST_SEMITONE <= semitone <= TUNING_HIGHEST_SEMITONE:
+            raise IndexError(f"Semitone {semitone} is outside of the tuning table!")
+
+        return self.table[semitone - TUNING_LOWEST_SEMITONE]
+
+    def frequencies(self, notes: Iterable[Union[Note, int]]) -> array:
+        """
+        Return the frequencies in hertz of many `Note`s or semitones from C0 in this tuning as an array of doubles
+        """
+
+        table = self.table
+        frequencies = array("d")
+
+        try:
+            for note in notes:
+                index = (note.semitone if isinstance(note, Note) else note) - TUNING_LOWEST_SEMITONE
+                if index < 0:
+                    raise IndexError()
+                frequencies.append(table[index])
+        except IndexError:
+            raise IndexError(f"Note {note} is outside of the tuning table!") from None
+
+        return frequencies
+
+
+__getattr__, __dir__ = lazy_constants(
+    globals(),
+    {
+        # 12TET tuning at A4 = 440Hz
+        "EQUAL_TEMPERAMENT": Tuning.equal,
+    },
+)
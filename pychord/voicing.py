@@ -0,0 +1,189 @@
+"""
+Minimal motion voice leading over chord progressions by dynamic programming, requires numpy
+"""
+
+from typing import Iterable, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from pychord.chord import Chord
+from pychord.const import *
+from pychord.note import Note
+from pychord.pitchclass import pitch_class_mask
+
+VOICING_DEFAULT_RANGE: tuple[int, int] = (36, 72)
+"Default lowest and highest semitones from C0 of every voice, C3 to C6"
+
+VOICING_DEFAULT_MAX_GAP: int = SEMITONES_PER_OCTAVE
+"Default largest interval in semitones between adjacent upper voices, the bass may lie further below"
+
+
+class VoiceLeading(NamedTuple):
+    """
+    Result of `voice_lead`, one voicing per chord and the total motion of the path
+    """
+
+    voicings: list[tuple[Note, ...]]
+    "`Note`s of each voicing from the lowest voice up"
+
+    motion: int
+    "Sum over every voice and chord change of the distance moved in semitones"
+
+
+def voicings(
+    notes: Union[Chord, Iterable[Union[Note, int]]],
+    voices: Optional[int] = None,
+    ranges: Union[tuple, Sequence[tuple]] = VOICING_DEFAULT_RANGE,
+    max_gap: Optional[int] = VOICING_DEFAULT_MAX_GAP,
+    keep_bass: bool = True,
+) -> np.ndarray:
+    """
+    Return every voicing of the pitch classes of a `Chord` or of some `Note`s or semitones as rows of ascending
+    semitones from C0, each pitch class sounding at least once. `voices` defaults to the number of pitch classes,
+    `ranges` is one (lowest, highest) pair of `Note`s or semitones for all voices or one pair per voice from the
+    lowest up, `max_gap` bounds the interval between adjacent voices above the bass.
+    With `keep_bass` the lowest voice of a `Chord` is its bass
+    """
+
+    mask, bass = _pitch_set(notes, keep_bass)
+    pitch_classes = bin(mask).count("1")
+    voices = pitch_classes if voices is None else voices
+
+    if voices < pitch_classes:
+        raise ValueError(f"Invalid number of voices {voices} for {pitch_classes} pitch classes!")
+
+    bounds = _voice_ranges(ranges, voices)
+
+    rows = []
+    voicing = []
+
+    def extend(voice: int, missing: int):
+        # Pitch classes still missing must fit in the voices left
+        if bin(missing).count("1") > voices - voice:
+            return
+
+        if voice == voices:
+            rows.append(tuple(voicing))
+            return
+
+        low, high = bounds[voice]
+
+        if voicing:
+            low = max(low, voicing[-1] + 1)
+            if max_gap is not None and voice > 1:
+                high = min(high, voicing[-1] + max_gap)
+
+        for semitone in range(low, high + 1):
+            pitch_class = semitone % SEMITONES_PER_OCTAVE
+
+            if not mask >> pitch_class & 1 or (voice == 0 and bass is not None and pitch_class != bass):
+                continue
+
+            voicing.append(semitone)
+            extend(voice + 1, missing & ~(1 << pitch_class))
+            voicing.pop()
+
+    extend(0, mask)
+
+    return np.array(rows, dtype=np.int32).reshape(-1, voices)
+
+
+def voicing_distances(current: np.ndarray, following: np.ndarray) -> np.ndarray:
+    """
+    Return the matrix of the total motion in semitones from each voicing of `current` to each voicing of `following`,
+    voice by voice from the lowest up, both arrays having one voicing per row
+    """
+
+    return np.abs(current[:, np.newaxis, :] - following[np.newaxis, :, :]).sum(axis=2)
+
+
+def voice_lead(
+    chords: Iterable[Union[Chord, Iterable[Union[Note, int]]]],
+    voices: Optional[int] = None,
+    ranges: Union[tuple, Sequence[tuple]] = VOICING_DEFAULT_RANGE,
+    max_gap: Optional[int] = VOICING_DEFAULT_MAX_GAP,
+    keep_bass: bool = True,
+) -> VoiceLeading:
+    """
+    Voice a progression of `Chord`s or pitch sets of `Note`s or semitones with the least total motion, see `voicings`
+    for the constraints, `voices` defaults to the largest number of pitch classes of a chord.
+    The candidate voicings of each distinct chord and the distance matrices between them are computed once, then the
+    best path is found chord by chord, so the time grows linearly with the length of the progression
+    """
+
+    chords = [chord if isinstance(chord, Chord) else list(chord) for chord in chords]
+
+    if not chords:
+        return VoiceLeading([], 0)
+
+    keys = [_pitch_set(chord, keep_bass) for chord in chords]
+
+    if voices is None:
+        voices = max(bin(mask).count("1") for mask, _ in keys)
+
+    candidates = {}
+    distances = {}
+
+    for chord, key in zip(chords, keys):
+        if key not in candidates:
+            candidates[key] = voicings(chord, voices, ranges, max_gap, keep_bass)
+
+            if not len(candidates[key]):
+                raise ValueError(f"No voicing of {chord} in range!")
+
+    # Viterbi: the least motion reaching each candidate of the current chord and the best predecessor of each
+    costs = np.zeros(len(candidates[keys[0]]), dtype=np.int64)
+    backtrack = []
+
+    for previous, key in zip(keys, keys[1:]):
+        if (previous, key) not in distances:
+            distances[previous, key] = voicing_distances(candidates[previous], candidates[key])
+
+        totals = costs[:, np.newaxis] + distances[previous, key]
+        best = totals.argmin(axis=0)
+        backtrack.append(best)
+        costs = totals[best, np.arange(len(best))]
+
+    index = int(costs.argmin())
+    motion = int(costs[index])
+    path = [index]
+
+    for best in reversed(backtrack):
+        index = int(best[index])
+        path.append(index)
+
+    path.reverse()
+
+    return VoiceLeading(
+        [
+            tuple(_spell(int(semitone), chord) for semitone in candidates[key][index])
+            for chord, key, index in zip(chords, keys, path)
+        ],
+        motion,
+    )
+
+
+def _pitch_set(notes, keep_bass: bool) -> tuple[int, Optional[int]]:
+    if isinstance(notes, Chord):
+        return notes.mask, notes.bass.semitone % SEMITONES_PER_OCTAVE if keep_bass else None
+
+    return pitch_class_mask(note.semitone if isinstance(note, Note) else note for note in notes), None
+
+
+def _voice_ranges(ranges, voices: int) -> list[tuple[int, int]]:
+    if len(ranges) == 2 and not isinstance(ranges[0], (tuple, list)):
+        ranges = [ranges] * voices
+
+    if len(ranges) != voices:
+        raise ValueError(f"Invalid number of ranges {len(ranges)} for {voices} voices!")
+
+    return [tuple(note.semitone if isinstance(note, Note) else note for note in pair) for pair in ranges]
+
+
+def _spell(semitone: int, chord) -> Note:
+    # Keep the spelling of the chord tone with the same pitch class
+    for note in chord.notes if isinstance(chord, Chord) else chord:
+        if isinstance(note, Note) and (note.semitone - semitone) % SEMITONES_PER_OCTAVE == 0:
+            return note.in_octave(note.octave + (semitone - note.semitone) // SEMITONES_PER_OCTAVE)
+
+    return Note(semitone)